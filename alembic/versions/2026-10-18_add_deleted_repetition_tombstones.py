@@ -0,0 +1,44 @@
+"""add tombstones of deleted repetitions
+
+Revision ID: 9a4c2e7d1b35
+Revises: 5d1f8b3e7c20
+Create Date: 2026-10-18 23:59:31.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastucture.db.triggers import (
+    RECORD_DELETED_REPETITION_FUNCTION,
+    RECORD_DELETED_REPETITION_TRIGGER,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c2e7d1b35'
+down_revision: Union[str, None] = '5d1f8b3e7c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'deleted_repetitions',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        op.f('ix_deleted_repetitions_user_id'), 'deleted_repetitions', ['user_id'], unique=False
+    )
+    op.execute(RECORD_DELETED_REPETITION_FUNCTION)
+    op.execute(RECORD_DELETED_REPETITION_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS record_deleted_repetition ON repetitions')
+    op.execute('DROP FUNCTION IF EXISTS record_deleted_repetition()')
+    op.drop_index(op.f('ix_deleted_repetitions_user_id'), table_name='deleted_repetitions')
+    op.drop_table('deleted_repetitions')
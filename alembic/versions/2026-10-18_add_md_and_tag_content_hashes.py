@@ -0,0 +1,29 @@
+"""add md and tag content hashes
+
+Revision ID: 8d3c51f6a27e
+Revises: 2b7f4e1c9a63
+Create Date: 2026-10-18 22:58:14.671203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3c51f6a27e'
+down_revision: Union[str, None] = '2b7f4e1c9a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows keep NULL, their tags are replaced on the first re-ingest.
+    op.add_column('mds', sa.Column('content_hash', sa.String(length=32), nullable=True))
+    op.add_column('tags', sa.Column('content_hash', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('tags', 'content_hash')
+    op.drop_column('mds', 'content_hash')
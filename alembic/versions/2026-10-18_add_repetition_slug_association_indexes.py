@@ -0,0 +1,47 @@
+"""add repetition slug association indexes
+
+Revision ID: d18a5f7c3e62
+Revises: 7c2e94b1f0d3
+Create Date: 2026-10-18 19:22:08.513774
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd18a5f7c3e62'
+down_revision: Union[str, None] = '7c2e94b1f0d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    'ix_repetition_slug_association_slug_id_repetition_id': ['slug_id', 'repetition_id'],
+    'ix_repetition_slug_association_repetition_id_slug_id': ['repetition_id', 'slug_id'],
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(
+                name,
+                'repetition_slug_association',
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name,
+                table_name='repetition_slug_association',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
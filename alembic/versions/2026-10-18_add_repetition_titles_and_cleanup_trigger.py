@@ -0,0 +1,60 @@
+"""add repetition titles and the repetition cleanup trigger
+
+Revision ID: c7e2a9f41d58
+Revises: 8d3c51f6a27e
+Create Date: 2026-10-18 23:41:09.527316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastucture.db.triggers import (
+    DELETE_REPETITION_DEPENDENTS_FUNCTION,
+    DELETE_REPETITION_DEPENDENTS_TRIGGER,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a9f41d58'
+down_revision: Union[str, None] = '8d3c51f6a27e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TAG_SUBTYPE_TABLES = ('text', 'quote', 'heading', 'list', 'code')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'repetition_titles',
+        sa.Column('title', sa.String(), primary_key=True),
+    )
+    op.execute(
+        'INSERT INTO repetition_titles (title) '
+        'SELECT DISTINCT title FROM repetitions'
+    )
+
+    # Rows left behind by repetitions deleted since the foreign keys were dropped.
+    orphaned = 'NOT EXISTS (SELECT 1 FROM repetitions WHERE repetitions.id = {})'
+    op.execute(
+        'DELETE FROM repetition_slug_association WHERE '
+        + orphaned.format('repetition_slug_association.repetition_id')
+    )
+    op.execute('DELETE FROM word_repetitions WHERE ' + orphaned.format('word_repetitions.id'))
+    for table in TAG_SUBTYPE_TABLES:
+        op.execute(
+            f'DELETE FROM "{table}" WHERE id IN '
+            f'(SELECT id FROM tags WHERE {orphaned.format("tags.md_id")})'
+        )
+    op.execute('DELETE FROM tags WHERE ' + orphaned.format('tags.md_id'))
+    op.execute('DELETE FROM mds WHERE ' + orphaned.format('mds.id'))
+
+    op.execute(DELETE_REPETITION_DEPENDENTS_FUNCTION)
+    op.execute(DELETE_REPETITION_DEPENDENTS_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS delete_repetition_dependents ON repetitions')
+    op.execute('DROP FUNCTION IF EXISTS delete_repetition_dependents()')
+    op.drop_table('repetition_titles')
@@ -0,0 +1,44 @@
+"""add tag position gist index
+
+Revision ID: 2b7f4e1c9a63
+Revises: e5a9c2d74b18
+Create Date: 2026-10-18 21:36:52.047311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7f4e1c9a63'
+down_revision: Union[str, None] = 'e5a9c2d74b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # `btree_gist` lets the GiST index hold the plain `md_id` next to the range.
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tags_md_id_position',
+            'tags',
+            ['md_id', sa.text('int4range(start_pos, end_pos)')],
+            unique=False,
+            postgresql_using='gist',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tags_md_id_position',
+            table_name='tags',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
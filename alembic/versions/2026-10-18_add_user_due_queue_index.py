@@ -0,0 +1,41 @@
+"""add user due queue index on repetitions
+
+Revision ID: 5b0e7d2a91c4
+Revises: c4df710a8097
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b0e7d2a91c4'
+down_revision: Union[str, None] = 'c4df710a8097'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so the due queue stays writable while the index is created.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_repetitions_user_id_date_repetition_id',
+            'repetitions',
+            ['user_id', 'date_repetition', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_repetitions_user_id_date_repetition_id',
+            table_name='repetitions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,45 @@
+"""add gin indexes on word repetition arrays
+
+Revision ID: 7c2e94b1f0d3
+Revises: 3f6b2d8e1a90
+Create Date: 2026-10-18 18:05:51.227390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e94b1f0d3'
+down_revision: Union[str, None] = '3f6b2d8e1a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ARRAY_COLUMNS = ('translate', 'synonyms', 'possible_options')
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in ARRAY_COLUMNS:
+            op.create_index(
+                f'ix_word_repetitions_{column}',
+                'word_repetitions',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in ARRAY_COLUMNS:
+            op.drop_index(
+                f'ix_word_repetitions_{column}',
+                table_name='word_repetitions',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
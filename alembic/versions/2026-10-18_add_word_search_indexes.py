@@ -0,0 +1,133 @@
+"""add word search functions and indexes
+
+Revision ID: 3f6b2d8e1a90
+Revises: 9a41c7e3d2f5
+Create Date: 2026-10-18 16:40:12.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6b2d8e1a90'
+down_revision: Union[str, None] = '9a41c7e3d2f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_FIELDS = 'word, translate, synonyms, examples, context'
+
+# `array_to_string`, `concat_ws` and the `regconfig` cast are only stable, so indexing
+# them needs these wrappers declared immutable. That holds as long as the text search
+# configurations are not redefined; if they are, the indexes must be rebuilt.
+FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION word_search_config(word_language languageenum)
+    RETURNS regconfig LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT CASE word_language::text
+            WHEN 'EN-US' THEN 'english'
+            WHEN 'EN_GB' THEN 'english'
+            WHEN 'ES' THEN 'spanish'
+            WHEN 'FR' THEN 'french'
+            WHEN 'DE' THEN 'german'
+            ELSE 'simple'
+        END::regconfig
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION word_search_document(
+        word_language languageenum,
+        word varchar,
+        translate varchar[],
+        synonyms varchar[],
+        examples varchar[],
+        context varchar
+    )
+    RETURNS tsvector LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT setweight(to_tsvector(word_search_config(word_language), coalesce(word, '')), 'A')
+            || setweight(
+                to_tsvector(
+                    word_search_config(word_language),
+                    concat_ws(' ', array_to_string(translate, ' '), array_to_string(synonyms, ' '))
+                ),
+                'B'
+            )
+            || setweight(
+                to_tsvector(
+                    word_search_config(word_language),
+                    concat_ws(' ', array_to_string(examples, ' '), context)
+                ),
+                'C'
+            )
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION word_search_text(
+        word varchar,
+        translate varchar[],
+        synonyms varchar[],
+        examples varchar[],
+        context varchar
+    )
+    RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT concat_ws(
+            ' ',
+            word,
+            array_to_string(translate, ' '),
+            array_to_string(synonyms, ' '),
+            array_to_string(examples, ' '),
+            context
+        )
+    $$
+    """,
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for function in FUNCTIONS:
+        op.execute(function)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_word_repetitions_search_document',
+            'word_repetitions',
+            [sa.text(f'word_search_document(language, {SEARCH_FIELDS})')],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_word_repetitions_search_trigram',
+            'word_repetitions',
+            [sa.text(f'word_search_text({SEARCH_FIELDS}) gin_trgm_ops')],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_word_repetitions_search_trigram',
+            table_name='word_repetitions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_word_repetitions_search_document',
+            table_name='word_repetitions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute('DROP FUNCTION IF EXISTS word_search_text(varchar, varchar[], varchar[], varchar[], varchar)')
+    op.execute(
+        'DROP FUNCTION IF EXISTS word_search_document'
+        '(languageenum, varchar, varchar[], varchar[], varchar[], varchar)'
+    )
+    op.execute('DROP FUNCTION IF EXISTS word_search_config(languageenum)')
@@ -0,0 +1,80 @@
+"""create md and tag tables
+
+Revision ID: e5a9c2d74b18
+Revises: d18a5f7c3e62
+Create Date: 2026-10-18 20:47:35.190562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c2d74b18'
+down_revision: Union[str, None] = 'd18a5f7c3e62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def tag_subtype_id():
+    return sa.Column('id', sa.String(length=36), sa.ForeignKey('tags.id'), primary_key=True)
+
+
+def upgrade() -> None:
+    # A new enum value can't be used in the transaction which added it.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE repetitioncontenttypeenum ADD VALUE IF NOT EXISTS 'MD'")
+
+    # `repetitions` is partitioned and `id` alone is not unique there, so `mds` joins
+    # it without a foreign key, like `word_repetitions`.
+    op.create_table(
+        'mds',
+        sa.Column('id', sa.String(length=36), primary_key=True),
+    )
+    op.create_table(
+        'tags',
+        sa.Column('id', sa.String(length=36), primary_key=True),
+        sa.Column('start_pos', sa.Integer(), nullable=False),
+        sa.Column('end_pos', sa.Integer(), nullable=False),
+        sa.Column('md_id', sa.String(length=36), sa.ForeignKey('mds.id'), nullable=True),
+        sa.Column('space_count', sa.Integer(), nullable=True),
+        sa.Column('content', sa.String(), nullable=False),
+        sa.Column('type', sa.String(), nullable=True),
+    )
+    op.create_index('ix_tags_md_id_start_pos', 'tags', ['md_id', 'start_pos'], unique=False)
+    op.create_table(
+        'text',
+        tag_subtype_id(),
+        sa.Column('style', sa.String(length=20), nullable=False),
+    )
+    op.create_table(
+        'quote',
+        tag_subtype_id(),
+        sa.Column('sup_quote', sa.Boolean(), nullable=True),
+    )
+    op.create_table(
+        'heading',
+        tag_subtype_id(),
+        sa.Column('level', sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        'list',
+        tag_subtype_id(),
+        sa.Column('ordered', sa.Boolean(), nullable=True),
+    )
+    op.create_table(
+        'code',
+        tag_subtype_id(),
+        sa.Column('is_multiply', sa.Boolean(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    for table in ('code', 'list', 'heading', 'quote', 'text'):
+        op.drop_table(table)
+    op.drop_index('ix_tags_md_id_start_pos', table_name='tags')
+    op.drop_table('tags')
+    op.drop_table('mds')
+    # Postgres can't drop a value from an enum, 'MD' stays in `repetitioncontenttypeenum`.
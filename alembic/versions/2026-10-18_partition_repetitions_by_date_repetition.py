@@ -0,0 +1,111 @@
+"""partition repetitions by date_repetition
+
+Revision ID: 9a41c7e3d2f5
+Revises: 5b0e7d2a91c4
+Create Date: 2026-10-18 14:03:27.815530
+
+"""
+from typing import Sequence, Union
+
+import pendulum
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a41c7e3d2f5'
+down_revision: Union[str, None] = '5b0e7d2a91c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 12
+
+
+def month_partitions(first_date_repetition: Union[int, None]):
+    """
+    Yields `(name, from, to)` of the monthly partitions from the month of
+    `first_date_repetition` through `MONTHS_AHEAD` months from now, in UTC.
+    """
+    now = pendulum.now('UTC')
+    first = pendulum.from_timestamp(first_date_repetition) if first_date_repetition else now
+    month = pendulum.datetime(min(first, now).year, min(first, now).month, 1, tz='UTC')
+    last = pendulum.datetime(now.year, now.month, 1, tz='UTC').add(months=MONTHS_AHEAD)
+    while month <= last:
+        next_month = month.add(months=1)
+        yield (
+            f'repetitions_{month.year}_{month.month:02d}',
+            int(month.timestamp()),
+            int(next_month.timestamp()),
+        )
+        month = next_month
+
+
+def upgrade() -> None:
+    # `id` alone is no longer unique on a partitioned table, so nothing can reference it.
+    op.drop_constraint('fk_word_repetitions_repetition_id', 'word_repetitions', type_='foreignkey')
+    op.drop_constraint(
+        'repetition_slug_association_repetition_id_fkey',
+        'repetition_slug_association',
+        type_='foreignkey',
+    )
+
+    op.rename_table('repetitions', 'repetitions_unpartitioned')
+    op.execute('ALTER INDEX repetitions_pkey RENAME TO repetitions_unpartitioned_pkey')
+    op.execute(
+        'ALTER INDEX ix_repetitions_user_id_date_repetition_id '
+        'RENAME TO ix_repetitions_unpartitioned_user_id_date_repetition_id'
+    )
+    op.execute(
+        'CREATE TABLE repetitions (LIKE repetitions_unpartitioned INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (date_repetition)'
+    )
+    op.create_primary_key('repetitions_pkey', 'repetitions', ['id', 'date_repetition'])
+
+    first_date_repetition = op.get_bind().execute(
+        sa.text('SELECT min(date_repetition) FROM repetitions_unpartitioned')
+    ).scalar()
+    for name, date_from, date_to in month_partitions(first_date_repetition):
+        op.execute(
+            f'CREATE TABLE {name} PARTITION OF repetitions '
+            f'FOR VALUES FROM ({date_from}) TO ({date_to})'
+        )
+    op.execute('CREATE TABLE repetitions_default PARTITION OF repetitions DEFAULT')
+
+    op.execute('INSERT INTO repetitions SELECT * FROM repetitions_unpartitioned')
+    op.drop_table('repetitions_unpartitioned')
+
+    op.create_index(
+        'ix_repetitions_user_id_date_repetition_id',
+        'repetitions',
+        ['user_id', 'date_repetition', 'id'],
+        unique=False,
+    )
+    op.create_index('ix_repetitions_title', 'repetitions', ['title'], unique=False)
+
+
+def downgrade() -> None:
+    op.rename_table('repetitions', 'repetitions_partitioned')
+    op.drop_index('ix_repetitions_title', table_name='repetitions_partitioned')
+    op.drop_index('ix_repetitions_user_id_date_repetition_id', table_name='repetitions_partitioned')
+    op.drop_constraint('repetitions_pkey', 'repetitions_partitioned', type_='primary')
+
+    op.execute('CREATE TABLE repetitions (LIKE repetitions_partitioned INCLUDING DEFAULTS)')
+    op.execute('INSERT INTO repetitions SELECT * FROM repetitions_partitioned')
+    op.drop_table('repetitions_partitioned')
+
+    op.create_primary_key('repetitions_pkey', 'repetitions', ['id'])
+    op.create_unique_constraint('repetitions_title_key', 'repetitions', ['title'])
+    op.create_index(
+        'ix_repetitions_user_id_date_repetition_id',
+        'repetitions',
+        ['user_id', 'date_repetition', 'id'],
+        unique=False,
+    )
+    op.create_foreign_key(
+        'repetition_slug_association_repetition_id_fkey',
+        'repetition_slug_association',
+        'repetitions',
+        ['repetition_id'],
+        ['id'],
+    )
+    op.create_foreign_key('fk_word_repetitions_repetition_id', 'word_repetitions', 'repetitions', ['id'], ['id'])
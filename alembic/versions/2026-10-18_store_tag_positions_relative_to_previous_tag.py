@@ -0,0 +1,66 @@
+"""store tag positions relative to the previous tag
+
+Revision ID: 5d1f8b3e7c20
+Revises: c7e2a9f41d58
+Create Date: 2026-10-18 23:58:14.310842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f8b3e7c20'
+down_revision: Union[str, None] = 'c7e2a9f41d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# `ORDINAL_STEP` of `app.domain.services.md_diff` when this migration was written.
+ORDINAL_STEP = 1 << 32
+
+
+def upgrade() -> None:
+    op.add_column('tags', sa.Column('ordinal', sa.BigInteger(), nullable=True))
+    op.add_column('tags', sa.Column('gap', sa.Integer(), nullable=True))
+    op.add_column('tags', sa.Column('length', sa.Integer(), nullable=True))
+    op.execute(
+        'UPDATE tags SET ordinal = positions.ordinal, gap = positions.gap, '
+        'length = tags.end_pos - tags.start_pos '
+        'FROM ('
+        f'SELECT id, (row_number() OVER document - 1) * {ORDINAL_STEP} AS ordinal, '
+        'start_pos - coalesce(lag(end_pos) OVER document, 0) AS gap '
+        'FROM tags WINDOW document AS (PARTITION BY md_id ORDER BY start_pos, id)'
+        ') AS positions '
+        'WHERE positions.id = tags.id'
+    )
+    for column in ('ordinal', 'gap', 'length'):
+        op.alter_column('tags', column, nullable=False)
+
+    op.create_index(
+        'ix_tags_md_id_ordinal',
+        'tags',
+        ['md_id', 'ordinal'],
+        unique=False,
+        postgresql_include=['gap', 'length'],
+    )
+    op.add_column('mds', sa.Column('positions_stale_from', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    # Brings stale ranges up to date, they are all there is to positions afterwards.
+    op.execute(
+        'UPDATE tags SET start_pos = positions.end_pos - tags.length, '
+        'end_pos = positions.end_pos '
+        'FROM ('
+        'SELECT id, sum(gap + length) OVER (PARTITION BY md_id ORDER BY ordinal) AS end_pos '
+        'FROM tags WHERE md_id IN (SELECT id FROM mds WHERE positions_stale_from IS NOT NULL)'
+        ') AS positions '
+        'WHERE positions.id = tags.id'
+    )
+    op.drop_column('mds', 'positions_stale_from')
+    op.drop_index('ix_tags_md_id_ordinal', table_name='tags')
+    op.drop_column('tags', 'length')
+    op.drop_column('tags', 'gap')
+    op.drop_column('tags', 'ordinal')
@@ -1,15 +1,82 @@
-from typing import Annotated
+from typing import Annotated, Any, AsyncGenerator, Awaitable, Callable, Optional
 
-from fastapi import Header, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Header, HTTPException, Request, Response
 
 from app.config import global_config
-from app.infrastucture.db.session import get_session
+from app.infrastucture.db.session import WritePosition
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork, get_unit_of_work
 
+# Carries the `WritePosition` of a write in its response and in the reads after it.
+READ_AFTER_HEADER = "X-Read-After"
 
-async def session() -> AsyncSession:
-    async with get_session() as connect:
-        return connect
+
+async def unit_of_work(request: Request) -> AsyncGenerator[SQLAlchemyUnitOfWork, None]:
+    """
+    Request-scoped unit of work. It is closed, and rolled back unless a command
+    committed it, before the response is sent. Commands route it to a user's shard.
+    """
+    async with get_unit_of_work() as uow:
+        request.state.unit_of_work = uow
+        yield uow
+
+
+async def read_after(
+    x_read_after: Annotated[Optional[str], Header()] = None,
+) -> Optional[WritePosition]:
+    """
+    The `X-Read-After` header a client copies from the response of its last write.
+    """
+    if x_read_after is None:
+        return None
+    try:
+        return WritePosition.parse(x_read_after)
+    except ValueError as e:
+        raise HTTPException(detail=str(e), status_code=400)
+
+
+ReadAfter = Annotated[Optional[WritePosition], Depends(read_after)]
+
+
+async def read_unit_of_work(
+    read_after: ReadAfter,
+) -> AsyncGenerator[SQLAlchemyUnitOfWork, None]:
+    """
+    Request-scoped read-only unit of work, served by a replica which replayed the write
+    of `X-Read-After`, by the primary while none has.
+    """
+    async with get_unit_of_work(read_only=True, read_after=read_after) as uow:
+        yield uow
+
+
+async def write_position_header(request: Request, call_next) -> Response:
+    """
+    Middleware returning the position of the write the request committed in the
+    `X-Read-After` header, whichever way the route built its response.
+    """
+    response = await call_next(request)
+    uow = getattr(request.state, "unit_of_work", None)
+    if uow is not None and uow.written is not None:
+        response.headers[READ_AFTER_HEADER] = str(uow.written)
+    return response
+
+
+def in_unit_of_work(
+    command: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """
+    `command` run in a unit of work of its own, for background tasks, which run once the
+    request-scoped unit of work is closed.
+    """
+
+    async def run(**kwargs):
+        async with get_unit_of_work() as uow:
+            return await command(uow, **kwargs)
+
+    return run
+
+
+UnitOfWork = Annotated[SQLAlchemyUnitOfWork, Depends(unit_of_work)]
+ReadUnitOfWork = Annotated[SQLAlchemyUnitOfWork, Depends(read_unit_of_work)]
 
 
 async def auth_marker(auth_marker: Annotated[str, Header()]):
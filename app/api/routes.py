@@ -1,19 +1,64 @@
-from typing import Optional
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, BackgroundTasks, File, Form, Query, UploadFile
+from fastapi.responses import Response, StreamingResponse
 
-from app.application.commands import create_word_repetition
-from app.application.queries.get_all_repetition import get_all_repetition
+from app.application.commands import (
+    create_md_repetition,
+    create_word_repetition,
+    import_word_repetitions,
+    refresh_md_tag_positions,
+    review_repetition,
+    submit_reviews,
+    update_md_repetition,
+)
+from app.application.parsers import ImportFileFormatEnum
+from app.application.queries.forecast_workload import forecast_workload
+from app.application.queries.get_all_repetition import (
+    check_requested_fields,
+    get_all_repetition,
+)
+from app.application.queries.md_tags import get_md_tags
+from app.application.queries.search_repetition import search_repetition
+from app.application.queries.slug_facets import get_slug_facets
+from app.application.queries.stream_repetition import stream_repetition
+from app.application.queries.word_array_lookup import (
+    find_word_repetitions_by_array,
+    get_related_word_repetitions,
+)
+from app.application.serializers import repetition_serializer
+from app.domain.models import (
+    ArrayMatchEnum,
+    LanguageEnum,
+    SlugLoadStrategyEnum,
+    WordArrayFieldEnum,
+)
+from app.domain.schedulers import (
+    FSRSScheduler,
+    LinearScheduler,
+    SchedulerAlgorithmEnum,
+    SM2Scheduler,
+)
 from app.schemas.repeptition import (
-    CreateFileRepetitionRequest,
     CreateWordRepetitionRequest,
+    SubmitReviewRequest,
+    SubmitReviewsRequest,
+)
+from app.schemas.response import (
+    ForecastDaySchemaResponse,
+    ImportReportSchemaResponse,
+    MDSchemaResponse,
+    MDTagDiffSchemaResponse,
+    RelatedRepetitionSchemaResponse,
+    RepetitionSchemaResponse,
+    ReviewResultSchemaResponse,
+    SlugFacetSchemaResponse,
+    TagSchemaResponse,
 )
-from app.schemas.response import RepetitionSchemaResponse
 from app.application.http.exception import HTTPExceptionResponse
 
 from .date_type import OptionalQueryDateType, RequiredQueryDateType
-from .dependencies import auth_marker, session
+from .dependencies import ReadAfter, ReadUnitOfWork, UnitOfWork, in_unit_of_work
 
 with_auth_repetition_route = APIRouter(
     prefix="/repetition",
@@ -26,22 +71,276 @@ repetition_route = APIRouter(prefix="/repetition", tags=["Repetition"])
 
 @repetition_route.get("/", response_model=RepetitionSchemaResponse)
 async def get_repetition(
+    uow: ReadUnitOfWork,
+    user_id: str,
     start_date: OptionalQueryDateType,
     end_date: RequiredQueryDateType,
     limit: Optional[int] = 50,
     offset: Optional[int] = 0,
+    cursor: Optional[str] = None,
+    fields: Annotated[Optional[list[str]], Query()] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    slugs: Annotated[Optional[list[str]], Query(max_length=50)] = None,
 ):
     try:
-        repetitions = await get_all_repetition(
+        repetitions, next_cursor = await get_all_repetition(
+            uow=uow,
+            user_id=user_id,
             start_date=start_date,
             end_date=end_date,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            fields=fields,
+            slug_strategy=slug_strategy,
+            slugs=slugs,
         )
-        return RepetitionSchemaResponse(
+        return Response(
+            content=repetition_serializer.dumps_page(
+                repetitions,
+                status=200,
+                details="Successfull",
+                next_cursor=next_cursor,
+                fields=fields,
+            ),
+            media_type="application/json",
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@repetition_route.get("/stream", response_class=StreamingResponse)
+async def stream_repetitions(
+    read_after: ReadAfter,
+    user_id: str,
+    start_date: OptionalQueryDateType,
+    end_date: RequiredQueryDateType,
+    fields: Annotated[Optional[list[str]], Query()] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    slugs: Annotated[Optional[list[str]], Query(max_length=50)] = None,
+):
+    try:
+        check_requested_fields(fields)
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+    return StreamingResponse(
+        stream_repetition(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            fields=fields,
+            slug_strategy=slug_strategy,
+            slugs=slugs,
+            read_after=read_after,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+@repetition_route.get("/slugs/facets", response_model=SlugFacetSchemaResponse)
+async def get_due_slug_facets(
+    uow: ReadUnitOfWork,
+    user_id: str,
+    start_date: OptionalQueryDateType,
+    end_date: RequiredQueryDateType,
+):
+    try:
+        facets = await get_slug_facets(
+            uow=uow,
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        return SlugFacetSchemaResponse(
+            status=200,
+            details="Successfull",
+            model=[facet.to_json for facet in facets],
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@repetition_route.get("/md/tags", response_model=TagSchemaResponse)
+async def get_md_repetition_tags(
+    uow: ReadUnitOfWork,
+    user_id: str,
+    md_id: str,
+    start_pos: Annotated[Optional[int], Query(ge=0)] = None,
+    end_pos: Annotated[Optional[int], Query(ge=1)] = None,
+):
+    try:
+        tags = await get_md_tags(
+            uow=uow,
+            user_id=user_id,
+            md_id=md_id,
+            start_pos=start_pos,
+            end_pos=end_pos,
+        )
+
+        return TagSchemaResponse(
+            status=200,
+            details="Successfull",
+            model=tags,
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@repetition_route.get("/search", response_model=RepetitionSchemaResponse)
+async def search_repetitions(
+    uow: ReadUnitOfWork,
+    user_id: str,
+    query: Annotated[str, Query(min_length=1, max_length=256)],
+    language: Optional[LanguageEnum] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    fields: Annotated[Optional[list[str]], Query()] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+):
+    try:
+        repetitions = await search_repetition(
+            uow=uow,
+            user_id=user_id,
+            query=query,
+            limit=limit,
+            offset=offset,
+            language=language,
+            fields=fields,
+            slug_strategy=slug_strategy,
+        )
+        return Response(
+            content=repetition_serializer.dumps_page(
+                repetitions,
+                status=200,
+                details="Successfull",
+                fields=fields,
+            ),
+            media_type="application/json",
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@repetition_route.get("/words/by_array", response_model=RepetitionSchemaResponse)
+async def find_words_by_array(
+    uow: ReadUnitOfWork,
+    user_id: str,
+    field: WordArrayFieldEnum,
+    values: Annotated[list[str], Query(min_length=1, max_length=100)],
+    match: ArrayMatchEnum = ArrayMatchEnum.OVERLAP,
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    fields: Annotated[Optional[list[str]], Query()] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+):
+    try:
+        repetitions = await find_word_repetitions_by_array(
+            uow=uow,
+            user_id=user_id,
+            field=field,
+            values=values,
+            match=match,
+            limit=limit,
+            offset=offset,
+            fields=fields,
+            slug_strategy=slug_strategy,
+        )
+        return Response(
+            content=repetition_serializer.dumps_page(
+                repetitions,
+                status=200,
+                details="Successfull",
+                fields=fields,
+            ),
+            media_type="application/json",
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@repetition_route.get("/words/related", response_model=RelatedRepetitionSchemaResponse)
+async def get_related_words(
+    uow: ReadUnitOfWork,
+    user_id: str,
+    repetition_ids: Annotated[list[str], Query(min_length=1, max_length=200)],
+    field: WordArrayFieldEnum = WordArrayFieldEnum.SYNONYMS,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+    fields: Annotated[Optional[list[str]], Query()] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+):
+    try:
+        groups = await get_related_word_repetitions(
+            uow=uow,
+            user_id=user_id,
+            repetition_ids=repetition_ids,
+            field=field,
+            limit=limit,
+            fields=fields,
+            slug_strategy=slug_strategy,
+        )
+        return Response(
+            content=repetition_serializer.dumps_groups(
+                groups,
+                status=200,
+                details="Successfull",
+                fields=fields,
+            ),
+            media_type="application/json",
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@repetition_route.get("/forecast", response_model=ForecastDaySchemaResponse)
+async def get_workload_forecast(
+    uow: ReadUnitOfWork,
+    start_date: OptionalQueryDateType,
+    user_id: Optional[str] = None,
+    days: Annotated[int, Query(ge=1, le=3650)] = 30,
+    success_probability: Annotated[float, Query(ge=0, le=1)] = 0.9,
+    algorithm: Optional[SchedulerAlgorithmEnum] = None,
+    rate: Annotated[
+        Optional[float], Query(**LinearScheduler.parameter_bounds["rate"])
+    ] = None,
+    post_rate: Annotated[
+        Optional[float], Query(**LinearScheduler.parameter_bounds["post_rate"])
+    ] = None,
+    ease_factor: Annotated[
+        Optional[float], Query(**SM2Scheduler.parameter_bounds["ease_factor"])
+    ] = None,
+    desired_retention: Annotated[
+        Optional[float], Query(**FSRSScheduler.parameter_bounds["desired_retention"])
+    ] = None,
+    seed: Optional[int] = None,
+):
+    try:
+        scheduler_parameters = {
+            key: value
+            for key, value in {
+                "rate": rate,
+                "post_rate": post_rate,
+                "ease_factor": ease_factor,
+                "desired_retention": desired_retention,
+            }.items()
+            if value is not None
+        }
+        forecast = await forecast_workload(
+            uow=uow,
+            start_date=start_date,
+            days=days,
+            user_id=user_id,
+            success_probability=success_probability,
+            algorithm=algorithm,
+            scheduler_parameters=scheduler_parameters,
+            seed=seed,
+        )
+
+        return ForecastDaySchemaResponse(
             status=200,
             details="Successfull",
-            model=repetitions,
+            model=[day.to_json for day in forecast],
         )
     except Exception as e:
         return HTTPExceptionResponse(e).response
@@ -52,10 +351,13 @@ async def get_repetition(
     response_model=RepetitionSchemaResponse,
 )
 async def create_word(
+    uow: UnitOfWork,
     request: CreateWordRepetitionRequest,
 ):
     try:
-        created_repetition = await create_word_repetition(**request.model_dump())
+        created_repetition = await create_word_repetition(
+            uow=uow, **request.model_dump()
+        )
 
         return RepetitionSchemaResponse(
             status=200,
@@ -66,8 +368,129 @@ async def create_word(
         return HTTPExceptionResponse(e).response
 
 
-@with_auth_repetition_route.post("/create_repetition/file")
+@with_auth_repetition_route.post("/import", response_model=ImportReportSchemaResponse)
+async def import_repetitions(
+    uow: UnitOfWork,
+    user_id: Annotated[str, Form()],
+    document: Annotated[UploadFile, File()],
+    file_format: Annotated[Optional[ImportFileFormatEnum], Form()] = None,
+):
+    try:
+        report = await import_word_repetitions(
+            uow=uow,
+            user_id=user_id,
+            document=document,
+            file_format=file_format
+            or ImportFileFormatEnum.from_filename(document.filename),
+        )
+
+        return ImportReportSchemaResponse(
+            status=200,
+            details="Successfull",
+            model=report.to_json,
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@with_auth_repetition_route.post("/review", response_model=ReviewResultSchemaResponse)
+async def submit_repetition_review(
+    uow: UnitOfWork,
+    request: SubmitReviewRequest,
+):
+    try:
+        result = await review_repetition(
+            uow=uow,
+            user_id=request.user_id,
+            review=request.to_review(),
+        )
+
+        return ReviewResultSchemaResponse(
+            status=200,
+            details="Successfull",
+            model=result.to_json,
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@with_auth_repetition_route.post("/reviews", response_model=ReviewResultSchemaResponse)
+async def submit_repetition_reviews(
+    uow: UnitOfWork,
+    request: SubmitReviewsRequest,
+):
+    try:
+        results = await submit_reviews(
+            uow=uow,
+            user_id=request.user_id,
+            reviews=[review.to_review() for review in request.reviews],
+        )
+
+        return ReviewResultSchemaResponse(
+            status=200,
+            details="Successfull",
+            model=[result.to_json for result in results],
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@with_auth_repetition_route.post(
+    "/create_repetition/file",
+    response_model=MDSchemaResponse,
+)
 async def create_file_repetition(
-    request: CreateFileRepetitionRequest,
+    uow: UnitOfWork,
+    user_id: Annotated[str, Form()],
+    title: Annotated[str, Form()],
+    slugs: Annotated[list[str], Form()],
+    document: Annotated[UploadFile, File()],
 ):
-    pass
+    try:
+        created_repetition = await create_md_repetition(
+            uow=uow,
+            user_id=user_id,
+            title=title,
+            slugs=slugs,
+            document=document,
+        )
+
+        return MDSchemaResponse(
+            status=200,
+            details="Successfull",
+            model=created_repetition.to_json,
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
+
+
+@with_auth_repetition_route.post(
+    "/update_repetition/file",
+    response_model=MDTagDiffSchemaResponse,
+)
+async def update_file_repetition(
+    uow: UnitOfWork,
+    background_tasks: BackgroundTasks,
+    user_id: Annotated[str, Form()],
+    md_id: Annotated[str, Form()],
+    document: Annotated[UploadFile, File()],
+):
+    try:
+        diff = await update_md_repetition(
+            uow=uow,
+            user_id=user_id,
+            md_id=md_id,
+            document=document,
+        )
+        if diff.stale_from is not None:
+            background_tasks.add_task(
+                in_unit_of_work(refresh_md_tag_positions), user_id=user_id, md_id=md_id
+            )
+
+        return MDTagDiffSchemaResponse(
+            status=200,
+            details="Successfull",
+            model=diff.to_json,
+        )
+    except Exception as e:
+        return HTTPExceptionResponse(e).response
@@ -1,3 +1,17 @@
+from .create_md_repetition import create_md_repetition
 from .create_word_repetition import create_word_repetition
+from .import_word_repetitions import import_word_repetitions
+from .refresh_md_tag_positions import refresh_md_tag_positions
+from .review_repetition import review_repetition
+from .submit_reviews import submit_reviews
+from .update_md_repetition import update_md_repetition
 
-__all__ = ["create_word_repetition"]
+__all__ = [
+    "create_md_repetition",
+    "create_word_repetition",
+    "import_word_repetitions",
+    "refresh_md_tag_positions",
+    "review_repetition",
+    "submit_reviews",
+    "update_md_repetition",
+]
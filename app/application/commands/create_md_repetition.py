@@ -0,0 +1,42 @@
+from fastapi import UploadFile
+
+from app.application.parsers import iter_markdown_blocks
+from app.domain.models import MD, MarkdownDigest, RepetitionContentTypeEnum
+from app.domain.services.md_diff import TagLayout
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+TAG_BATCH_SIZE = 2000
+
+
+async def create_md_repetition(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    title: str,
+    slugs: list[str],
+    document: UploadFile,
+) -> MD:
+    """
+    Creates the document and streams its blocks into the tags in batches of
+    `TAG_BATCH_SIZE`, all in one transaction, so a failed upload leaves nothing behind.
+    """
+    repetition: MD = await uow.route(user_id).repetitions.create_repetition(
+        title=title,
+        content_type=RepetitionContentTypeEnum.MD,
+        user_id=user_id,
+        slugs=slugs,
+    )
+
+    digest = MarkdownDigest()
+    layout = TagLayout()
+    async for blocks in iter_markdown_blocks(document, TAG_BATCH_SIZE):
+        await uow.mds.insert_md_tags(
+            md_id=repetition.id,
+            blocks=blocks,
+            positions=[layout.place(block) for block in blocks],
+        )
+        for block in blocks:
+            digest.update(block)
+
+    repetition.content_hash = digest.hexdigest()
+    await uow.commit()
+    return repetition
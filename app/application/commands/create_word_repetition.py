@@ -1,20 +1,14 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-
 from app.domain.models import (
     LanguageEnum,
     PartOfSpeachEnum,
     RepetitionContentTypeEnum,
-    Repetition,
-    SlugRepetition,
     WordRepetition,
 )
-from app.infrastucture.db.session import get_session
-from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
-
-from ..http.exception import HTTPExceptionResponse
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
 
 
 async def create_word_repetition(
+    uow: SQLAlchemyUnitOfWork,
     user_id: str,
     word: str,
     synonyms: list[str],
@@ -26,21 +20,20 @@ async def create_word_repetition(
     translate: list[str],
     slugs: list[str],
     title: str,
-):
-    async with get_session() as session:
-        dao = SQLAlchemyRepetitionRepository(session=session)
-        repetition: WordRepetition = await dao.create_repetition(
-            title=title,
-            content_type=RepetitionContentTypeEnum.WORD,
-            user_id=user_id,
-            word=word,
-            synonyms=synonyms,
-            part_of_speech=part_of_speech,
-            examples=examples,
-            possible_options=possible_options,
-            context=context,
-            language=language,
-            translate=translate,
-            slugs=slugs,
-        )
-        return repetition
+) -> WordRepetition:
+    repetition: WordRepetition = await uow.route(user_id).repetitions.create_repetition(
+        title=title,
+        content_type=RepetitionContentTypeEnum.WORD,
+        user_id=user_id,
+        word=word,
+        synonyms=synonyms,
+        part_of_speech=part_of_speech,
+        examples=examples,
+        possible_options=possible_options,
+        context=context,
+        language=language,
+        translate=translate,
+        slugs=slugs,
+    )
+    await uow.commit()
+    return repetition
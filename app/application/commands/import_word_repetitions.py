@@ -0,0 +1,32 @@
+from fastapi import UploadFile
+
+from app.application.parsers import ImportFileFormatEnum, iter_import_rows
+from app.domain.models import ImportReport
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+IMPORT_BATCH_SIZE = 5000
+
+
+async def import_word_repetitions(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    document: UploadFile,
+    file_format: ImportFileFormatEnum,
+) -> ImportReport:
+    """
+    Streams `document` in batches of `IMPORT_BATCH_SIZE` rows, each committed on its own,
+    and returns the combined report ordered by line.
+    """
+    report = ImportReport()
+    uow.route(user_id)
+
+    async for rows in iter_import_rows(document, file_format, IMPORT_BATCH_SIZE):
+        batch_report = await uow.word_imports.import_word_repetitions(
+            user_id=user_id, rows=rows
+        )
+        await uow.commit()
+        report.imported += batch_report.imported
+        report.errors.extend(batch_report.errors)
+
+    report.errors.sort(key=lambda error: error.line)
+    return report
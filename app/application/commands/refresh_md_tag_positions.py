@@ -0,0 +1,28 @@
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+async def refresh_md_tag_positions(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    md_id: str,
+) -> int:
+    """
+    Brings the stored ranges of the tags of the document `md_id` up to date after a
+    re-ingest left them stale, so range reads use the position index again. Only the
+    tags from the first stale one on are summed up, and only those whose range changed
+    are rewritten. Returns their number.
+
+    The `mds` row is locked like a re-ingest locks it, so a re-ingest committed meanwhile
+    is either refreshed here as well or waits for this refresh.
+    """
+    mds = uow.route(user_id).mds
+    md = await mds.get_md(user_id=user_id, md_id=md_id, for_update=True)
+    if md is None or md.positions_stale_from is None:
+        return 0
+
+    refreshed = await mds.refresh_md_tag_positions(
+        md_id=md_id, stale_from=md.positions_stale_from
+    )
+    md.positions_stale_from = None
+    await uow.commit()
+    return refreshed
@@ -0,0 +1,14 @@
+from app.domain.models import Review, ReviewResult
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+async def review_repetition(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    review: Review,
+) -> ReviewResult:
+    result = await uow.route(user_id).reviews.review_repetition(
+        user_id=user_id, review=review
+    )
+    await uow.commit()
+    return result
@@ -0,0 +1,14 @@
+from app.domain.models import Review, ReviewResult
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+async def submit_reviews(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    reviews: list[Review],
+) -> list[ReviewResult]:
+    results = await uow.route(user_id).reviews.apply_reviews(
+        user_id=user_id, reviews=reviews
+    )
+    await uow.commit()
+    return results
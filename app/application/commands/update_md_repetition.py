@@ -0,0 +1,71 @@
+from fastapi import UploadFile
+
+from app.application.commands.create_md_repetition import TAG_BATCH_SIZE
+from app.application.parsers import iter_markdown_blocks
+from app.domain.exceptions.external import RepetitionNotFoundError
+from app.domain.models import MarkdownDigest
+from app.domain.services.md_diff import MDTagDiff, ParsedTag, TagLayout, diff_md_tags
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+async def update_md_repetition(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    md_id: str,
+    document: UploadFile,
+) -> MDTagDiff:
+    """
+    Re-ingests an edited upload of the document `md_id` in one transaction.
+
+    The first pass over the upload keeps only the hash and position of every block and
+    diffs them against the stored tags. Unchanged tags keep their id and row, apart from
+    the first one after each edit whose gap changed, changed ones are deleted, and the
+    second pass inserts just the new blocks. The document itself, its schedule included,
+    is left as it is.
+    """
+    mds = uow.route(user_id).mds
+    md = await mds.get_md(user_id=user_id, md_id=md_id, for_update=True)
+    if md is None:
+        raise RepetitionNotFoundError(repetition_id=md_id)
+
+    digest = MarkdownDigest()
+    layout = TagLayout()
+    parsed = []
+    async for blocks in iter_markdown_blocks(document, TAG_BATCH_SIZE):
+        for block in blocks:
+            digest.update(block)
+            parsed.append(
+                ParsedTag(
+                    content_hash=block.content_hash,
+                    position=layout.place(block),
+                    start_pos=block.start_pos,
+                )
+            )
+    if digest.hexdigest() == md.content_hash:
+        await uow.commit()
+        return MDTagDiff(unchanged=len(parsed))
+
+    diff = diff_md_tags(await mds.get_md_tag_hashes(md_id=md_id), parsed)
+    await mds.delete_md_tags(md_id=md_id, ids=diff.deleted_ids)
+    await mds.move_md_tags(md_id=md_id, positions=diff.moved)
+
+    if diff.inserted:
+        index = 0
+        await document.seek(0)
+        async for blocks in iter_markdown_blocks(document, TAG_BATCH_SIZE):
+            offsets = [
+                offset
+                for offset in range(index, index + len(blocks))
+                if offset in diff.inserted
+            ]
+            await mds.insert_md_tags(
+                md_id=md_id,
+                blocks=[blocks[offset - index] for offset in offsets],
+                positions=[diff.inserted[offset] for offset in offsets],
+            )
+            index += len(blocks)
+
+    md.content_hash = digest.hexdigest()
+    md.positions_stale_from = diff.stale_from
+    await uow.commit()
+    return diff
@@ -0,0 +1,9 @@
+from .markdown import MarkdownBlockParser, iter_markdown_blocks
+from .word_import import ImportFileFormatEnum, iter_import_rows
+
+__all__ = [
+    "ImportFileFormatEnum",
+    "MarkdownBlockParser",
+    "iter_import_rows",
+    "iter_markdown_blocks",
+]
@@ -0,0 +1,235 @@
+import codecs
+import re
+from typing import AsyncIterator, Iterator
+
+from fastapi import UploadFile
+
+from app.domain.models import MarkdownBlock, TextStyleEnum
+
+from .word_import import READ_CHUNK_SIZE
+
+TAB_SIZE = 4
+
+FENCE = re.compile(r"^(`{3,}|~{3,})")
+HEADING = re.compile(r"^(#{1,6})(?:[ \t]+|$)(.*?)(?:[ \t]+#+)?[ \t]*$")
+QUOTE = re.compile(r"^>[ ]?")
+LIST_ITEM = re.compile(r"^(?:([-*+])|(\d{1,9})[.)])(?:[ \t]+|$)")
+THEMATIC_BREAK = re.compile(r"^(?:(?:\*[ \t]*){3,}|(?:-[ \t]*){3,}|(?:_[ \t]*){3,})$")
+
+# Markers of a paragraph written in one style, checked in order.
+TEXT_STYLES = (
+    ("**", "**", TextStyleEnum.BOLD),
+    ("__", "__", TextStyleEnum.BOLD),
+    ("~~", "~~", TextStyleEnum.STRIKETHROUGH),
+    ("<u>", "</u>", TextStyleEnum.UNDERLINE),
+    ("*", "*", TextStyleEnum.ITALIC),
+    ("_", "_", TextStyleEnum.ITALIC),
+)
+
+
+class MarkdownBlockParser:
+    """
+    Splits a Markdown document fed line by line into `MarkdownBlock`s.
+
+    Only the block being parsed is kept, so memory does not grow with the document.
+    Positions are character offsets into the document, `end_pos` excludes the line break
+    after the block.
+
+    Recognized blocks are fenced code, ATX headings, quotes, list items, one block per
+    item, and paragraphs of text. A paragraph wrapped in a single emphasis marker gets
+    its style, any other paragraph is simple text.
+    """
+
+    def __init__(self):
+        self._type = None
+        self._lines: list[str] = []
+        self._start_pos = 0
+        self._end_pos = 0
+        self._space_count = 0
+        self._attributes = {}
+        self._fence = None
+
+    def feed(self, line: str, pos: int) -> Iterator[MarkdownBlock]:
+        """
+        Parses `line` starting at `pos`, without its line break, and yields the blocks it
+        completed.
+        """
+        if self._type == "code":
+            yield from self._feed_code(line, pos)
+            return
+
+        indent = _indent(line)
+        stripped = line.strip()
+        body = line.lstrip()
+
+        if not stripped or THEMATIC_BREAK.match(stripped):
+            yield from self._close()
+            return
+
+        if fence := FENCE.match(body):
+            yield from self._close()
+            self._open("code", pos, indent, {"is_multiply": True})
+            self._fence = fence.group(1)
+            self._end_pos = pos + len(line)
+            return
+
+        if heading := HEADING.match(body):
+            yield from self._close()
+            self._open("heading", pos, indent, {"level": len(heading.group(1))})
+            self._append(heading.group(2), pos, line)
+            yield from self._close()
+            return
+
+        if QUOTE.match(body):
+            depth, content = _unquote(body)
+            if self._type != "quote":
+                yield from self._close()
+                self._open("quote", pos, indent, {"sup_quote": False})
+            if depth > 1:
+                self._attributes["sup_quote"] = True
+            self._append(content, pos, line)
+            return
+
+        if item := LIST_ITEM.match(body):
+            yield from self._close()
+            self._open("list", pos, indent, {"ordered": item.group(2) is not None})
+            self._append(body[item.end() :], pos, line)
+            return
+
+        if self._type == "list" and indent > self._space_count:
+            self._append(stripped, pos, line)
+            return
+
+        if self._type != "text":
+            yield from self._close()
+            self._open("text", pos, indent)
+        self._append(stripped, pos, line)
+
+    def close(self) -> Iterator[MarkdownBlock]:
+        """
+        Yields the block still open at the end of the document, an unclosed code fence
+        runs to the end.
+        """
+        yield from self._close()
+
+    def _feed_code(self, line: str, pos: int) -> Iterator[MarkdownBlock]:
+        body = line.strip()
+        if body.startswith(self._fence) and not body.strip(self._fence[0]):
+            self._end_pos = pos + len(line)
+            yield from self._close()
+            return
+        self._lines.append(line)
+        self._end_pos = pos + len(line)
+
+    def _open(self, type: str, pos: int, indent: int, attributes: dict | None = None):
+        self._type = type
+        self._lines = []
+        self._start_pos = pos
+        self._space_count = indent
+        self._attributes = attributes or {}
+
+    def _append(self, content: str, pos: int, line: str):
+        self._lines.append(content)
+        self._end_pos = pos + len(line.rstrip())
+
+    def _close(self) -> Iterator[MarkdownBlock]:
+        if self._type is None:
+            return
+
+        content = "\n".join(self._lines)
+        attributes = self._attributes
+        if self._type == "text":
+            content, style = _text_style(content)
+            attributes = {"style": style.value}
+
+        yield MarkdownBlock(
+            type=self._type,
+            start_pos=self._start_pos,
+            end_pos=self._end_pos,
+            space_count=self._space_count,
+            content=content,
+            attributes=attributes,
+        )
+        self._type = None
+        self._lines = []
+        self._fence = None
+
+
+async def iter_markdown_blocks(
+    document: UploadFile,
+    batch_size: int,
+) -> AsyncIterator[list[MarkdownBlock]]:
+    """
+    Reads `document` in `READ_CHUNK_SIZE` chunks and yields batches of up to `batch_size`
+    parsed blocks, so the upload is never held in memory as a whole.
+    """
+    parser = MarkdownBlockParser()
+    batch = []
+
+    async for pos, line in _iter_lines(document):
+        for block in parser.feed(line, pos):
+            batch.append(block)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    batch.extend(parser.close())
+    if batch:
+        yield batch
+
+
+async def _iter_lines(document: UploadFile) -> AsyncIterator[tuple[int, str]]:
+    """
+    Yields every line of `document` without its line break, with the character offset it
+    starts at. A line split between two chunks is joined before it is yielded.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail = ""
+    pos = 0
+
+    while True:
+        chunk = await document.read(READ_CHUNK_SIZE)
+        text = tail + decoder.decode(chunk, final=not chunk)
+        lines = text.split("\n")
+        tail = lines.pop() if chunk else ""
+        if not chunk and lines and lines[-1] == "":
+            lines.pop()
+
+        for line in lines:
+            yield pos, line.rstrip("\r")
+            pos += len(line) + 1
+
+        if not chunk:
+            break
+
+
+def _indent(line: str) -> int:
+    indent = 0
+    for char in line:
+        if char == " ":
+            indent += 1
+        elif char == "\t":
+            indent += TAB_SIZE - indent % TAB_SIZE
+        else:
+            break
+    return indent
+
+
+def _unquote(body: str) -> tuple[int, str]:
+    depth = 0
+    while match := QUOTE.match(body):
+        depth += 1
+        body = body[match.end() :].lstrip(" ")
+    return depth, body.rstrip()
+
+
+def _text_style(content: str) -> tuple[str, TextStyleEnum]:
+    for opening, closing, style in TEXT_STYLES:
+        if len(content) <= len(opening) + len(closing):
+            continue
+        if not (content.startswith(opening) and content.endswith(closing)):
+            continue
+        inner = content[len(opening) : -len(closing)]
+        if opening not in inner and closing not in inner and inner.strip() == inner:
+            return inner, style
+    return content, TextStyleEnum.SIMPLE
@@ -0,0 +1,127 @@
+import codecs
+import csv
+from typing import AsyncIterator
+
+import orjson
+from fastapi import UploadFile
+
+from app.domain.models.enum import EnumABC
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class ImportFileFormatEnum(str, EnumABC):
+    CSV = "csv"
+    JSONL = "jsonl"
+
+    @classmethod
+    def fields(cls):
+        """
+        Returns all fields of the enum as a dictionary.
+
+        Returns:
+            dict: A dictionary with enum names as keys and values as enum values.
+        """
+        return {item.name: item.value for item in cls}
+
+    @classmethod
+    def get_name(self):
+        return "importfileformatenum"
+
+    @classmethod
+    def from_filename(cls, filename: str) -> "ImportFileFormatEnum":
+        """
+        Guesses the format from the extension of `filename`, `.ndjson` is read as JSONL.
+        """
+        extension = filename.rsplit(".", 1)[-1].lower() if filename else ""
+        if extension == "ndjson":
+            return cls.JSONL
+        return cls(extension)
+
+
+async def iter_import_rows(
+    document: UploadFile,
+    file_format: ImportFileFormatEnum,
+    batch_size: int,
+) -> AsyncIterator[list[tuple[int, dict | Exception]]]:
+    """
+    Reads `document` in `READ_CHUNK_SIZE` chunks and yields batches of up to `batch_size`
+    `(line, row)` pairs, so the upload is never held in memory as a whole.
+
+    A CSV document must start with a header naming the fields. A row which cannot be
+    parsed is yielded as the exception instead of the dict, to be reported by its line.
+    """
+    parse = _parse_csv_records if file_format == ImportFileFormatEnum.CSV else _parse_jsonl
+    header = None
+    batch = []
+
+    async for line, record in _iter_records(document, file_format):
+        if file_format == ImportFileFormatEnum.CSV and header is None:
+            header = next(csv.reader([record]))
+            continue
+
+        batch.append((line, parse(record, header)))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def _iter_records(
+    document: UploadFile,
+    file_format: ImportFileFormatEnum,
+) -> AsyncIterator[tuple[int, str]]:
+    """
+    Yields every non-blank record with the number of the line it starts on.
+
+    A CSV record is complete once it holds an even number of quotes, which keeps quoted
+    fields with line breaks together even when they span two chunks.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail = ""
+    record, record_line, line = "", 0, 0
+
+    while True:
+        chunk = await document.read(READ_CHUNK_SIZE)
+        text = tail + decoder.decode(chunk, final=not chunk)
+        lines = text.split("\n")
+        tail = lines.pop() if chunk else ""
+        if not chunk and lines and lines[-1] == "":
+            lines.pop()
+
+        for text_line in lines:
+            line += 1
+            if not record:
+                record_line = line
+            record += text_line + "\n"
+
+            if file_format == ImportFileFormatEnum.CSV and record.count('"') % 2:
+                continue
+            if record.strip():
+                yield record_line, record.rstrip("\r\n")
+            record = ""
+
+        if not chunk:
+            break
+
+    if record.strip():
+        yield record_line, record.rstrip("\r\n")
+
+
+def _parse_csv_records(record: str, header: list[str]) -> dict | Exception:
+    values = next(csv.reader([record]))
+    if len(values) != len(header):
+        return ValueError(f"Expected {len(header)} columns, got {len(values)}.")
+    return {key: value for key, value in zip(header, values) if value != ""}
+
+
+def _parse_jsonl(record: str, header: None) -> dict | Exception:
+    try:
+        row = orjson.loads(record)
+    except orjson.JSONDecodeError as e:
+        return e
+    if not isinstance(row, dict):
+        return ValueError("Every JSONL line must be an object.")
+    return row
@@ -0,0 +1,66 @@
+from typing import Optional
+
+import numpy as np
+
+from app.domain.models.type import DateType
+from app.domain.schedulers import SchedulerAlgorithmEnum, build_scheduler, get_scheduler
+from app.domain.services.forecast import ForecastDay, WorkloadSimulation
+from app.domain.utils.repetition_math import ONE_DAY_IN_SECONDS
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork, fan_out
+
+
+async def forecast_workload(
+    uow: SQLAlchemyUnitOfWork,
+    start_date: DateType,
+    days: int,
+    user_id: Optional[str] = None,
+    success_probability: float = 0.9,
+    algorithm: Optional[SchedulerAlgorithmEnum] = None,
+    scheduler_parameters: Optional[dict[str, float]] = None,
+    seed: Optional[int] = None,
+) -> list[ForecastDay]:
+    """
+    Simulates the review workload of `user_id`, or of every user on every shard when
+    it is `None`, for `days` days from the start of the day of `start_date`.
+
+    Without `algorithm` and `scheduler_parameters` the configured scheduler is simulated,
+    otherwise a what-if scheduler is built from them, e.g. `LINEAR` with another `rate`.
+    """
+    scheduler = (
+        build_scheduler(
+            algorithm or get_scheduler().algorithm,
+            **(scheduler_parameters or {}),
+        )
+        if algorithm or scheduler_parameters
+        else get_scheduler()
+    )
+    simulation = WorkloadSimulation(
+        scheduler=scheduler,
+        success_probability=success_probability,
+        seed=seed,
+    )
+    start = start_date.date.start_of("day").int_timestamp
+
+    due_before = start + days * ONE_DAY_IN_SECONDS
+
+    if user_id is None:
+        states = await fan_out(
+            lambda shard_uow: shard_uow.reviews.get_schedule_state(
+                due_before=due_before
+            )
+        )
+        count_repetition = np.concatenate([counts for counts, _ in states])
+        date_repetition = np.concatenate([dates for _, dates in states])
+    else:
+        reviews = uow.route(user_id).reviews
+        count_repetition, date_repetition = await reviews.get_schedule_state(
+            due_before=due_before,
+            user_id=user_id,
+        )
+
+    return simulation.run(
+        count_repetition=count_repetition,
+        date_repetition=date_repetition,
+        start=start,
+        days=days,
+    )
@@ -1,22 +1,72 @@
-from app.infrastucture.db.session import get_session
+from typing import Optional
 
-from app.domain.models import Repetition
+from app.domain.exceptions.external import UnknownRequestedField
+from app.domain.models import Repetition, SlugLoadStrategyEnum
 from app.domain.models.type import DateType
-from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
+from app.domain.utils.cursor import decode_cursor, encode_cursor
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
 
 
 async def get_all_repetition(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
     start_date: DateType,
     end_date: DateType,
     limit: int,
     offset: int,
-) -> list[dict[str, any]]:
-    async with get_session() as session:
-        dao = SQLAlchemyRepetitionRepository(session=session)
-        scalar_result: list[Repetition] = await dao.get_all_repetitions(
-            start_date=start_date,
-            end_date=end_date,
-            limit=limit,
-            offset=offset,
+    cursor: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    slugs: Optional[list[str]] = None,
+) -> tuple[list[Repetition], Optional[str]]:
+    """
+    Returns one page of repetitions together with the cursor of the next page.
+
+    A passed `cursor` takes precedence over `offset`. The next cursor is `None`
+    when the returned page is the last one. When `fields` is passed only those
+    fields are loaded, so the rows must be exported with the same `fields`.
+    When `slugs` is passed only repetitions tagged with any of them are returned.
+    """
+    check_requested_fields(fields)
+    after = decode_cursor(cursor) if cursor else None
+
+    repetitions = uow.route(user_id).repetitions
+    scalar_result: list[Repetition] = await repetitions.get_all_repetitions(
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit + 1,
+        offset=offset,
+        after=after,
+        fields=fields,
+        slug_strategy=slug_strategy,
+        slugs=slugs,
+    )
+
+    page, rest = scalar_result[:limit], scalar_result[limit:]
+    next_cursor = (
+        encode_cursor(page[-1].date_repetition, page[-1].id) if rest and page else None
+    )
+    return page, next_cursor
+
+
+def check_requested_fields(fields: Optional[list[str]]):
+    """
+    Raises `UnknownRequestedField` if `fields` names something no repetition type exports.
+    """
+    if not fields:
+        return
+
+    possible_fields = list(
+        dict.fromkeys(
+            field
+            for mapper in Repetition.__mapper__.self_and_descendants
+            for field in mapper.class_.json_fields()
+        )
+    )
+    unknown_fields = [field for field in fields if field not in possible_fields]
+    if unknown_fields:
+        raise UnknownRequestedField(
+            fields=unknown_fields,
+            possible_fields=possible_fields,
         )
-        return [result.to_json for result in scalar_result]
@@ -0,0 +1,66 @@
+from typing import Optional
+
+from app.config import global_config
+from app.domain.exceptions.external import (
+    InvalidPositionRangeError,
+    RepetitionNotFoundError,
+)
+from app.domain.utils import IntervalTree, LRUCache
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+# (user_id, md_id) -> content hash of the document and its tags as json. A re-ingest
+# changes the hash, so a stale tree is detected by any worker and never served.
+md_tag_tree_cache: LRUCache[tuple[str, str], tuple[str, IntervalTree[dict]]] = LRUCache(
+    maxsize=global_config.MD_TAG_TREE_CACHE_SIZE
+)
+
+
+async def get_md_tags(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    md_id: str,
+    start_pos: Optional[int] = None,
+    end_pos: Optional[int] = None,
+) -> list[dict]:
+    """
+    Returns the tags of the document `md_id` overlapping `[start_pos, end_pos)` ordered by
+    position. Without both positions the whole document is returned.
+
+    Reading the whole document caches it as an `IntervalTree`, later ranges of a cached
+    document are answered from memory once its content hash is confirmed. Ranges of other
+    documents are looked up through the position index of `tags`.
+    """
+    if start_pos is not None and end_pos is not None and end_pos <= start_pos:
+        raise InvalidPositionRangeError(start_pos=start_pos, end_pos=end_pos)
+
+    key = (user_id, md_id)
+    mds = uow.route(user_id).mds
+    if start_pos is None and end_pos is None:
+        md = await mds.get_md(user_id=user_id, md_id=md_id)
+        if md is None:
+            raise RepetitionNotFoundError(repetition_id=md_id)
+        tags = [
+            tag.to_json
+            for tag in await mds.get_md_tags(user_id=user_id, md_id=md_id)
+        ]
+        md_tag_tree_cache.put(
+            key,
+            (
+                md.content_hash,
+                IntervalTree((tag["start_pos"], tag["end_pos"], tag) for tag in tags),
+            ),
+        )
+        return tags
+
+    start_pos = start_pos or 0
+    cached = md_tag_tree_cache.get(key)
+    if cached is not None:
+        content_hash, tree = cached
+        md = await mds.get_md(user_id=user_id, md_id=md_id)
+        if md is not None and md.content_hash == content_hash:
+            return tree.overlap(start_pos, end_pos)
+
+    tags = await mds.get_md_tags_in_range(
+        user_id=user_id, md_id=md_id, start_pos=start_pos, end_pos=end_pos
+    )
+    return [tag.to_json for tag in tags]
@@ -0,0 +1,33 @@
+from typing import Optional
+
+from app.application.queries.get_all_repetition import check_requested_fields
+from app.domain.models import LanguageEnum, SlugLoadStrategyEnum, WordRepetition
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+async def search_repetition(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    query: str,
+    limit: int,
+    offset: int,
+    language: Optional[LanguageEnum] = None,
+    fields: Optional[list[str]] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+) -> list[WordRepetition]:
+    """
+    Returns one page of the word repetitions of `user_id` matching `query`, best matches first.
+    `language` restricts the search to words of that language.
+    """
+    check_requested_fields(fields)
+
+    repetitions = uow.route(user_id).repetitions
+    return await repetitions.search_word_repetitions(
+        user_id=user_id,
+        query=query,
+        limit=limit,
+        offset=offset,
+        language=language,
+        fields=fields,
+        slug_strategy=slug_strategy,
+    )
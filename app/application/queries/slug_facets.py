@@ -0,0 +1,21 @@
+from app.domain.models import SlugFacet
+from app.domain.models.type import DateType
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+async def get_slug_facets(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    start_date: DateType,
+    end_date: DateType,
+) -> list[SlugFacet]:
+    """
+    Returns how many repetitions of `user_id` due between `start_date` and `end_date`
+    carry each slug, to offer them as filters of the due list.
+    """
+    repetitions = uow.route(user_id).repetitions
+    return await repetitions.count_due_by_slug(
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
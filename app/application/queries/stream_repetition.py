@@ -0,0 +1,42 @@
+from typing import AsyncIterator, Optional
+
+from app.application.serializers import repetition_serializer
+
+from app.domain.models import SlugLoadStrategyEnum
+from app.domain.models.type import DateType
+from app.infrastucture.db.session import WritePosition
+from app.infrastucture.db.unit_of_work import get_unit_of_work
+
+STREAM_CHUNK_SIZE = 1000
+
+
+async def stream_repetition(
+    user_id: str,
+    start_date: DateType,
+    end_date: DateType,
+    fields: Optional[list[str]] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    slugs: Optional[list[str]] = None,
+    read_after: Optional[WritePosition] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Yields repetitions of `user_id` due between `start_date` and `end_date`
+    as NDJSON lines, one row at a time.
+
+    The response has already started when the generator runs, so `fields`
+    must be checked with `check_requested_fields` beforehand. The generator also
+    outlives the request-scoped unit of work, so it opens a read-only one of its own,
+    routed to the shard and replica of `user_id` like any other read.
+    """
+    async with get_unit_of_work(read_only=True, read_after=read_after) as uow:
+        repetitions = uow.route(user_id).repetitions
+        async for repetition in repetitions.stream_repetitions(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            chunk_size=STREAM_CHUNK_SIZE,
+            fields=fields,
+            slug_strategy=slug_strategy,
+            slugs=slugs,
+        ):
+            yield repetition_serializer.dumps_row(repetition, fields)
@@ -0,0 +1,66 @@
+from typing import Optional
+
+from app.application.queries.get_all_repetition import check_requested_fields
+from app.domain.models import (
+    ArrayMatchEnum,
+    SlugLoadStrategyEnum,
+    WordArrayFieldEnum,
+    WordRepetition,
+)
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+
+async def find_word_repetitions_by_array(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    field: WordArrayFieldEnum,
+    values: list[str],
+    match: ArrayMatchEnum,
+    limit: int,
+    offset: int,
+    fields: Optional[list[str]] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+) -> list[WordRepetition]:
+    """
+    Returns one page of the word repetitions of `user_id` whose `field`
+    contains all of `values` or overlaps them, depending on `match`.
+    """
+    check_requested_fields(fields)
+
+    repetitions = uow.route(user_id).repetitions
+    return await repetitions.find_word_repetitions_by_array(
+        user_id=user_id,
+        field=field,
+        values=list(dict.fromkeys(values)),
+        match=match,
+        limit=limit,
+        offset=offset,
+        fields=fields,
+        slug_strategy=slug_strategy,
+    )
+
+
+async def get_related_word_repetitions(
+    uow: SQLAlchemyUnitOfWork,
+    user_id: str,
+    repetition_ids: list[str],
+    field: WordArrayFieldEnum,
+    limit: int,
+    fields: Optional[list[str]] = None,
+    slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+) -> dict[str, list[WordRepetition]]:
+    """
+    Maps each of `repetition_ids`, e.g. a whole review page, to the word repetitions
+    of `user_id` sharing a value of `field` with it.
+    """
+    check_requested_fields(fields)
+
+    repetitions = uow.route(user_id).repetitions
+    return await repetitions.get_related_word_repetitions(
+        user_id=user_id,
+        repetition_ids=list(dict.fromkeys(repetition_ids)),
+        field=field,
+        limit=limit,
+        fields=fields,
+        slug_strategy=slug_strategy,
+    )
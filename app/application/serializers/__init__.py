@@ -0,0 +1,3 @@
+from .repetition import RepetitionSerializer, repetition_serializer
+
+__all__ = ["RepetitionSerializer", "repetition_serializer"]
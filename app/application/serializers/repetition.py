@@ -0,0 +1,144 @@
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Iterable, Optional
+
+import orjson
+
+from app.domain.models import Repetition
+
+FieldGetter = Callable[[Repetition], any]
+
+
+def _get_slugs(repetition: Repetition) -> list[dict[str, str]]:
+    if repetition.aggregated_slugs is not None:
+        return repetition.aggregated_slugs
+    return [{"id": slug.id, "name": slug.name} for slug in repetition.slugs]
+
+
+def _get_date_repetition(repetition: Repetition) -> int:
+    return int(repetition.date_repetition)
+
+
+def _get_date_last_repetition(repetition: Repetition) -> Optional[int]:
+    date_last_repetition = repetition.date_last_repetition
+    return int(date_last_repetition) if date_last_repetition else None
+
+
+def _default(value: any) -> any:
+    # `EnumABC` enums are built with a combined metaclass which orjson does not recognize as `Enum`.
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+SPECIAL_GETTERS: dict[str, FieldGetter] = {
+    "slugs": _get_slugs,
+    "date_repetition": _get_date_repetition,
+    "date_last_repetition": _get_date_last_repetition,
+}
+
+
+class RepetitionSerializer:
+    """
+    Encodes repetitions straight into JSON bytes with `orjson`.
+
+    For every mapped repetition class the list of `(field, getter)` pairs is compiled
+    once, so encoding a row is a flat loop over precomputed getters instead of
+    `to_json` dict merging followed by a Pydantic validation of the whole response.
+    The produced documents match `to_json` / `to_partial_json` field for field.
+    """
+
+    def __init__(self):
+        self._getters: dict[type[Repetition], tuple[tuple[str, FieldGetter], ...]] = {
+            mapper.class_: self._compile(mapper.class_.json_fields())
+            for mapper in Repetition.__mapper__.self_and_descendants
+        }
+
+    @staticmethod
+    def _compile(fields: Iterable[str]) -> tuple[tuple[str, FieldGetter], ...]:
+        return tuple(
+            (field, SPECIAL_GETTERS.get(field) or attrgetter(field))
+            for field in dict.fromkeys(fields)
+        )
+
+    @lru_cache(maxsize=128)
+    def _partial_getters(
+        self, cls: type[Repetition], fields: tuple[str, ...]
+    ) -> tuple[tuple[str, FieldGetter], ...]:
+        return tuple(
+            (field, getter) for field, getter in self._getters[cls] if field in fields
+        )
+
+    def to_dict(
+        self,
+        repetition: Repetition,
+        fields: Optional[list[str]] = None,
+    ) -> dict[str, any]:
+        getters = (
+            self._partial_getters(type(repetition), tuple(fields))
+            if fields
+            else self._getters[type(repetition)]
+        )
+        return {field: getter(repetition) for field, getter in getters}
+
+    def dumps_row(
+        self,
+        repetition: Repetition,
+        fields: Optional[list[str]] = None,
+    ) -> bytes:
+        """
+        Encodes a single repetition as one NDJSON line.
+        """
+        return orjson.dumps(
+            self.to_dict(repetition, fields),
+            default=_default,
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
+
+    def dumps_page(
+        self,
+        repetitions: list[Repetition],
+        status: int,
+        details: str,
+        next_cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> bytes:
+        """
+        Encodes a page of repetitions in the `TotalResponse` envelope.
+        """
+        return orjson.dumps(
+            {
+                "status": status,
+                "details": details,
+                "model": [self.to_dict(repetition, fields) for repetition in repetitions],
+                "next_cursor": next_cursor,
+            },
+            default=_default,
+        )
+
+    def dumps_groups(
+        self,
+        groups: dict[str, list[Repetition]],
+        status: int,
+        details: str,
+        fields: Optional[list[str]] = None,
+    ) -> bytes:
+        """
+        Encodes repetitions grouped by key in the `TotalResponse` envelope.
+        """
+        return orjson.dumps(
+            {
+                "status": status,
+                "details": details,
+                "model": {
+                    key: [self.to_dict(repetition, fields) for repetition in repetitions]
+                    for key, repetitions in groups.items()
+                },
+                "next_cursor": None,
+            },
+            default=_default,
+        )
+
+
+repetition_serializer = RepetitionSerializer()
@@ -0,0 +1,68 @@
+"""
+Forecasts the daily review workload from the current schedule state.
+
+Usage:
+    python -m app.cli.forecast --days 30 [--user-id USER] [--success-probability 0.9]
+        [--algorithm LINEAR|SM2|FSRS] [--rate 2.5] [--post-rate 1] [--ease-factor 2.5]
+        [--desired-retention 0.9] [--seed 42] [--start-date 2026-01-01]
+"""
+
+import argparse
+import asyncio
+
+import orjson
+import pendulum
+
+from app.application.queries.forecast_workload import forecast_workload
+from app.domain.models.type import DateType
+from app.domain.schedulers import SchedulerAlgorithmEnum
+from app.infrastucture.db.session import session_manager
+from app.infrastucture.db.unit_of_work import get_unit_of_work
+
+SCHEDULER_PARAMETERS = ("rate", "post_rate", "ease_factor", "desired_retention")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", default=None, help="Forecast every user if omitted.")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--start-date", default=None, help="Today if omitted.")
+    parser.add_argument("--success-probability", type=float, default=0.9)
+    parser.add_argument(
+        "--algorithm",
+        type=SchedulerAlgorithmEnum,
+        choices=list(SchedulerAlgorithmEnum),
+        default=None,
+    )
+    for parameter in SCHEDULER_PARAMETERS:
+        parser.add_argument(f"--{parameter.replace('_', '-')}", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+async def main(arguments: argparse.Namespace):
+    try:
+        async with get_unit_of_work() as uow:
+            forecast = await forecast_workload(
+                uow=uow,
+                start_date=DateType(arguments.start_date or pendulum.now()),
+                days=arguments.days,
+                user_id=arguments.user_id,
+                success_probability=arguments.success_probability,
+                algorithm=arguments.algorithm,
+                scheduler_parameters={
+                    parameter: getattr(arguments, parameter)
+                    for parameter in SCHEDULER_PARAMETERS
+                    if getattr(arguments, parameter) is not None
+                },
+                seed=arguments.seed,
+            )
+    finally:
+        await session_manager.close()
+
+    for day in forecast:
+        print(orjson.dumps(day.to_json).decode())
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_arguments()))
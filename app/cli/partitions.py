@@ -0,0 +1,45 @@
+"""
+Creates the monthly partitions of repetitions ahead of time on every shard.
+
+Usage:
+    python -m app.cli.partitions [--months-ahead 12] [--start-date 2026-01-01]
+
+Run it regularly, e.g. monthly from cron. Rows beyond the last partition land in the
+default partition and are moved out when their month's partition is created.
+"""
+
+import argparse
+import asyncio
+
+import orjson
+import pendulum
+
+from app.config import global_config
+from app.infrastucture.db.partitions import create_partitions_ahead
+from app.infrastucture.db.session import get_session, session_manager
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--months-ahead", type=int, default=global_config.DB_PARTITION_MONTHS_AHEAD
+    )
+    parser.add_argument("--start-date", default=None, help="Today if omitted.")
+    return parser.parse_args()
+
+
+async def main(arguments: argparse.Namespace):
+    start = pendulum.parse(arguments.start_date) if arguments.start_date else None
+    try:
+        for shard in session_manager.shards:
+            async with get_session(shard=shard) as session:
+                created = await create_partitions_ahead(
+                    session, months_ahead=arguments.months_ahead, start=start
+                )
+            print(orjson.dumps({"shard": shard, "created": created}).decode())
+    finally:
+        await session_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_arguments()))
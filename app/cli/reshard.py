@@ -0,0 +1,88 @@
+"""
+Moves the rows of every user whose shard changed after shards were appended to DB_SHARD_URLS.
+
+Usage:
+    python -m app.cli.reshard --previous-shard-count N --phase copy|purge [--user-id USER]
+
+Procedure:
+    1. Append the new shards to DB_SHARD_URLS of this tool only and run `--phase copy`
+       while the application still runs with the previous shard list.
+    2. Switch the application to the new shard list.
+    3. Run `--phase copy` again to catch up with the writes made in the meantime.
+    4. Run `--phase purge` to delete the moved rows from their previous shards.
+
+Deletes:
+    Deleting a repetition leaves a tombstone in `deleted_repetitions` on its shard. Every
+    copy deletes from the new shard what was deleted on the previous one since the last
+    copy, and skips what was deleted on the new shard after the switch, so neither comes
+    back. The purge drops the tombstones of every user it finished moving. Those of users
+    which are not being moved only matter to a future move, the table can be emptied
+    while no move is in progress.
+"""
+
+import argparse
+import asyncio
+
+import orjson
+from sqlalchemy import distinct, select
+
+from app.domain.models import Repetition
+from app.infrastucture.db.resharding import UserMove, copy_user_rows, purge_user_rows
+from app.infrastucture.db.session import get_session, session_manager
+
+PHASES = ("copy", "purge")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--previous-shard-count", type=int, required=True)
+    parser.add_argument("--phase", choices=PHASES, required=True)
+    parser.add_argument("--user-id", default=None, help="Move every user if omitted.")
+    return parser.parse_args()
+
+
+async def get_user_ids(shard: int) -> list[str]:
+    async with get_session(shard=shard) as session:
+        return list(await session.scalars(select(distinct(Repetition.user_id))))
+
+
+async def move_user(user_id: str, source: int, target: int, phase: str) -> UserMove:
+    async with (
+        get_session(shard=source) as source_session,
+        get_session(shard=target) as target_session,
+    ):
+        if phase == "copy":
+            copied = await copy_user_rows(source_session, target_session, user_id)
+            return UserMove(user_id=user_id, source=source, target=target, copied=copied)
+
+        purged, pending = await purge_user_rows(source_session, target_session, user_id)
+        return UserMove(
+            user_id=user_id, source=source, target=target, purged=purged, pending=pending
+        )
+
+
+async def main(arguments: argparse.Namespace):
+    if not 0 < arguments.previous_shard_count <= len(session_manager.shards):
+        raise SystemExit(
+            "Attr previous_shard_count must be between 1 and the number of shards!"
+        )
+
+    try:
+        for source in range(arguments.previous_shard_count):
+            user_ids = (
+                [arguments.user_id]
+                if arguments.user_id
+                else await get_user_ids(source)
+            )
+            for user_id in user_ids:
+                target = session_manager.shard_for(user_id)
+                if target == source:
+                    continue
+                move = await move_user(user_id, source, target, arguments.phase)
+                print(orjson.dumps(move.to_json).decode())
+    finally:
+        await session_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_arguments()))
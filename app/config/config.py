@@ -4,6 +4,10 @@ from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def split_urls(urls: Optional[str]) -> list[str]:
+    return [url.strip() for url in (urls or "").split(",") if url.strip()]
+
+
 class GlobalConfig(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_DB: str
@@ -12,11 +16,50 @@ class GlobalConfig(BaseSettings):
     DB_HOST: str
     MODE: Optional[str] = "DEV"
     AUTH_MARKER: str
+    SCHEDULER: Optional[str] = "LINEAR"
+    SLUG_CACHE_SIZE: Optional[int] = 10_000
+    MD_TAG_TREE_CACHE_SIZE: Optional[int] = 256
+    DB_ECHO: Optional[bool] = False
+    DB_POOL_SIZE: Optional[int] = 10
+    DB_MAX_OVERFLOW: Optional[int] = 10
+    DB_POOL_RECYCLE: Optional[int] = 1800
+    DB_POOL_PRE_PING: Optional[bool] = True
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = 500
+    DB_REPLICA_URLS: Optional[str] = None
+    DB_SHARD_URLS: Optional[str] = None
+    DB_SHARD_REPLICA_URLS: Optional[str] = None
+    DB_PARTITION_MONTHS_AHEAD: Optional[int] = 12
 
     @property
     def DATABASE_URL_async(self):
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def DATABASE_REPLICA_URLS_async(self) -> list[str]:
+        return split_urls(self.DB_REPLICA_URLS)
+
+    @property
+    def DATABASE_SHARD_URLS_async(self) -> list[str]:
+        """
+        Primaries of all shards in `DB_SHARD_URLS`, or the single database when it is unset.
+        """
+        return split_urls(self.DB_SHARD_URLS) or [self.DATABASE_URL_async]
+
+    @property
+    def DATABASE_SHARD_REPLICA_URLS_async(self) -> list[list[str]]:
+        """
+        Replicas of every shard: `DB_SHARD_REPLICA_URLS` holds one comma separated group
+        per shard, separated by `;`. Without shards the replicas are `DB_REPLICA_URLS`.
+        """
+        if not self.DB_SHARD_URLS:
+            return [self.DATABASE_REPLICA_URLS_async]
+
+        groups = (self.DB_SHARD_REPLICA_URLS or "").split(";")
+        return [
+            split_urls(groups[shard]) if shard < len(groups) else []
+            for shard in range(len(self.DATABASE_SHARD_URLS_async))
+        ]
+
     model_config = SettingsConfigDict(
         validate_default=False,
         env_file=f"{os.getcwd()}/app/config/env",
@@ -55,3 +55,55 @@ class RepetitionNotFoundError(BaseExceptionExternal):
 
     def get_message(self) -> str:
         return f"Repetition with ID '{self.repetition_id}' was not found."
+
+
+@dataclass
+class InvalidCursorError(BaseExceptionExternal):
+    cursor: str
+    status: int = field(default=400)
+
+    def get_message(self) -> str:
+        return f"Cursor '{self.cursor}' is malformed or was issued by another query."
+
+
+@dataclass
+class UnknownRequestedField(BaseExceptionExternal):
+    fields: list[str]
+    possible_fields: list[str]
+    status: int = field(default=400)
+
+    def get_message(self) -> str:
+        return f"Unknown fields [{', '.join(self.fields)}]. Possible options {self.possible_fields}."
+
+
+@dataclass
+class UnknownSchedulerParameter(BaseExceptionExternal):
+    algorithm: str
+    parameters: list[str]
+    possible_parameters: list[str]
+    status: int = field(default=400)
+
+    def get_message(self) -> str:
+        return f"Scheduler {self.algorithm} does not accept [{', '.join(self.parameters)}]. Possible options {self.possible_parameters}."
+
+
+@dataclass
+class InvalidSchedulerParameter(BaseExceptionExternal):
+    algorithm: str
+    parameter: str
+    value: float
+    bounds: dict[str, float]
+    status: int = field(default=400)
+
+    def get_message(self) -> str:
+        return f"Scheduler {self.algorithm} does not accept {self.parameter}={self.value}. Bounds {self.bounds}."
+
+
+@dataclass
+class InvalidPositionRangeError(BaseExceptionExternal):
+    start_pos: int
+    end_pos: int
+    status: int = field(default=400)
+
+    def get_message(self) -> str:
+        return f"Position range [{self.start_pos}, {self.end_pos}) is empty, end_pos must be greater than start_pos."
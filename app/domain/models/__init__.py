@@ -1,14 +1,70 @@
 from .type.date_type import DateType
-from .md.md import MD
-from .md.tags import Code, Heading, List, Quote, Tag, Text, TextStyleEnum
-from .repetition import Repetition
-from .slug.slug import SlugRepetition
+from .md import MD, MDSchema, MarkdownBlock, MarkdownDigest
+from .md.tags import (
+    Code,
+    Heading,
+    List,
+    Quote,
+    Tag,
+    TagSchema,
+    Text,
+    TextStyleEnum,
+)
+from .repetition import (
+    Repetition,
+    RepetitionContentTypeEnum,
+    RepetitionSchema,
+    RepetitionStatusEnum,
+)
+from .review import Review, ReviewResult
+from .slug.slug import (
+    SlugFacet,
+    SlugLoadStrategyEnum,
+    SlugRepetition,
+    SlugRepetitionSchema,
+)
+from .association import (
+    deleted_repetitions,
+    repetition_slug_association,
+    repetition_titles,
+)
+from .word import (
+    ArrayMatchEnum,
+    LanguageEnum,
+    PartOfSpeachEnum,
+    WordArrayFieldEnum,
+    WordRepetition,
+    WordRepetitionSchema,
+)
+from .word_import import ImportReport, ImportRowError
 
 __all__ = [
     "DateType",
     "Repetition",
+    "RepetitionContentTypeEnum",
+    "RepetitionSchema",
+    "RepetitionStatusEnum",
+    "Review",
+    "ReviewResult",
+    "SlugFacet",
+    "SlugLoadStrategyEnum",
     "SlugRepetition",
+    "SlugRepetitionSchema",
+    "deleted_repetitions",
+    "repetition_slug_association",
+    "repetition_titles",
+    "ArrayMatchEnum",
+    "LanguageEnum",
+    "PartOfSpeachEnum",
+    "WordArrayFieldEnum",
+    "WordRepetition",
+    "WordRepetitionSchema",
+    "ImportReport",
+    "ImportRowError",
     "MD",
+    "MDSchema",
+    "MarkdownBlock",
+    "MarkdownDigest",
     "Code",
     "List",
     "Quote",
@@ -16,4 +72,5 @@ __all__ = [
     "TextStyleEnum",
     "Heading",
     "Tag",
+    "TagSchema",
 ]
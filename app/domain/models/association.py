@@ -1,10 +1,32 @@
-from sqlalchemy import Column, ForeignKey, String, Table
+from sqlalchemy import Column, ForeignKey, Index, String, Table
 
 from app.infrastucture.db.base import Base
 
 repetition_slug_association = Table(
     "repetition_slug_association",
     Base.metadata,
-    Column("repetition_id", String(36), ForeignKey("repetitions.id")),
+    # No foreign key: `repetitions` is partitioned and `id` alone is not unique there.
+    Column("repetition_id", String(36)),
     Column("slug_id", String(36), ForeignKey("slug_repetitions.id")),
+    # Slug filters and facets probe by slug, loading the slugs of a page probes by repetition.
+    Index("ix_repetition_slug_association_slug_id_repetition_id", "slug_id", "repetition_id"),
+    Index("ix_repetition_slug_association_repetition_id_slug_id", "repetition_id", "slug_id"),
+)
+
+# Titles are unique across repetitions. A unique index on the partitioned `repetitions`
+# would have to include `date_repetition`, so every title is also claimed here in the
+# transaction which writes the repetition.
+repetition_titles = Table(
+    "repetition_titles",
+    Base.metadata,
+    Column("title", String, primary_key=True),
+)
+
+# Ids of deleted repetitions, written by the `record_deleted_repetition` trigger, so moving
+# a user to another shard can tell a repetition deleted on one side from one not copied yet.
+deleted_repetitions = Table(
+    "deleted_repetitions",
+    Base.metadata,
+    Column("id", String(36), primary_key=True),
+    Column("user_id", String, nullable=False, index=True),
 )
@@ -1,3 +1,4 @@
-from .md import MD
+from .block import MarkdownBlock, MarkdownDigest
+from .md import MD, MDSchema
 
-__all__ = ["MD"]
+__all__ = ["MD", "MDSchema", "MarkdownBlock", "MarkdownDigest"]
@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+from functools import cached_property
+from hashlib import blake2b
+
+import orjson
+
+HASH_SIZE = 16
+
+
+@dataclass(frozen=True)
+class MarkdownBlock:
+    """
+    One parsed block of a Markdown document, stored as a `Tag` row.
+
+    Attributes:
+        type (str): Polymorphic identity of the `Tag` subtype, e.g. `heading`.
+        start_pos (int): Offset of the first character of the block in the document.
+        end_pos (int): Offset after the last character of the block.
+        space_count (int): Indentation of the first line of the block.
+        content (str): The text of the block without its Markdown markers.
+        attributes (dict): Values of the columns of the `Tag` subtype, e.g. `level`.
+    """
+
+    type: str
+    start_pos: int
+    end_pos: int
+    space_count: int
+    content: str
+    attributes: dict = field(default_factory=dict)
+
+    @cached_property
+    def content_hash(self) -> str:
+        """
+        Digest of everything stored for the block except its position, so a block which
+        only moved within the document keeps its hash.
+        """
+        return blake2b(
+            orjson.dumps(
+                [self.type, self.space_count, self.content, self.attributes],
+                option=orjson.OPT_SORT_KEYS,
+            ),
+            digest_size=HASH_SIZE,
+        ).hexdigest()
+
+
+class MarkdownDigest:
+    """
+    Digest of a whole document built from its blocks in order, positions included, so it
+    changes whenever any stored tag would.
+    """
+
+    def __init__(self):
+        self._hash = blake2b(digest_size=HASH_SIZE)
+
+    def update(self, block: MarkdownBlock):
+        self._hash.update(
+            f"{block.content_hash}:{block.start_pos}:{block.end_pos};".encode()
+        )
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
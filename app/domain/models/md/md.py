@@ -1,15 +1,53 @@
-from uuid import uuid4
+from sqlalchemy import BigInteger, Column, String
+from sqlalchemy.orm import column_property, relationship
 
-from sqlalchemy import Column, String
-from sqlalchemy.orm import relationship
+from app.domain.models.repetition import (
+    Repetition,
+    RepetitionContentTypeEnum,
+    RepetitionSchema,
+)
 
-from app.infrastucture.db.base import Base
 
+class MD(Repetition):
+    """
+    A Markdown document studied as one repetition.
+
+    The document is stored as its blocks, the `Tag` rows, each knowing its length and
+    its distance from the block before, so an edit rewrites only the blocks it touched.
+    Their character ranges `[start_pos, end_pos)` are stored as well for the position
+    index, an edit which shifts them marks them stale and they are refreshed after it.
+
+    Attributes:
+        id (Column): Same id as the `repetitions` row.
+        content_hash (Column): `MarkdownDigest` of the document, to skip re-ingesting
+            an unchanged upload.
+        positions_stale_from (Column): Ordinal of the first tag whose stored range
+            is out of date, `None` when all of them are up to date.
+        tags (relationship): The blocks of the document ordered by position.
+    """
 
-class MD(Base):
     __tablename__ = "mds"
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
-    tags = relationship("Tag", back_populates="md", cascade="all, delete-orphan")
+    id = column_property(Column(String(36), primary_key=True), Repetition.id)
+    content_hash = Column(String(32), nullable=True)
+    positions_stale_from = Column(BigInteger, nullable=True)
+    tags = relationship(
+        "Tag",
+        back_populates="md",
+        cascade="all, delete-orphan",
+        order_by="Tag.ordinal",
+    )
+
+    # Joined to `repetitions` by `id` without a foreign key, `repetitions` is partitioned
+    # and `id` alone is not unique there.
+    __mapper_args__ = {
+        "inherit_condition": id.columns[0] == Repetition.id,
+        "inherit_foreign_keys": [id.columns[0]],
+        "polymorphic_identity": RepetitionContentTypeEnum.MD.value,
+    }
 
     def __repr__(self):
-        return f"MDRepetition(id={self.id})"
+        return f"MDRepetition(id={self.id}, title={self.title})"
+
+
+class MDSchema(RepetitionSchema):
+    pass
@@ -1,4 +1,4 @@
-from .base import Tag
+from .base import Tag, TagSchema
 from .tags import Code, Heading, List, Quote, Text, TextStyleEnum
 
 __all__ = [
@@ -9,4 +9,5 @@ __all__ = [
     "Text",
     "TextStyleEnum",
     "Tag",
+    "TagSchema",
 ]
@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 import sqlalchemy as db
+from pydantic import BaseModel
 from sqlalchemy.orm import relationship
 
 from app.infrastucture.db.base import Base
@@ -9,6 +10,12 @@ from app.infrastucture.db.base import Base
 class Tag(Base):
     __tablename__ = "tags"
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    # `TagPosition` of the tag: its order and where it is relative to the tag before.
+    ordinal = db.Column(db.BigInteger, nullable=False)
+    gap = db.Column(db.Integer, nullable=False)
+    length = db.Column(db.Integer, nullable=False)
+    # Offsets in the document, the running sums of `gap + length`. Re-ingests leave them
+    # behind from `MD.positions_stale_from` on until they are refreshed.
     start_pos = db.Column(db.Integer, nullable=False)
     end_pos = db.Column(db.Integer, nullable=False)
     md_id = db.Column(db.String(36), db.ForeignKey("mds.id"))
@@ -16,6 +23,26 @@ class Tag(Base):
     md = relationship("MD", back_populates="tags")
     content = db.Column(db.String, nullable=False)
     type = db.Column(db.String)
+    # `MarkdownBlock.content_hash` of the block, matched on re-ingest to keep unchanged tags.
+    content_hash = db.Column(db.String(32), nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_tags_md_id_start_pos", "md_id", "start_pos"),
+        # Serves "tags overlapping [a, b) in md X", needs the `btree_gist` extension.
+        db.Index(
+            "ix_tags_md_id_position",
+            md_id,
+            db.func.int4range(start_pos, end_pos),
+            postgresql_using="gist",
+        ),
+        # Covers the running sums of a document without reading the tags themselves.
+        db.Index(
+            "ix_tags_md_id_ordinal",
+            "md_id",
+            "ordinal",
+            postgresql_include=["gap", "length"],
+        ),
+    )
 
     __mapper_args__ = {
         "polymorphic_identity": "tag",
@@ -34,6 +61,22 @@ class Tag(Base):
             "start_pos": self.start_pos,
             "end_pos": self.end_pos,
             "md_id": self.md_id,
+            "space_count": self.space_count,
             "content": self.content,
             "type": self.type,
         }
+
+
+class TagSchema(BaseModel):
+    id: str
+    start_pos: int
+    end_pos: int
+    md_id: str
+    space_count: int | None = None
+    content: str
+    type: str
+    style: str | None = None
+    sup_quote: bool | None = None
+    level: int | None = None
+    ordered: bool | None = None
+    is_multiply: bool | None = None
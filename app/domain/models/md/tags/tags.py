@@ -41,10 +41,12 @@ class Text(Tag):
     def __repr__(self):
         return f"Text(id={self.id}, style={self.style})"
 
+    @property
     def to_json(self):
-        data = super().to_json()
-        data.update({"style": self.style})
-        return data
+        return {
+            **super().to_json,
+            "style": self.style,
+        }
 
 
 class Quote(Tag):
@@ -63,10 +65,12 @@ class Quote(Tag):
     def __repr__(self):
         return f"Quote(id={self.id}, sup_quote={self.sup_quote})"
 
+    @property
     def to_json(self):
-        data = super().to_json()
-        data.update({"sup_quote": self.sup_quote})
-        return data
+        return {
+            **super().to_json,
+            "sup_quote": self.sup_quote,
+        }
 
 
 class Heading(Tag):
@@ -85,10 +89,12 @@ class Heading(Tag):
     def __repr__(self):
         return f"Heading(id={self.id}, level={self.level})"
 
+    @property
     def to_json(self):
-        data = super().to_json()
-        data.update({"level": self.level})
-        return data
+        return {
+            **super().to_json,
+            "level": self.level,
+        }
 
 
 class List(Tag):
@@ -107,10 +113,12 @@ class List(Tag):
     def __repr__(self):
         return f"List(id={self.id}, ordered={self.ordered})"
 
+    @property
     def to_json(self):
-        data = super().to_json()
-        data.update({"ordered": self.ordered})
-        return data
+        return {
+            **super().to_json,
+            "ordered": self.ordered,
+        }
 
 
 class Code(Tag):
@@ -128,3 +136,10 @@ class Code(Tag):
 
     def __repr__(self):
         return f"Code(id={self.id}, is_multiply={self.is_multiply})"
+
+    @property
+    def to_json(self):
+        return {
+            **super().to_json,
+            "is_multiply": self.is_multiply,
+        }
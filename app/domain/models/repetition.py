@@ -1,14 +1,14 @@
 from uuid import uuid4
 import pendulum
-from sqlalchemy import Column, Integer, String, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Index, Integer, String, Enum as SQLEnum
+from sqlalchemy.orm import query_expression, relationship
 
 from pydantic import BaseModel
 from app.infrastucture.db.base import Base
 from app.domain.models.enum import EnumABC
 from app.infrastucture.db.base import ClassArgument
 
-from ..utils import repetition_formula
+from ..schedulers import get_scheduler
 from .association import repetition_slug_association
 from ..exceptions.external import UnknownFieldInsideEnum
 from app.domain.models.slug.slug import SlugRepetitionSchema
@@ -75,6 +75,10 @@ class Repetition(Base):
         slugs (Array[String]):
                 List of associated slugs
 
+        aggregated_slugs (JSON, Optional):
+                The slugs as a list of `{"id", "name"}` dicts, populated only when the query
+                aggregates them in place of loading `slugs`. `None` otherwise.
+
         content_type (String, Required):
             Specifies the type of content associated with the repetition.
             Possible values are defined in `RepetitionContentTypeEnum` (e.g., WORD, MD, TEXT).
@@ -117,23 +121,38 @@ class Repetition(Base):
         default=RepetitionContentTypeEnum.BASE.value,
     )
     count_repetition = Column(Integer, default=0)
+    # Part of the table's primary key because the table is range-partitioned by it,
+    # the mapper still identifies a repetition by `id` alone.
     date_repetition = Column(
         Integer,
+        primary_key=True,
         nullable=False,
         default=lambda: calc_date_repetition(),
     )
     slugs = relationship(
         "SlugRepetition",
         back_populates="repetitions",
-        primaryjoin="Repetition.id == repetition_slug_association.c.repetition_id",
-        secondaryjoin="SlugRepetition.id == repetition_slug_association.c.slug_id",
+        primaryjoin="Repetition.id == foreign(repetition_slug_association.c.repetition_id)",
+        secondaryjoin="SlugRepetition.id == foreign(repetition_slug_association.c.slug_id)",
         secondary=repetition_slug_association,
     )
-    title = Column(String, nullable=False, unique=True)
+    aggregated_slugs = query_expression()
+    title = Column(String, nullable=False, index=True)
     user_id = Column(String, nullable=False)
     date_last_repetition = Column(Integer, nullable=True)
 
+    __table_args__ = (
+        Index(
+            "ix_repetitions_user_id_date_repetition_id",
+            "user_id",
+            "date_repetition",
+            "id",
+        ),
+        {"postgresql_partition_by": "RANGE (date_repetition)"},
+    )
+
     __mapper_args__ = {
+        "primary_key": [id],
         "polymorphic_identity": RepetitionContentTypeEnum.BASE.value,
         "polymorphic_on": content_type,
     }
@@ -162,9 +181,7 @@ class Repetition(Base):
 
             If the associated `content` has a `to_json` method, its data is merged into the dictionary.
         """
-        unpacking_slugs = [
-            slug.to_json if hasattr(slug, "to_json") else slug for slug in self.slugs
-        ]
+        unpacking_slugs = self._json_value("slugs")
 
         return {
             "id": self.id,
@@ -179,6 +196,45 @@ class Repetition(Base):
             "user_id": self.user_id,
         }
 
+    def to_partial_json(self, fields: list[str]) -> dict:
+        """
+        Exports only the requested `fields` of `to_json`.
+
+        Unlike `to_json` it never touches attributes outside `fields`, so it is safe to call on
+        rows loaded with the remaining columns deferred. Fields unknown to the row's class are skipped.
+        """
+        known_fields = self.json_fields()
+        return {
+            field: self._json_value(field) for field in fields if field in known_fields
+        }
+
+    def _json_value(self, field: str):
+        if field == "slugs":
+            if self.aggregated_slugs is not None:
+                return self.aggregated_slugs
+            return [
+                slug.to_json if hasattr(slug, "to_json") else slug
+                for slug in self.slugs
+            ]
+        if field == "date_repetition":
+            return int(self.date_repetition)
+        if field == "date_last_repetition":
+            return int(self.date_last_repetition) if self.date_last_repetition else None
+        return getattr(self, field)
+
+    @classmethod
+    def json_fields(cls) -> list[str]:
+        return [
+            "id",
+            "content_type",
+            "count_repetition",
+            "date_repetition",
+            "date_last_repetition",
+            "title",
+            "slugs",
+            "user_id",
+        ]
+
     @classmethod
     def cls_arguments(cls) -> list[ClassArgument]:
         return [
@@ -196,7 +252,7 @@ class Repetition(Base):
         Updates the repetition schedule and counters based on the provided status.
 
         This method adjusts the `count_repetition` and calculates the next repetition time
-        (`date_repetition`) using the `repetition_formula` function. The update depends on whether
+        (`date_repetition`) using the configured scheduler. The update depends on whether
         the repetition was successful or not.
 
         Args:
@@ -211,7 +267,7 @@ class Repetition(Base):
             - Adjusts `count_repetition`:
                 - Increments by 1 if the status is SUCCESSFUL.
                 - Decrements by 1 if the status is unsuccessful, ensuring it doesn't fall below 0.
-            - Calculates the next repetition time in seconds using `repetition_formula`.
+            - Calculates the next repetition time in seconds using the configured scheduler.
             - Updates `date_repetition` based on the repetition status:
                 - Adds the calculated time if SUCCESSFUL.
                 - Subtracts the calculated time if unsuccessful.
@@ -224,7 +280,7 @@ class Repetition(Base):
             0,
             (
                 self.count_repetition + 1
-                if RepetitionStatusEnum.SUCCESSFUL
+                if repetition_status == RepetitionStatusEnum.SUCCESSFUL
                 else self.count_repetition - 1
             ),
         )
@@ -240,7 +296,7 @@ def calc_date_repetition(
     repetition_status: RepetitionStatusEnum = RepetitionStatusEnum.STARTING,
     date_repetition: int = int(pendulum.now().timestamp()),
 ) -> int:
-    repetition_time_in_seconds = repetition_formula(count_repetition)
+    repetition_time_in_seconds = get_scheduler().interval(count_repetition)
     match repetition_status:
         case RepetitionStatusEnum.STARTING | RepetitionStatusEnum.SUCCESSFUL:
             return date_repetition + repetition_time_in_seconds
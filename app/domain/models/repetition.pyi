@@ -47,6 +47,9 @@ class Repetition:
     def cls_arguments(cls) -> list[ClassArgument]: ...
     @property
     def to_json(self) -> Dict[str, Optional[int | str]]: ...
+    def to_partial_json(self, fields: list[str]) -> Dict[str, Optional[int | str]]: ...
+    @classmethod
+    def json_fields(cls) -> list[str]: ...
 
 class RepetitionSchema(BaseModel):
     id: str
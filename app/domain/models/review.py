@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+from ..exceptions.external import UnknownFieldInsideEnum
+from .repetition import RepetitionStatusEnum
+
+
+@dataclass(frozen=True)
+class Review:
+    """
+    One outcome of a review session, applied to the schedule of `repetition_id`.
+
+    Attributes:
+        repetition_id (str): The reviewed repetition.
+        repetition_status (RepetitionStatusEnum): `SUCCESSFUL` or `UNSUCCESSFUL`.
+        reviewed_at (int): Timestamp of the review, stored as `date_last_repetition`.
+    """
+
+    repetition_id: str
+    repetition_status: RepetitionStatusEnum
+    reviewed_at: int
+
+    @property
+    def step(self) -> int:
+        """
+        Returns `1` for a successful and `-1` for an unsuccessful review.
+        """
+        match self.repetition_status:
+            case RepetitionStatusEnum.SUCCESSFUL:
+                return 1
+            case RepetitionStatusEnum.UNSUCCESSFUL:
+                return -1
+            case _:
+                raise UnknownFieldInsideEnum(enum=RepetitionStatusEnum)
+
+
+@dataclass(frozen=True)
+class ReviewResult:
+    repetition_id: str
+    count_repetition: int
+    date_repetition: int
+
+    @property
+    def to_json(self):
+        return {
+            "id": self.repetition_id,
+            "count_repetition": self.count_repetition,
+            "date_repetition": self.date_repetition,
+        }
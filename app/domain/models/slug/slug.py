@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from uuid import uuid4
 
 from sqlalchemy import Column, String
@@ -5,10 +6,30 @@ from sqlalchemy.orm import relationship
 
 from app.infrastucture.db.base import Base
 from app.infrastucture.db.base import ClassArgument
+from app.domain.models.enum import EnumABC
 from ..association import repetition_slug_association
 from pydantic import BaseModel
 
 
+class SlugLoadStrategyEnum(str, EnumABC):
+    SELECTIN = "selectin"
+    AGGREGATE = "aggregate"
+
+    @classmethod
+    def fields(cls):
+        """
+        Returns all fields of the enum as a dictionary.
+
+        Returns:
+            dict: A dictionary with enum names as keys and values as enum values.
+        """
+        return {item.name: item.value for item in cls}
+
+    @classmethod
+    def get_name(self):
+        return "slugloadstrategyenum"
+
+
 class SlugRepetition(Base):
     """
     A class representing a model for handling `Slug` in the database.
@@ -55,8 +76,8 @@ class SlugRepetition(Base):
     repetitions = relationship(
         "Repetition",
         secondary=repetition_slug_association,
-        primaryjoin="SlugRepetition.id == repetition_slug_association.c.slug_id",
-        secondaryjoin="Repetition.id == repetition_slug_association.c.repetition_id",
+        primaryjoin="SlugRepetition.id == foreign(repetition_slug_association.c.slug_id)",
+        secondaryjoin="Repetition.id == foreign(repetition_slug_association.c.repetition_id)",
         back_populates="slugs",
     )
 
@@ -78,3 +99,16 @@ class SlugRepetition(Base):
 class SlugRepetitionSchema(BaseModel):
     id: str
     name: str
+
+
+@dataclass(frozen=True)
+class SlugFacet:
+    name: str
+    due: int
+
+    @property
+    def to_json(self):
+        return {
+            "name": self.name,
+            "due": self.due,
+        }
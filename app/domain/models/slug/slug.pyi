@@ -2,6 +2,16 @@ from dataclasses import dataclass
 from typing import Dict
 from app.domain.models.base import ClassArgument
 from pydantic import BaseModel
+from app.domain.models.enum import EnumABC
+
+class SlugLoadStrategyEnum(EnumABC):
+    SELECTIN: str
+    AGGREGATE: str
+
+    @classmethod
+    def fields(cls) -> dict[str, str]: ...
+    @classmethod
+    def get_name(self): ...
 
 @dataclass(kw_only=True)
 class SlugRepetition:
@@ -15,3 +25,10 @@ class SlugRepetition:
 class SlugRepetitionSchema(BaseModel):
     id: str
     name: str
+
+@dataclass(frozen=True)
+class SlugFacet:
+    name: str
+    due: int
+    @property
+    def to_json(self) -> Dict[str, str | int]: ...
@@ -1,13 +1,17 @@
 from .word_repetition import (
+    ArrayMatchEnum,
     LanguageEnum,
     PartOfSpeachEnum,
+    WordArrayFieldEnum,
     WordRepetition,
     WordRepetitionSchema,
 )
 
 __all__ = [
+    "ArrayMatchEnum",
     "LanguageEnum",
     "PartOfSpeachEnum",
+    "WordArrayFieldEnum",
     "WordRepetition",
     "WordRepetitionSchema",
 ]
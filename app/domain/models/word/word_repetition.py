@@ -1,4 +1,6 @@
-from sqlalchemy import ARRAY, Column, String, Enum as SQLEnum, ForeignKeyConstraint
+from sqlalchemy import Column, Index, String, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import column_property
 
 from pydantic import BaseModel
 from ..enum import EnumABC
@@ -54,6 +56,45 @@ class LanguageEnum(EnumABC):
         return "languageenum"
 
 
+class WordArrayFieldEnum(str, EnumABC):
+    TRANSLATE = "translate"
+    SYNONYMS = "synonyms"
+    POSSIBLE_OPTIONS = "possible_options"
+
+    @classmethod
+    def fields(cls):
+        """
+        Returns all fields of the enum as a dictionary.
+
+        Returns:
+            dict: A dictionary with enum names as keys and values as enum values.
+        """
+        return {item.name: item.value for item in cls}
+
+    @classmethod
+    def get_name(self):
+        return "wordarrayfieldenum"
+
+
+class ArrayMatchEnum(str, EnumABC):
+    CONTAINS = "contains"
+    OVERLAP = "overlap"
+
+    @classmethod
+    def fields(cls):
+        """
+        Returns all fields of the enum as a dictionary.
+
+        Returns:
+            dict: A dictionary with enum names as keys and values as enum values.
+        """
+        return {item.name: item.value for item in cls}
+
+    @classmethod
+    def get_name(self):
+        return "arraymatchenum"
+
+
 class WordRepetition(Repetition):
     from app.domain.models.repetition import RepetitionContentTypeEnum
 
@@ -93,7 +134,7 @@ class WordRepetition(Repetition):
     """
 
     __tablename__ = "word_repetitions"
-    id = Column(String(36), primary_key=True)
+    id = column_property(Column(String(36), primary_key=True), Repetition.id)
     word = Column(String, unique=True, nullable=False)
     translate = Column(ARRAY(String), nullable=True)
     synonyms = Column(ARRAY(String), nullable=True)
@@ -120,13 +161,16 @@ class WordRepetition(Repetition):
     possible_options = Column(ARRAY(String), nullable=True)
     image_url = Column(String, nullable=True)
 
-    __table_args__ = (
-        ForeignKeyConstraint(
-            ["id"], ["repetitions.id"], name="fk_word_repetitions_repetition_id"
-        ),
+    __table_args__ = tuple(
+        Index(f"ix_word_repetitions_{field.value}", field.value, postgresql_using="gin")
+        for field in WordArrayFieldEnum
     )
 
+    # Joined to `repetitions` by `id` without a foreign key, `repetitions` is partitioned
+    # and `id` alone is not unique there.
     __mapper_args__ = {
+        "inherit_condition": id.columns[0] == Repetition.id,
+        "inherit_foreign_keys": [id.columns[0]],
         "polymorphic_identity": RepetitionContentTypeEnum.WORD.value,
     }
 
@@ -149,6 +193,21 @@ class WordRepetition(Repetition):
             **super().to_json,
         }
 
+    @classmethod
+    def json_fields(cls) -> list[str]:
+        return [
+            "word",
+            "translate",
+            "synonyms",
+            "part_of_speech",
+            "examples",
+            "language",
+            "context",
+            "possible_options",
+            "image_url",
+            *super().json_fields(),
+        ]
+
     @classmethod
     def cls_arguments(cls) -> list[ClassArgument]:
         return [
@@ -29,6 +29,25 @@ class LanguageEnum(EnumABC):
     @classmethod
     def get_name(self): ...
 
+class WordArrayFieldEnum(EnumABC):
+    TRANSLATE: str
+    SYNONYMS: str
+    POSSIBLE_OPTIONS: str
+
+    @classmethod
+    def fields(cls) -> dict[str, str]: ...
+    @classmethod
+    def get_name(self): ...
+
+class ArrayMatchEnum(EnumABC):
+    CONTAINS: str
+    OVERLAP: str
+
+    @classmethod
+    def fields(cls) -> dict[str, str]: ...
+    @classmethod
+    def get_name(self): ...
+
 class WordRepetition:
     def __init__(
         self,
@@ -46,6 +65,8 @@ class WordRepetition:
     @property
     def to_json(self) -> dict[str, any]: ...
     @classmethod
+    def json_fields(cls) -> list[str]: ...
+    @classmethod
     def cls_arguments(cls) -> list[str]: ...
 
 class WordRepetitionSchema:
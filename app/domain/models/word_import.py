@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ImportRowError:
+    line: int
+    message: str
+
+    @property
+    def to_json(self):
+        return {
+            "line": self.line,
+            "message": self.message,
+        }
+
+
+@dataclass
+class ImportReport:
+    """
+    Outcome of a bulk import: how many rows were created and why every other row was not.
+    """
+
+    imported: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+    @property
+    def to_json(self):
+        return {
+            "imported": self.imported,
+            "failed": len(self.errors),
+            "errors": [error.to_json for error in self.errors],
+        }
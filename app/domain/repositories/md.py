@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from ..models import MD, MarkdownBlock, Tag
+from ..services.md_diff import StoredTag, TagPosition
+
+
+@dataclass(eq=False, frozen=True)
+class MDRepository(ABC):
+    @abstractmethod
+    async def get_md(
+        user_id: str,
+        md_id: str,
+        for_update: bool = False,
+    ) -> Optional[MD]: ...
+
+    @abstractmethod
+    async def get_md_tags(
+        user_id: str,
+        md_id: str,
+    ) -> list[Tag]: ...
+
+    @abstractmethod
+    async def get_md_tags_in_range(
+        user_id: str,
+        md_id: str,
+        start_pos: int,
+        end_pos: Optional[int] = None,
+    ) -> list[Tag]: ...
+
+    @abstractmethod
+    async def insert_md_tags(
+        md_id: str,
+        blocks: list[MarkdownBlock],
+        positions: list[TagPosition],
+    ) -> int: ...
+
+    @abstractmethod
+    async def get_md_tag_hashes(
+        md_id: str,
+    ) -> list[StoredTag]: ...
+
+    @abstractmethod
+    async def delete_md_tags(
+        md_id: str,
+        ids: list[str],
+    ) -> int: ...
+
+    @abstractmethod
+    async def move_md_tags(
+        md_id: str,
+        positions: dict[str, TagPosition],
+    ) -> int: ...
+
+    @abstractmethod
+    async def refresh_md_tag_positions(
+        md_id: str,
+        stale_from: int,
+    ) -> int: ...
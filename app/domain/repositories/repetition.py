@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import AsyncIterator, List, Optional
 
 from ..models import (
+    ArrayMatchEnum,
     Repetition,
     WordRepetition,
     RepetitionContentTypeEnum,
+    SlugFacet,
+    SlugLoadStrategyEnum,
+    SlugRepetition,
     PartOfSpeachEnum,
     LanguageEnum,
+    WordArrayFieldEnum,
 )
 from ..models.type import DateType
 
@@ -16,12 +21,68 @@ from ..models.type import DateType
 class RepetitionRepository(ABC):
     @abstractmethod
     async def get_all_repetitions(
+        user_id: str,
         start_date: DateType,
         end_date: DateType,
         limit: int,
         offset: int,
+        after: Optional[tuple[int, str]] = None,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+        slugs: Optional[list[str]] = None,
     ) -> List[Repetition]: ...
 
+    @abstractmethod
+    def stream_repetitions(
+        user_id: str,
+        start_date: DateType,
+        end_date: DateType,
+        chunk_size: int = 1000,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+        slugs: Optional[list[str]] = None,
+    ) -> AsyncIterator[Repetition]: ...
+
+    @abstractmethod
+    async def count_due_by_slug(
+        user_id: str,
+        start_date: DateType,
+        end_date: DateType,
+    ) -> list[SlugFacet]: ...
+
+    @abstractmethod
+    async def search_word_repetitions(
+        user_id: str,
+        query: str,
+        limit: int,
+        offset: int,
+        language: Optional[LanguageEnum] = None,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    ) -> List[WordRepetition]: ...
+
+    @abstractmethod
+    async def find_word_repetitions_by_array(
+        user_id: str,
+        field: WordArrayFieldEnum,
+        values: list[str],
+        match: ArrayMatchEnum,
+        limit: int,
+        offset: int,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    ) -> List[WordRepetition]: ...
+
+    @abstractmethod
+    async def get_related_word_repetitions(
+        user_id: str,
+        repetition_ids: list[str],
+        field: WordArrayFieldEnum,
+        limit: int,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    ) -> dict[str, list[WordRepetition]]: ...
+
     @abstractmethod
     async def update_repetition(
         repetition_id: str,
@@ -50,7 +111,11 @@ class RepetitionRepository(ABC):
     ) -> WordRepetition: ...
 
     @abstractmethod
-    async def successful_repetition(repetition_id: str) -> bool: ...
+    async def resolve_slugs(
+        names: Optional[list[str]],
+    ) -> list[SlugRepetition]: ...
 
     @abstractmethod
-    async def unsuccessful_repetition(repetition_id: str) -> bool: ...
+    async def get_or_create_slug_ids(
+        names: list[str],
+    ) -> dict[str, str]: ...
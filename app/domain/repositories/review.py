@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from ..models import Review, ReviewResult
+
+
+@dataclass(eq=False, frozen=True)
+class ReviewRepository(ABC):
+    @abstractmethod
+    async def review_repetition(
+        user_id: str,
+        review: Review,
+    ) -> ReviewResult: ...
+
+    @abstractmethod
+    async def apply_reviews(
+        user_id: str,
+        reviews: list[Review],
+    ) -> list[ReviewResult]: ...
+
+    @abstractmethod
+    async def successful_repetition(
+        user_id: str,
+        repetition_id: str,
+    ) -> ReviewResult: ...
+
+    @abstractmethod
+    async def unsuccessful_repetition(
+        user_id: str,
+        repetition_id: str,
+    ) -> ReviewResult: ...
+
+    @abstractmethod
+    async def get_schedule_state(
+        due_before: int,
+        user_id: Optional[str] = None,
+        chunk_size: int = 100_000,
+    ) -> tuple[np.ndarray, np.ndarray]: ...
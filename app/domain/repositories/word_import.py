@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from ..models import ImportReport
+
+
+@dataclass(eq=False, frozen=True)
+class WordImportRepository(ABC):
+    @abstractmethod
+    async def import_word_repetitions(
+        user_id: str,
+        rows: list[tuple[int, dict | Exception]],
+    ) -> ImportReport: ...
@@ -0,0 +1,87 @@
+import inspect
+import operator
+from functools import cache
+
+from app.config import global_config
+
+from .base import Scheduler, SchedulerAlgorithmEnum, TabulatedScheduler
+from .fsrs import FSRSScheduler
+from .linear import LinearScheduler
+from .sm2 import SM2Scheduler
+
+BOUND_OPERATORS = {
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+}
+
+SCHEDULERS: dict[SchedulerAlgorithmEnum, type[Scheduler]] = {
+    SchedulerAlgorithmEnum.LINEAR: LinearScheduler,
+    SchedulerAlgorithmEnum.SM2: SM2Scheduler,
+    SchedulerAlgorithmEnum.FSRS: FSRSScheduler,
+}
+
+
+@cache
+def get_scheduler(
+    algorithm: SchedulerAlgorithmEnum | str | None = None,
+) -> Scheduler:
+    """
+    Returns the scheduler of `algorithm`, the one configured by `GlobalConfig.SCHEDULER` by default.
+    """
+    return build_scheduler(algorithm or global_config.SCHEDULER)
+
+
+def build_scheduler(
+    algorithm: SchedulerAlgorithmEnum | str,
+    **parameters: float,
+) -> Scheduler:
+    """
+    Builds a new scheduler of `algorithm` with non-default `parameters`,
+    e.g. `rate` and `post_rate` for `LINEAR` or `ease_factor` for `SM2`.
+
+    Raises:
+        UnknownSchedulerParameter: If `algorithm` does not accept one of `parameters`.
+        InvalidSchedulerParameter: If a parameter is outside its `parameter_bounds`.
+    """
+    # Imported here: the exceptions import the models, which import this package.
+    from app.domain.exceptions.external import (
+        InvalidSchedulerParameter,
+        UnknownSchedulerParameter,
+    )
+
+    algorithm = SchedulerAlgorithmEnum(algorithm)
+    scheduler_class = SCHEDULERS[algorithm]
+
+    possible_parameters = list(inspect.signature(scheduler_class).parameters)
+    unknown_parameters = [key for key in parameters if key not in possible_parameters]
+    if unknown_parameters:
+        raise UnknownSchedulerParameter(
+            algorithm=algorithm.value,
+            parameters=unknown_parameters,
+            possible_parameters=possible_parameters,
+        )
+
+    for key, value in parameters.items():
+        bounds = scheduler_class.parameter_bounds.get(key, {})
+        if not all(
+            BOUND_OPERATORS[name](value, bound) for name, bound in bounds.items()
+        ):
+            raise InvalidSchedulerParameter(
+                algorithm=algorithm.value, parameter=key, value=value, bounds=bounds
+            )
+
+    return scheduler_class(**parameters)
+
+
+__all__ = [
+    "FSRSScheduler",
+    "LinearScheduler",
+    "SM2Scheduler",
+    "Scheduler",
+    "SchedulerAlgorithmEnum",
+    "TabulatedScheduler",
+    "build_scheduler",
+    "get_scheduler",
+]
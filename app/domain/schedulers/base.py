@@ -0,0 +1,147 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Iterator
+
+import numpy as np
+from numpy.typing import ArrayLike
+from sqlalchemy import ColumnElement, case
+
+from ..utils.repetition_math import (
+    FORTY_MINUTES_IN_SECONDS,
+    ONE_DAY_IN_SECONDS,
+    update_repetition_schedule_batch,
+)
+
+
+class SchedulerAlgorithmEnum(str, Enum):
+    """Enumeration of the available scheduling algorithms."""
+
+    LINEAR = "LINEAR"
+    SM2 = "SM2"
+    FSRS = "FSRS"
+
+    @classmethod
+    def fields(cls):
+        """
+        Returns all fields of the enum as a dictionary.
+
+        Returns:
+            dict: A dictionary with enum names as keys and values as enum values.
+        """
+        return {item.name: item.value for item in cls}
+
+
+class Scheduler(ABC):
+    """
+    Maps the number of successful repetitions of a card to the interval in seconds
+    until its next repetition.
+
+    Every scheduler exposes the same interval three ways which must agree exactly:
+    a scalar `interval`, a vectorized `interval_batch` for arrays of cards and an
+    `interval_expression` for set-based updates inside Postgres.
+    """
+
+    algorithm: SchedulerAlgorithmEnum
+    # Accepted values of the tunable parameters as `Query` style `gt`, `ge`, `lt` and
+    # `le` bounds, checked by `build_scheduler`.
+    parameter_bounds: dict[str, dict[str, float]] = {}
+
+    @abstractmethod
+    def interval(self, count_repetition: int) -> int: ...
+
+    @abstractmethod
+    def interval_batch(self, count_repetition: ArrayLike) -> np.ndarray: ...
+
+    @abstractmethod
+    def interval_expression(
+        self, count_repetition: ColumnElement[int]
+    ) -> ColumnElement[int]: ...
+
+    def update_schedule_batch(
+        self,
+        count_repetition: ArrayLike,
+        repetition_status: ArrayLike,
+        date_repetition: ArrayLike,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized `Repetition.update_repetition_schedule` driven by this scheduler.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The new `count_repetition` and `date_repetition` arrays.
+        """
+        return update_repetition_schedule_batch(
+            count_repetition,
+            repetition_status,
+            date_repetition,
+            formula_batch=self.interval_batch,
+        )
+
+    @staticmethod
+    def _validate_count(count_repetition: int):
+        if not isinstance(count_repetition, int) or count_repetition < 0:
+            raise ValueError("Attr count_repetition must be a non-negative integer!")
+
+    @staticmethod
+    def _validate_counts(count_repetition: ArrayLike) -> np.ndarray:
+        counts = np.asarray(count_repetition)
+        if not np.issubdtype(counts.dtype, np.integer) or (counts < 0).any():
+            raise ValueError("Attr count_repetition must hold non-negative integers!")
+        return counts
+
+
+class TabulatedScheduler(Scheduler):
+    """
+    Base for schedulers whose intervals grow until they saturate at `maximum_interval_days`.
+
+    The whole curve is computed once into a table of seconds per counter. The scalar,
+    batch and SQL paths all read that table, so they are identical by construction and
+    the batch path is a single array lookup. Counter `0` keeps the common forty minutes step.
+    The cap also keeps `date_repetition`, an `INTEGER` column, inside the int4 range.
+    """
+
+    maximum_interval_days: float
+    maximum_table_size: int = 1024
+
+    def __init__(self):
+        self._intervals = self._tabulate()
+
+    @abstractmethod
+    def _iter_interval_days(self) -> Iterator[float]:
+        """
+        Yields the interval in days for counters `1, 2, 3, ...`.
+        """
+
+    def _tabulate(self) -> np.ndarray:
+        maximum_interval = int(self.maximum_interval_days * ONE_DAY_IN_SECONDS)
+        intervals = [FORTY_MINUTES_IN_SECONDS]
+
+        for days in self._iter_interval_days():
+            interval = min(int(days * ONE_DAY_IN_SECONDS), maximum_interval)
+            intervals.append(interval)
+            if (
+                interval == maximum_interval
+                or len(intervals) == self.maximum_table_size
+            ):
+                break
+
+        return np.array(intervals, dtype=np.int64)
+
+    def interval(self, count_repetition: int) -> int:
+        self._validate_count(count_repetition)
+        return int(self._intervals[min(count_repetition, len(self._intervals) - 1)])
+
+    def interval_batch(self, count_repetition: ArrayLike) -> np.ndarray:
+        counts = self._validate_counts(count_repetition)
+        return self._intervals[np.minimum(counts, len(self._intervals) - 1)]
+
+    def interval_expression(
+        self, count_repetition: ColumnElement[int]
+    ) -> ColumnElement[int]:
+        return case(
+            {
+                count: int(interval)
+                for count, interval in enumerate(self._intervals[:-1])
+            },
+            value=count_repetition,
+            else_=int(self._intervals[-1]),
+        )
@@ -0,0 +1,67 @@
+import math
+from typing import Iterator
+
+from ..utils.repetition_math import MAXIMUM_INTERVAL_DAYS
+from .base import SchedulerAlgorithmEnum, TabulatedScheduler
+
+# Default FSRS-4.5 weights.
+FSRS_WEIGHTS = (
+    0.4872,
+    1.4003,
+    3.7145,
+    13.8206,
+    5.1618,
+    1.2298,
+    0.8975,
+    0.031,
+    1.6474,
+    0.1367,
+    1.0461,
+    2.1072,
+    0.0793,
+    0.3246,
+    1.587,
+    0.2272,
+    2.8755,
+)
+DECAY = -0.5
+FACTOR = 19 / 81
+
+
+class FSRSScheduler(TabulatedScheduler):
+    """
+    FSRS-style intervals: the memory stability of a card grows after every successful
+    repetition and the next repetition is scheduled when the predicted recall probability
+    drops to `desired_retention`.
+
+    Only `count_repetition` is stored per card, so stability and difficulty are derived
+    from it as for a card answered "good" on every review at the scheduled time.
+    """
+
+    algorithm = SchedulerAlgorithmEnum.FSRS
+    parameter_bounds = {"desired_retention": {"gt": 0, "lt": 1}}
+
+    def __init__(
+        self,
+        desired_retention: float = 0.9,
+        maximum_interval_days: float = MAXIMUM_INTERVAL_DAYS,
+        weights: tuple[float, ...] = FSRS_WEIGHTS,
+    ):
+        self.desired_retention = desired_retention
+        self.maximum_interval_days = maximum_interval_days
+        self.weights = weights
+        super().__init__()
+
+    def _iter_interval_days(self) -> Iterator[float]:
+        w = self.weights
+        difficulty = w[4]
+        stability = w[2]
+
+        while True:
+            yield stability / FACTOR * (self.desired_retention ** (1 / DECAY) - 1)
+            stability *= 1 + (
+                math.exp(w[8])
+                * (11 - difficulty)
+                * stability ** -w[9]
+                * (math.exp(w[10] * (1 - self.desired_retention)) - 1)
+            )
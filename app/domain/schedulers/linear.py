@@ -0,0 +1,73 @@
+import numpy as np
+from numpy.typing import ArrayLike
+from sqlalchemy import ColumnElement, Float, Integer, case, cast, func, literal
+
+from ..utils.repetition_math import (
+    FORTY_MINUTES_IN_SECONDS,
+    MAXIMUM_INTERVAL_DAYS,
+    ONE_DAY_IN_SECONDS,
+    REPETITION_POST_RATE,
+    REPETITION_RATE,
+    repetition_formula,
+    repetition_formula_batch,
+)
+from .base import Scheduler, SchedulerAlgorithmEnum
+
+
+class LinearScheduler(Scheduler):
+    """
+    The original Ebbinghaus-style rule: `(rate * count + post_rate)` days up to
+    `maximum_interval_days`, forty minutes for a card which was never repeated.
+    """
+
+    algorithm = SchedulerAlgorithmEnum.LINEAR
+    # Past `MAXIMUM_INTERVAL_DAYS` every interval is capped anyway.
+    parameter_bounds = {
+        "rate": {"ge": 0, "le": MAXIMUM_INTERVAL_DAYS},
+        "post_rate": {"gt": 0, "le": MAXIMUM_INTERVAL_DAYS},
+    }
+
+    def __init__(
+        self,
+        rate: float = REPETITION_RATE,
+        post_rate: float = REPETITION_POST_RATE,
+        maximum_interval_days: float = MAXIMUM_INTERVAL_DAYS,
+    ):
+        self.rate = rate
+        self.post_rate = post_rate
+        self.maximum_interval_days = maximum_interval_days
+
+    def interval(self, count_repetition: int) -> int:
+        return repetition_formula(
+            count_repetition, self.rate, self.post_rate, self.maximum_interval_days
+        )
+
+    def interval_batch(self, count_repetition: ArrayLike) -> np.ndarray:
+        return repetition_formula_batch(
+            count_repetition, self.rate, self.post_rate, self.maximum_interval_days
+        )
+
+    def interval_expression(
+        self, count_repetition: ColumnElement[int]
+    ) -> ColumnElement[int]:
+        """
+        The product is computed in double precision like the Python float arithmetic,
+        capped and truncated before the cast, because casting a double to integer in
+        Postgres rounds and raises past the int4 range.
+        """
+        return case(
+            (count_repetition == 0, FORTY_MINUTES_IN_SECONDS),
+            else_=cast(
+                func.least(
+                    func.trunc(
+                        (
+                            literal(self.rate, Float) * count_repetition
+                            + literal(self.post_rate, Float)
+                        )
+                        * ONE_DAY_IN_SECONDS
+                    ),
+                    int(self.maximum_interval_days * ONE_DAY_IN_SECONDS),
+                ),
+                Integer,
+            ),
+        )
@@ -0,0 +1,33 @@
+from typing import Iterator
+
+from ..utils.repetition_math import MAXIMUM_INTERVAL_DAYS
+from .base import SchedulerAlgorithmEnum, TabulatedScheduler
+
+
+class SM2Scheduler(TabulatedScheduler):
+    """
+    SuperMemo-2 intervals: 1 day after the first successful repetition, 6 days after the
+    second and the previous interval multiplied by `ease_factor` after every next one.
+
+    Only `count_repetition` is stored per card, so the ease factor is one value for the
+    whole deployment instead of being adjusted per card by the answer quality.
+    """
+
+    algorithm = SchedulerAlgorithmEnum.SM2
+    parameter_bounds = {"ease_factor": {"ge": 1, "le": MAXIMUM_INTERVAL_DAYS}}
+
+    def __init__(
+        self,
+        ease_factor: float = 2.5,
+        maximum_interval_days: float = MAXIMUM_INTERVAL_DAYS,
+    ):
+        self.ease_factor = ease_factor
+        self.maximum_interval_days = maximum_interval_days
+        super().__init__()
+
+    def _iter_interval_days(self) -> Iterator[float]:
+        yield 1
+        days = 6
+        while True:
+            yield days
+            days *= self.ease_factor
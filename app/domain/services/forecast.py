@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ..schedulers import Scheduler, get_scheduler
+from ..utils.repetition_math import (
+    ONE_DAY_IN_SECONDS,
+    STATUS_SUCCESSFUL,
+    STATUS_UNSUCCESSFUL,
+)
+
+
+@dataclass(frozen=True)
+class ForecastDay:
+    date: int
+    due: int
+    successful: int
+    unsuccessful: int
+
+    @property
+    def to_json(self):
+        return {
+            "date": self.date,
+            "due": self.due,
+            "successful": self.successful,
+            "unsuccessful": self.unsuccessful,
+        }
+
+
+@dataclass
+class WorkloadSimulation:
+    """
+    Monte Carlo forecast of the daily review workload.
+
+    Every simulated day each card due before the end of the day is reviewed once,
+    succeeds with `success_probability` and is rescheduled by `scheduler` exactly like
+    `Repetition.update_repetition_schedule` would do it. The whole day is one vectorized
+    step over the due cards, so the cost is `days` passes over the loaded arrays.
+
+    Attributes:
+        scheduler (Scheduler): The interval curve to simulate, the configured one by default.
+        success_probability (float): Chance of a successful review, between 0 and 1.
+        seed (Optional[int]): Seed of the random generator, for reproducible forecasts.
+    """
+
+    scheduler: Scheduler = field(default_factory=get_scheduler)
+    success_probability: float = 0.9
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if not 0 <= self.success_probability <= 1:
+            raise ValueError("Attr success_probability must be between 0 and 1!")
+
+    def run(
+        self,
+        count_repetition: ArrayLike,
+        date_repetition: ArrayLike,
+        start: int,
+        days: int,
+    ) -> list[ForecastDay]:
+        """
+        Simulates `days` days starting at the `start` timestamp.
+
+        Cards already overdue at `start` are due on the first day. Cards scheduled after
+        the last simulated day can never become due, so they are dropped up front.
+
+        Returns:
+            list[ForecastDay]: One entry per simulated day.
+        """
+        if days < 1:
+            raise ValueError("Attr days must be a positive integer!")
+
+        horizon = start + days * ONE_DAY_IN_SECONDS
+        counts = np.asarray(count_repetition, dtype=np.int64)
+        dates = np.asarray(date_repetition, dtype=np.int64)
+        in_horizon = dates < horizon
+        counts, dates = counts[in_horizon], dates[in_horizon]
+
+        rng = np.random.default_rng(self.seed)
+        forecast = []
+
+        for day in range(days):
+            day_start = start + day * ONE_DAY_IN_SECONDS
+            due = np.flatnonzero(dates < day_start + ONE_DAY_IN_SECONDS)
+
+            statuses = np.where(
+                rng.random(due.size) < self.success_probability,
+                STATUS_SUCCESSFUL,
+                STATUS_UNSUCCESSFUL,
+            )
+            counts[due], dates[due] = self.scheduler.update_schedule_batch(
+                counts[due], statuses, dates[due]
+            )
+
+            successful = int(np.count_nonzero(statuses == STATUS_SUCCESSFUL))
+            forecast.append(
+                ForecastDay(
+                    date=day_start,
+                    due=int(due.size),
+                    successful=successful,
+                    unsuccessful=int(due.size) - successful,
+                )
+            )
+
+        return forecast
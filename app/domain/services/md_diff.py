@@ -0,0 +1,181 @@
+from dataclasses import dataclass, field, replace
+from difflib import SequenceMatcher
+from typing import Optional
+
+from app.domain.models import MarkdownBlock
+
+# Ordinals of a freshly stored document are this far apart, so blocks inserted between
+# two tags later get ordinals in between without renumbering either of them.
+ORDINAL_STEP = 1 << 32
+
+
+@dataclass(frozen=True)
+class TagPosition:
+    """
+    Position of a tag, stored relative to the tag before it, so a block which grows,
+    shrinks, appears or disappears leaves the stored positions of the others as they are.
+    Offsets in the document are the running sums of `gap + length` in `ordinal` order.
+
+    Attributes:
+        ordinal (int): Order of the tag in its document.
+        gap (int): Characters between the end of the previous tag and the start of this one.
+        length (int): Characters of the tag, `end_pos - start_pos`.
+    """
+
+    ordinal: int
+    gap: int
+    length: int
+
+
+class TagLayout:
+    """
+    Positions of the blocks of a document fed in order, `ORDINAL_STEP` apart.
+    """
+
+    def __init__(self):
+        self._count = 0
+        self._end_pos = 0
+
+    def place(self, block: MarkdownBlock) -> TagPosition:
+        position = TagPosition(
+            ordinal=self._count * ORDINAL_STEP,
+            gap=block.start_pos - self._end_pos,
+            length=block.end_pos - block.start_pos,
+        )
+        self._count += 1
+        self._end_pos = block.end_pos
+        return position
+
+
+@dataclass(frozen=True)
+class StoredTag:
+    """
+    A stored tag with its stored offset `start_pos`, which lags behind its position
+    while the offsets of its document are stale.
+    """
+
+    id: str
+    content_hash: str | None
+    position: TagPosition
+    start_pos: int
+
+
+@dataclass(frozen=True)
+class ParsedTag:
+    content_hash: str
+    position: TagPosition
+    start_pos: int
+
+
+@dataclass
+class MDTagDiff:
+    """
+    Changes turning the stored tags of a document into a new parse of it.
+
+    Attributes:
+        deleted_ids (list[str]): Stored tags without a match in the new parse.
+        inserted (dict[int, TagPosition]): Indexes of the parsed blocks without a stored
+            match, with the position to store them at.
+        moved (dict[str, TagPosition]): Matched tags whose stored position changed,
+            usually just the first tag after each edit, whose gap did.
+        unchanged (int): Number of matched tags, moved or not.
+        stale_from (Optional[int]): Ordinal of the first matched tag whose stored
+            offsets are no longer those of the new parse, `None` when all of them are.
+    """
+
+    deleted_ids: list[str] = field(default_factory=list)
+    inserted: dict[int, TagPosition] = field(default_factory=dict)
+    moved: dict[str, TagPosition] = field(default_factory=dict)
+    unchanged: int = 0
+    stale_from: Optional[int] = None
+
+    @property
+    def to_json(self):
+        return {
+            "inserted": len(self.inserted),
+            "deleted": len(self.deleted_ids),
+            "moved": len(self.moved),
+            "unchanged": self.unchanged,
+        }
+
+
+def diff_md_tags(stored: list[StoredTag], parsed: list[ParsedTag]) -> MDTagDiff:
+    """
+    Matches `stored`, ordered by ordinal, and `parsed`, in document order, by their
+    content hashes with `difflib.SequenceMatcher`. Matched tags keep their id and
+    ordinal, new blocks get ordinals between their stored neighbours, so the writes are
+    proportional to the blocks which changed whatever the size of the document.
+
+    When neighbours have no ordinal left in between, every tag is renumbered instead.
+    Tags stored without a hash never match and are replaced.
+
+    Stored offsets of matched tags are compared but not rewritten, `stale_from` tells
+    from which tag on they have to be refreshed.
+    """
+    matcher = SequenceMatcher(
+        None,
+        [tag.content_hash or f"missing:{tag.id}" for tag in stored],
+        [tag.content_hash for tag in parsed],
+        autojunk=False,
+    )
+    opcodes = matcher.get_opcodes()
+    return _diff(stored, parsed, opcodes) or _diff(stored, parsed, opcodes, renumber=True)
+
+
+def _diff(
+    stored: list[StoredTag],
+    parsed: list[ParsedTag],
+    opcodes: list[tuple[str, int, int, int, int]],
+    renumber: bool = False,
+) -> Optional[MDTagDiff]:
+    diff = MDTagDiff()
+    for opcode, old_from, old_to, new_from, new_to in opcodes:
+        if opcode != "equal":
+            diff.deleted_ids.extend(tag.id for tag in stored[old_from:old_to])
+            if renumber:
+                ordinals = [tag.position.ordinal for tag in parsed[new_from:new_to]]
+            else:
+                ordinals = _ordinals_between(
+                    stored[old_from - 1].position.ordinal if old_from else None,
+                    stored[old_to].position.ordinal if old_to < len(stored) else None,
+                    new_to - new_from,
+                )
+            if ordinals is None:
+                return None
+            for index, ordinal in zip(range(new_from, new_to), ordinals):
+                diff.inserted[index] = replace(parsed[index].position, ordinal=ordinal)
+            continue
+
+        diff.unchanged += old_to - old_from
+        for old, new in zip(stored[old_from:old_to], parsed[new_from:new_to]):
+            position = (
+                new.position
+                if renumber
+                else replace(new.position, ordinal=old.position.ordinal)
+            )
+            if position != old.position:
+                diff.moved[old.id] = position
+            if diff.stale_from is None and (
+                old.start_pos != new.start_pos or old.position.length != new.position.length
+            ):
+                diff.stale_from = position.ordinal
+    return diff
+
+
+def _ordinals_between(
+    lower: Optional[int], upper: Optional[int], count: int
+) -> Optional[list[int]]:
+    """
+    `count` ordinals spread between `lower` and `upper`, either of which may be open,
+    or `None` when there is no room for them.
+    """
+    if upper is None:
+        start = -ORDINAL_STEP if lower is None else lower
+        return [start + ORDINAL_STEP * (index + 1) for index in range(count)]
+    if lower is None:
+        return [upper - ORDINAL_STEP * (count - index) for index in range(count)]
+
+    step = (upper - lower) // (count + 1)
+    if not step:
+        return None
+    return [lower + step * (index + 1) for index in range(count)]
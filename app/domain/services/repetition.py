@@ -6,6 +6,7 @@ from app.domain.models.slug.slug import SlugRepetition
 
 from ..exceptions.external import DontPassTheMandatoryKey, UnknownFieldInsideEnum
 from ..models import (
+    MD,
     LanguageEnum,
     PartOfSpeachEnum,
     RepetitionContentTypeEnum,
@@ -13,6 +14,9 @@ from ..models import (
 )
 from ..utils import handle_arguments
 
+IMPORT_LIST_FIELDS = ("translate", "synonyms", "examples", "possible_options", "slugs")
+IMPORT_LIST_SEPARATOR = "|"
+
 
 @dataclass
 class RepetitionServices:
@@ -20,7 +24,7 @@ class RepetitionServices:
         self,
         content_type: RepetitionContentTypeEnum,
         **kwargs,
-    ) -> WordRepetition:
+    ) -> WordRepetition | MD:
         partial_kwargs = partial(handle_arguments, content_type=content_type, **kwargs)
 
         if content_type == RepetitionContentTypeEnum.WORD:
@@ -28,7 +32,9 @@ class RepetitionServices:
 
             return self._create_word_repetition_model(**kwargs)
         elif content_type == RepetitionContentTypeEnum.MD:
-            pass
+            _, kwargs = partial_kwargs(white_list_keys=MD.cls_arguments())
+
+            return self._create_md_repetition_model(**kwargs)
         elif content_type == RepetitionContentTypeEnum.TEXT:
             pass
         else:
@@ -49,8 +55,74 @@ class RepetitionServices:
             slugs=self._create_slugs(slugs),
         )
 
-    def _create_slugs(self, slugs: list[str]) -> list[SlugRepetition]:
+    def _create_md_repetition_model(self, slugs, title, **kwargs) -> MD:
+        """
+        Creates the document without its tags, which are inserted in batches as the
+        upload is parsed.
+        """
+        return MD(
+            **kwargs,
+            title=title,
+            slugs=self._create_slugs(slugs),
+        )
+
+    def _create_slugs(self, slugs: list[SlugRepetition]) -> list[SlugRepetition]:
+        """
+        Checks the slugs already resolved by the repository, so an existing name is
+        reused instead of being inserted again.
+        """
         if not slugs:
             raise DontPassTheMandatoryKey(key="slugs")
 
-        return [SlugRepetition(name=name) for name in slugs]
+        return slugs
+
+    def create_word_import_record(self, user_id: str, row: dict) -> dict:
+        """
+        Validates one imported row against `WordRepetition.cls_arguments()` with the same
+        mandatory keys as `_create_word_repetition_model` and returns it as column values.
+
+        List fields may be passed as lists or as `IMPORT_LIST_SEPARATOR` separated strings.
+
+        Raises:
+            SieveValueErrorExceptionExternal: If a mandatory field is missing.
+            DontPassTheMandatoryKey: If `synonyms` or `slugs` is missing or empty.
+            ValueError: If a field has a wrong type or an unknown enum value.
+        """
+        fields = {argument.field for argument in WordRepetition.cls_arguments()}
+        _, kwargs = handle_arguments(
+            white_list_keys=WordRepetition.cls_arguments(),
+            **{
+                key: value
+                for key, value in row.items()
+                if key in fields and key not in ("content_type", "user_id")
+            },
+            content_type=RepetitionContentTypeEnum.WORD,
+            user_id=user_id,
+        )
+
+        for field in IMPORT_LIST_FIELDS:
+            if field in kwargs:
+                kwargs[field] = self._as_string_list(field, kwargs[field])
+        for key in ("synonyms", "slugs"):
+            if not kwargs.get(key):
+                raise DontPassTheMandatoryKey(key=key)
+
+        for field in ("title", "word", "context", "image_url"):
+            if field in kwargs and not isinstance(kwargs[field], str):
+                raise ValueError(f"Field {field} must be a string.")
+
+        if "part_of_speech" in kwargs:
+            kwargs["part_of_speech"] = PartOfSpeachEnum(kwargs["part_of_speech"]).value
+        kwargs["language"] = LanguageEnum(
+            kwargs.get("language", LanguageEnum.ENGLISH_BR)
+        ).value
+
+        return kwargs
+
+    @staticmethod
+    def _as_string_list(field: str, value) -> list[str]:
+        if isinstance(value, str):
+            value = value.split(IMPORT_LIST_SEPARATOR)
+        if not isinstance(value, list) or any(not isinstance(item, str) for item in value):
+            raise ValueError(f"Field {field} must be a list of strings.")
+        return [item.strip() for item in value if item.strip()]
@@ -1,11 +1,23 @@
 from .arguments import SieveValueErrorExceptionExternal, handle_arguments
-from .repetition_math import repetition_formula
+from .interval_tree import IntervalTree
+from .lru_cache import LRUCache
+from .repetition_math import (
+    calc_date_repetition_batch,
+    repetition_formula,
+    repetition_formula_batch,
+    update_repetition_schedule_batch,
+)
 from .time import convert_to_timestamp
 
 
 __all__ = [
     "convert_to_timestamp",
     "repetition_formula",
+    "repetition_formula_batch",
+    "calc_date_repetition_batch",
+    "update_repetition_schedule_batch",
     "handle_arguments",
     "SieveValueErrorExceptionExternal",
+    "IntervalTree",
+    "LRUCache",
 ]
@@ -0,0 +1,37 @@
+import base64
+import json
+
+from ..exceptions.external import InvalidCursorError
+
+
+def encode_cursor(date_repetition: int, repetition_id: str) -> str:
+    """
+    Packs the seek key of the last row of a page into an opaque token.
+
+    Args:
+        date_repetition (int): `date_repetition` of the last returned row.
+        repetition_id (str): `id` of the last returned row, used as a tie-breaker.
+    Returns:
+        str: URL-safe token which is passed back as `cursor` to fetch the next page.
+    """
+    payload = json.dumps([int(date_repetition), repetition_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str]:
+    """
+    Unpacks a token produced by `encode_cursor` back into the `(date_repetition, id)` seek key.
+
+    Raises:
+        InvalidCursorError: If the token was not produced by `encode_cursor`.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        date_repetition, repetition_id = json.loads(
+            base64.urlsafe_b64decode(cursor + padding)
+        )
+        if not isinstance(date_repetition, int) or not isinstance(repetition_id, str):
+            raise ValueError
+        return date_repetition, repetition_id
+    except (TypeError, ValueError):
+        raise InvalidCursorError(cursor=cursor)
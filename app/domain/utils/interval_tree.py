@@ -0,0 +1,92 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Generic, Iterable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class _Node:
+    center: int
+    # Indexes of the intervals containing `center`, by ascending start and descending end.
+    by_start: list[int] = field(default_factory=list)
+    by_end: list[int] = field(default_factory=list)
+    left: Optional["_Node"] = None
+    right: Optional["_Node"] = None
+
+
+class IntervalTree(Generic[V]):
+    """
+    Static centered interval tree over half-open intervals `[start, end)`.
+
+    Built once in `O(n log n)`, it answers which intervals overlap `[start, end)` in
+    `O(log n + k)` for `k` results: the intervals starting inside the range are a slice
+    of the intervals sorted by start, the ones starting before it are those containing
+    `start`, found by one walk down the tree. Empty intervals are dropped.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[int, int, V]]):
+        items = sorted(
+            (interval for interval in intervals if interval[0] < interval[1]),
+            key=lambda interval: interval[0],
+        )
+        self._starts = [start for start, _, _ in items]
+        self._ends = [end for _, end, _ in items]
+        self._values = [value for _, _, value in items]
+        self._root = self._build(list(range(len(items))))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def overlap(self, start: int, end: Optional[int] = None) -> list[V]:
+        """
+        Returns the values of the intervals overlapping `[start, end)` ordered by start,
+        `end=None` reaches the end of the last interval.
+        """
+        first = bisect_left(self._starts, start)
+        last = len(self._starts) if end is None else bisect_left(self._starts, end)
+        containing = sorted(index for index in self._stab(start) if index < first)
+        return [self._values[index] for index in containing] + self._values[first:last]
+
+    def _stab(self, point: int) -> list[int]:
+        """
+        Indexes of the intervals containing `point`.
+        """
+        found = []
+        node = self._root
+        while node is not None:
+            if point < node.center:
+                for index in node.by_start:
+                    if self._starts[index] > point:
+                        break
+                    found.append(index)
+                node = node.left
+            else:
+                for index in node.by_end:
+                    if self._ends[index] <= point:
+                        break
+                    found.append(index)
+                node = node.right
+        return found
+
+    def _build(self, indexes: list[int]) -> Optional[_Node]:
+        """
+        `indexes` are ordered by start. The center is the median start, so the node holds
+        at least that interval and either side keeps at most half of the rest.
+        """
+        if not indexes:
+            return None
+
+        node = _Node(center=self._starts[indexes[len(indexes) // 2]])
+        left, right = [], []
+        for index in indexes:
+            if self._ends[index] <= node.center:
+                left.append(index)
+            elif self._starts[index] > node.center:
+                right.append(index)
+            else:
+                node.by_start.append(index)
+        node.by_end = sorted(node.by_start, key=lambda index: -self._ends[index])
+        node.left = self._build(left)
+        node.right = self._build(right)
+        return node
@@ -0,0 +1,51 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    In-process mapping bounded to `maxsize` entries, evicting the least recently used one.
+
+    It is not shared between workers and only meant for values which never change once
+    written, so a hit never has to be revalidated against the database.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("Attr maxsize must be a positive integer!")
+        self.maxsize = maxsize
+        self._items: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._items
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        if key not in self._items:
+            return default
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """
+        Returns the cached subset of `keys`, refreshing each hit.
+        """
+        return {key: self._items[key] for key in keys if self.get(key) is not None}
+
+    def put(self, key: K, value: V):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def put_many(self, items: Iterable[tuple[K, V]]):
+        for key, value in items:
+            self.put(key, value)
+
+    def clear(self):
+        self._items.clear()
@@ -1,15 +1,38 @@
+from typing import Callable
+
+import numpy as np
+from numpy.typing import ArrayLike
+
 ONE_DAY_IN_SECONDS = 24 * 60 * 60
 FORTY_MINUTES_IN_SECONDS = 40 * 60
 
 REPETITION_RATE = 2.5
 REPETITION_POST_RATE = 1
 
+# Intervals are capped at ten years, which keeps `date_repetition`, an `INTEGER` column,
+# inside the int4 range. Uncapped, the linear interval alone stops fitting int4 past
+# `count_repetition` 9,942.
+MAXIMUM_INTERVAL_DAYS = 3650
+
+# Integer values of `RepetitionStatusEnum`, used by the batch functions.
+STATUS_SUCCESSFUL = 1
+STATUS_UNSUCCESSFUL = 0
+STATUS_STARTING = -1
 
-def repetition_formula(count_repetition: int) -> int:
+
+def repetition_formula(
+    count_repetition: int,
+    rate: float = REPETITION_RATE,
+    post_rate: float = REPETITION_POST_RATE,
+    maximum_interval_days: float = MAXIMUM_INTERVAL_DAYS,
+) -> int:
     """
     Calculates time in seconds based on the number of repetitions.
     Args:
         count_repetition (int): The number of repetitions. If equal to 0, returns a fixed value.
+        rate (float): Days added per repetition, `REPETITION_RATE` by default.
+        post_rate (float): Constant days added to every interval, `REPETITION_POST_RATE` by default.
+        maximum_interval_days (float): Cap of the interval, `MAXIMUM_INTERVAL_DAYS` by default.
     Returns:
         int: The calculated time in seconds.
     Raises:
@@ -21,6 +44,104 @@ def repetition_formula(count_repetition: int) -> int:
     if count_repetition == 0:
         return FORTY_MINUTES_IN_SECONDS
 
-    return int(
-        (REPETITION_RATE * count_repetition + REPETITION_POST_RATE) * ONE_DAY_IN_SECONDS
+    return min(
+        int((rate * count_repetition + post_rate) * ONE_DAY_IN_SECONDS),
+        int(maximum_interval_days * ONE_DAY_IN_SECONDS),
+    )
+
+
+def repetition_formula_batch(
+    count_repetition: ArrayLike,
+    rate: float = REPETITION_RATE,
+    post_rate: float = REPETITION_POST_RATE,
+    maximum_interval_days: float = MAXIMUM_INTERVAL_DAYS,
+) -> np.ndarray:
+    """
+    Vectorized `repetition_formula` for a whole array of counters.
+
+    The interval is computed in float64, capped and truncated like `int()`, so every
+    element is identical to the scalar result.
+    Args:
+        count_repetition (ArrayLike): Non-negative integer counters.
+    Returns:
+        np.ndarray: int64 array of intervals in seconds.
+    Raises:
+        ValueError: If the array is not of an integer dtype or holds negative values.
+    """
+    counts = np.asarray(count_repetition)
+    if not np.issubdtype(counts.dtype, np.integer) or (counts < 0).any():
+        raise ValueError("Attr count_repetition must hold non-negative integers!")
+
+    intervals = np.minimum(
+        (rate * counts + post_rate) * ONE_DAY_IN_SECONDS,
+        int(maximum_interval_days * ONE_DAY_IN_SECONDS),
+    ).astype(np.int64)
+    return np.where(counts == 0, FORTY_MINUTES_IN_SECONDS, intervals)
+
+
+def calc_date_repetition_batch(
+    count_repetition: ArrayLike,
+    repetition_status: ArrayLike,
+    date_repetition: ArrayLike,
+    formula_batch: Callable[[ArrayLike], np.ndarray] = repetition_formula_batch,
+) -> np.ndarray:
+    """
+    Vectorized `calc_date_repetition`: the interval of every counter is added to its date for
+    `STARTING` and `SUCCESSFUL` statuses and subtracted for `UNSUCCESSFUL` ones.
+    Args:
+        count_repetition (ArrayLike): Non-negative integer counters.
+        repetition_status (ArrayLike): `RepetitionStatusEnum` members or their integer values.
+        date_repetition (ArrayLike): Timestamps the intervals are applied to.
+        formula_batch (Callable): Maps counters to intervals, `repetition_formula_batch` by default.
+    Returns:
+        np.ndarray: int64 array of the next repetition timestamps.
+    Raises:
+        ValueError: If a status is not a `RepetitionStatusEnum` value.
+    """
+    statuses = _as_statuses(repetition_status)
+    direction = np.where(statuses == STATUS_UNSUCCESSFUL, -1, 1)
+
+    return np.asarray(date_repetition, dtype=np.int64) + direction * (
+        formula_batch(count_repetition)
     )
+
+
+def update_repetition_schedule_batch(
+    count_repetition: ArrayLike,
+    repetition_status: ArrayLike,
+    date_repetition: ArrayLike,
+    formula_batch: Callable[[ArrayLike], np.ndarray] = repetition_formula_batch,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized `Repetition.update_repetition_schedule` for arrays of cards.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The new `count_repetition` and `date_repetition` arrays.
+    """
+    statuses = _as_statuses(repetition_status)
+    counts = np.maximum(
+        0,
+        np.asarray(count_repetition, dtype=np.int64)
+        + np.where(statuses == STATUS_SUCCESSFUL, 1, -1),
+    )
+
+    return counts, calc_date_repetition_batch(
+        counts, statuses, date_repetition, formula_batch=formula_batch
+    )
+
+
+def _as_statuses(repetition_status: ArrayLike) -> np.ndarray:
+    statuses = np.asarray(repetition_status)
+    if not np.issubdtype(statuses.dtype, np.integer):
+        # `RepetitionStatusEnum` members are `str` enums valued "1", "0" and "-1".
+        statuses = np.fromiter(
+            (int(getattr(status, "value", status)) for status in statuses.ravel()),
+            dtype=np.int64,
+            count=statuses.size,
+        ).reshape(statuses.shape)
+
+    if not np.isin(
+        statuses, (STATUS_SUCCESSFUL, STATUS_UNSUCCESSFUL, STATUS_STARTING)
+    ).all():
+        raise ValueError("Attr repetition_status must hold RepetitionStatusEnum values!")
+    return statuses
@@ -0,0 +1,75 @@
+from sqlalchemy import ColumnElement, Integer, Text, func, literal
+from sqlalchemy.dialects.postgresql import INT4RANGE, REGCONFIG, TSVECTOR
+
+from app.domain.schedulers import get_scheduler
+
+
+def repetition_formula_expression(count_repetition: ColumnElement[int]) -> ColumnElement[int]:
+    """
+    SQL counterpart of `repetition_formula` for the configured scheduler.
+    """
+    return get_scheduler().interval_expression(count_repetition)
+
+
+def next_count_repetition_expression(
+    count_repetition: ColumnElement[int], step: ColumnElement[int]
+) -> ColumnElement[int]:
+    """
+    SQL counterpart of the counter update in `Repetition.update_repetition_schedule`:
+    `step` is `1` for a successful and `-1` for an unsuccessful repetition.
+    """
+    return func.greatest(0, func.coalesce(count_repetition, 0) + step)
+
+
+def calc_date_repetition_expression(
+    count_repetition: ColumnElement[int],
+    step: ColumnElement[int],
+    date_repetition: ColumnElement[int],
+) -> ColumnElement[int]:
+    """
+    SQL counterpart of `calc_date_repetition`: the interval for `count_repetition` is added
+    to `date_repetition` when `step` is `1` and subtracted when it is `-1`.
+    """
+    return date_repetition + step * repetition_formula_expression(count_repetition)
+
+
+# The `word_search_*` SQL functions are created by the migration adding the search indexes.
+# Their calls below must stay identical to the indexed expressions to use the indexes.
+
+
+def word_search_config_expression(language: ColumnElement) -> ColumnElement:
+    """
+    Text search configuration of the language of a word, `simple` for languages without one.
+    """
+    return func.word_search_config(language, type_=REGCONFIG)
+
+
+def word_search_document_expression(
+    language: ColumnElement, *fields: ColumnElement
+) -> ColumnElement:
+    """
+    `tsvector` of the word weighted `A`, its translations and synonyms `B` and
+    its examples and context `C`, stemmed in the language of the word.
+    """
+    return func.word_search_document(language, *fields, type_=TSVECTOR)
+
+
+def word_search_text_expression(*fields: ColumnElement) -> ColumnElement[str]:
+    """
+    The searchable fields of a word joined into one text for trigram matching.
+    """
+    return func.word_search_text(*fields, type_=Text)
+
+
+def position_range_expression(
+    start_pos: ColumnElement[int] | int, end_pos: ColumnElement[int] | int | None
+) -> ColumnElement:
+    """
+    `int4range(start_pos, end_pos)`, half-open and unbounded above when `end_pos` is
+    `None`.
+    """
+    start_pos, end_pos = (
+        literal(value, Integer) if value is None or isinstance(value, int) else value
+        for value in (start_pos, end_pos)
+    )
+    return func.int4range(start_pos, end_pos, type_=INT4RANGE)
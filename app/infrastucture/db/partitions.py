@@ -0,0 +1,80 @@
+import pendulum
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import Repetition
+
+PARENT_TABLE = Repetition.__tablename__
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+
+def month_start(date: pendulum.DateTime) -> pendulum.DateTime:
+    return pendulum.datetime(date.year, date.month, 1, tz="UTC")
+
+
+def partition_name(month: pendulum.DateTime) -> str:
+    return f"{PARENT_TABLE}_{month.year}_{month.month:02d}"
+
+
+def partition_bounds(month: pendulum.DateTime) -> tuple[int, int]:
+    """
+    `date_repetition` range `[from, to)` of the partition holding `month`, in UTC.
+    """
+    month = month_start(month)
+    return int(month.timestamp()), int(month.add(months=1).timestamp())
+
+
+async def create_month_partition(session: AsyncSession, month: pendulum.DateTime) -> bool:
+    """
+    Creates the partition of `month` unless it exists, returns whether it was created.
+
+    Rows of that month which landed in the default partition are moved into the new one
+    before it is attached, otherwise attaching would fail on them.
+    """
+    name = partition_name(month)
+    if await session.scalar(text("SELECT to_regclass(:name)"), {"name": name}):
+        return False
+
+    date_from, date_to = partition_bounds(month)
+    await session.execute(
+        text(
+            f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    await session.execute(
+        text(
+            f"WITH moved AS ("
+            f"DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE date_repetition >= :date_from AND date_repetition < :date_to "
+            f"RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved"
+        ),
+        {"date_from": date_from, "date_to": date_to},
+    )
+    await session.execute(
+        text(
+            f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ({date_from}) TO ({date_to})"
+        )
+    )
+    return True
+
+
+async def create_partitions_ahead(
+    session: AsyncSession,
+    months_ahead: int,
+    start: pendulum.DateTime | None = None,
+) -> list[str]:
+    """
+    Creates the monthly partitions from the month of `start`, now by default, through
+    `months_ahead` months after it and commits them one by one.
+    Returns the names of the partitions which were created.
+    """
+    month = month_start(start or pendulum.now("UTC"))
+    created = []
+    for _ in range(months_ahead + 1):
+        if await create_month_partition(session, month):
+            created.append(partition_name(month))
+        await session.commit()
+        month = month.add(months=1)
+    return created
@@ -0,0 +1,298 @@
+from dataclasses import dataclass
+
+from sqlalchemy import (
+    String,
+    any_,
+    bindparam,
+    delete,
+    exists,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import (
+    Repetition,
+    SlugRepetition,
+    Tag,
+    deleted_repetitions,
+    repetition_slug_association,
+    repetition_titles,
+)
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
+
+repetitions = Repetition.__table__
+association = repetition_slug_association
+tags = Tag.__table__
+
+# Names resolved by one `get_or_create_slug_ids` call, well below the 32,767 bind
+# parameters a statement may take.
+SLUG_BATCH_SIZE = 5_000
+
+
+def subtype_tables():
+    """
+    Tables of the joined-inheritance subtypes of `Repetition`, e.g. `word_repetitions`.
+    """
+    return [
+        mapper.local_table
+        for mapper in Repetition.__mapper__.self_and_descendants
+        if mapper.local_table is not repetitions
+    ]
+
+
+def tag_subtype_tables():
+    """
+    Tables of the subtypes of `Tag`, e.g. `heading`, which share the id of the `tags` row.
+    """
+    return [
+        mapper.local_table
+        for mapper in Tag.__mapper__.self_and_descendants
+        if mapper.local_table is not tags
+    ]
+
+
+@dataclass(frozen=True)
+class UserMove:
+    user_id: str
+    source: int
+    target: int
+    copied: int = 0
+    purged: int = 0
+    pending: int = 0
+
+    @property
+    def to_json(self) -> dict:
+        return {
+            "user_id": self.user_id,
+            "source": self.source,
+            "target": self.target,
+            "copied": self.copied,
+            "purged": self.purged,
+            "pending": self.pending,
+        }
+
+
+async def copy_user_rows(
+    source: AsyncSession, target: AsyncSession, user_id: str
+) -> int:
+    """
+    Copies every repetition of `user_id` with its subtype row and slugs from `source` to
+    `target`, returns the number of repetitions copied.
+
+    Copying is idempotent, so it can run again to catch up with writes made to the source
+    until the application switched to the new shard list. A repetition already on the
+    target keeps the schedule of whichever side was reviewed last. The source rows are
+    locked until the target commits, so they can't change in between.
+
+    Deletes are reconciled through the tombstones of `deleted_repetitions`: a repetition
+    deleted on the source since an earlier copy is deleted from the target, and one
+    deleted on the target after the switch is not copied again.
+    """
+    rows = (
+        (
+            await source.execute(
+                select(repetitions)
+                .where(repetitions.c.user_id == user_id)
+                .with_for_update()
+            )
+        )
+        .mappings()
+        .all()
+    )
+    deleted_on_source = await _get_deleted_ids(source, user_id)
+    if deleted_on_source:
+        # The triggers of the target delete the rest of their rows.
+        await target.execute(
+            delete(repetitions).where(repetitions.c.id == any_(deleted_on_source))
+        )
+    deleted_on_target = set(await _get_deleted_ids(target, user_id))
+    rows = [row for row in rows if row["id"] not in deleted_on_target]
+    if not rows:
+        await target.commit()
+        await source.commit()
+        return 0
+    ids = [row["id"] for row in rows]
+
+    # `repetitions` is partitioned and has no unique `id` to upsert on.
+    copied = dict(
+        (
+            await target.execute(
+                select(repetitions.c.id, repetitions.c.date_last_repetition).where(
+                    repetitions.c.id == any_(ids)
+                )
+            )
+        ).all()
+    )
+    new_rows = [dict(row) for row in rows if row["id"] not in copied]
+    newer_rows = [
+        {**row, "b_id": row["id"]}
+        for row in rows
+        if row["id"] in copied
+        and (row["date_last_repetition"] or 0) > (copied[row["id"]] or 0)
+    ]
+    if new_rows:
+        await target.execute(insert(repetitions), new_rows)
+        await target.execute(
+            pg_insert(repetition_titles).on_conflict_do_nothing(),
+            [{"title": row["title"]} for row in new_rows],
+        )
+    if newer_rows:
+        await target.execute(
+            update(repetitions)
+            .where(repetitions.c.id == bindparam("b_id"))
+            .values(
+                {
+                    name: bindparam(name)
+                    for name in (
+                        "count_repetition",
+                        "date_repetition",
+                        "date_last_repetition",
+                        "title",
+                    )
+                }
+            ),
+            newer_rows,
+        )
+
+    for table in subtype_tables():
+        subtype_rows = (
+            (await source.execute(select(table).where(table.c.id == any_(ids))))
+            .mappings()
+            .all()
+        )
+        if subtype_rows:
+            await target.execute(
+                pg_insert(table).on_conflict_do_nothing(),
+                [dict(row) for row in subtype_rows],
+            )
+
+    await _copy_tag_rows(source, target, ids)
+
+    slug_rows = (
+        await source.execute(
+            select(association.c.repetition_id, SlugRepetition.name)
+            .join(SlugRepetition, SlugRepetition.id == association.c.slug_id)
+            .where(association.c.repetition_id == any_(ids))
+        )
+    ).all()
+    if slug_rows:
+        repository = SQLAlchemyRepetitionRepository(session=target)
+        names = list(dict.fromkeys(name for _, name in slug_rows))
+        slug_ids = {}
+        # Every name costs bind parameters, a user may have more than one statement takes.
+        for start in range(0, len(names), SLUG_BATCH_SIZE):
+            slug_ids |= await repository.get_or_create_slug_ids(
+                names[start : start + SLUG_BATCH_SIZE]
+            )
+
+        pair_repetition_id = bindparam("pair_repetition_id", type_=String)
+        pair_slug_id = bindparam("pair_slug_id", type_=String)
+        await target.execute(
+            association.insert().from_select(
+                ["repetition_id", "slug_id"],
+                select(pair_repetition_id, pair_slug_id).where(
+                    ~exists().where(
+                        association.c.repetition_id == pair_repetition_id,
+                        association.c.slug_id == pair_slug_id,
+                    )
+                ),
+            ),
+            [
+                {"pair_repetition_id": repetition_id, "pair_slug_id": slug_ids[name]}
+                for repetition_id, name in slug_rows
+            ],
+        )
+
+    await target.commit()
+    await source.commit()
+    return len(rows)
+
+
+async def _copy_tag_rows(source: AsyncSession, target: AsyncSession, ids: list[str]):
+    """
+    Copies the tags of the Markdown documents among `ids`, which the target doesn't have.
+    """
+    tag_rows = (
+        (await source.execute(select(tags).where(tags.c.md_id == any_(ids))))
+        .mappings()
+        .all()
+    )
+    if not tag_rows:
+        return
+
+    tag_ids = [row["id"] for row in tag_rows]
+    await target.execute(
+        pg_insert(tags).on_conflict_do_nothing(), [dict(row) for row in tag_rows]
+    )
+    for table in tag_subtype_tables():
+        subtype_rows = (
+            (await source.execute(select(table).where(table.c.id == any_(tag_ids))))
+            .mappings()
+            .all()
+        )
+        if subtype_rows:
+            await target.execute(
+                pg_insert(table).on_conflict_do_nothing(),
+                [dict(row) for row in subtype_rows],
+            )
+
+
+async def purge_user_rows(
+    source: AsyncSession, target: AsyncSession, user_id: str
+) -> tuple[int, int]:
+    """
+    Deletes from `source` the repetitions of `user_id` which are already on `target`, or
+    were deleted there. Returns the number of deleted and of pending repetitions, the
+    latter were written to the source after the last copy and need another
+    `copy_user_rows` first.
+
+    The tombstones the purge itself leaves on the source are dropped with the rows, so a
+    later catch-up copy doesn't take them for deletes. Once nothing is pending the move is
+    over and the tombstones of `user_id` are dropped on both sides.
+    """
+    ids = (
+        await source.scalars(
+            select(repetitions.c.id)
+            .where(repetitions.c.user_id == user_id)
+            .with_for_update()
+        )
+    ).all()
+
+    done_ids = set(
+        await target.scalars(select(repetitions.c.id).where(repetitions.c.id == any_(ids)))
+    ) | (set(ids) & set(await _get_deleted_ids(target, user_id)))
+    if done_ids:
+        # The `delete_repetition_dependents` trigger deletes the rest of their rows.
+        await source.execute(
+            delete(repetitions).where(repetitions.c.id == any_(list(done_ids)))
+        )
+        await source.execute(
+            delete(deleted_repetitions).where(
+                deleted_repetitions.c.id == any_(list(done_ids))
+            )
+        )
+
+    pending = len(ids) - len(done_ids)
+    if not pending:
+        for session in (source, target):
+            await session.execute(
+                delete(deleted_repetitions).where(
+                    deleted_repetitions.c.user_id == user_id
+                )
+            )
+    await source.commit()
+    await target.commit()
+    return len(done_ids), pending
+
+
+async def _get_deleted_ids(session: AsyncSession, user_id: str) -> list[str]:
+    return list(
+        await session.scalars(
+            select(deleted_repetitions.c.id).where(
+                deleted_repetitions.c.user_id == user_id
+            )
+        )
+    )
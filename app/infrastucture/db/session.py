@@ -1,27 +1,324 @@
+import asyncio
+import itertools
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from dataclasses import dataclass
+from typing import AsyncGenerator, Optional, Sequence
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Executable, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import global_config
 
-engine = create_async_engine(
-    global_config.DATABASE_URL_async,
-    future=True,
-    echo=True,
-)
+from .sharding import ShardRouter
+
+# Keys of `Session.info`: the shard the session is bound to and
+# the users whose rows the session wrote.
+SHARD = "shard"
+WRITTEN_USER_IDS = "written_user_ids"
+
+# WAL positions as byte offsets, which compare as integers.
+WRITTEN_LSN = text("SELECT pg_current_wal_insert_lsn() - CAST('0/0' AS pg_lsn)")
+REPLAYED_LSN = text("SELECT pg_last_wal_replay_lsn() - CAST('0/0' AS pg_lsn)")
+
+
+@dataclass(frozen=True)
+class WritePosition:
+    """
+    Position in the WAL of the primary of `shard` right after a commit. Clients send it
+    back with their next reads, which a replica only serves once it replayed that far.
+    """
+
+    shard: int
+    lsn: int
+
+    def __str__(self) -> str:
+        return f"{self.shard}:{self.lsn}"
+
+    @classmethod
+    def parse(cls, value: str) -> "WritePosition":
+        """
+        Raises:
+            ValueError: If `value` is not a position formatted by `str`.
+        """
+        shard, _, lsn = value.partition(":")
+        if not (shard.isdigit() and lsn.isdigit()):
+            raise ValueError(f"Invalid write position {value!r}!")
+        return cls(shard=int(shard), lsn=int(lsn))
+
+
+class DatabaseShard:
+    """
+    The primary engine of one shard and the engines of its read replicas, with the last
+    known WAL position each replica replayed.
+    """
+
+    def __init__(self, engine: AsyncEngine, replica_engines: list[AsyncEngine]):
+        self.engine = engine
+        self.replica_engines = replica_engines
+        self.sessionmaker = self._create_sessionmaker(engine)
+        self._replica_sessionmakers = [
+            self._create_sessionmaker(engine) for engine in replica_engines
+        ]
+        self._replayed_lsns = [0] * len(replica_engines)
+        self._next_replica = itertools.cycle(range(len(replica_engines)))
+
+    @staticmethod
+    def _create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    def next_replica_sessionmaker(
+        self, read_after: int = 0
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        Round-robin over the replicas known to have replayed the WAL up to `read_after`,
+        the primary when there is none.
+        """
+        for _ in self._replica_sessionmakers:
+            replica = next(self._next_replica)
+            if self._replayed_lsns[replica] >= read_after:
+                return self._replica_sessionmakers[replica]
+        return self.sessionmaker
+
+    async def refresh_replayed_lsns(self, lsn: int):
+        """
+        Asks the replicas last known to be behind `lsn` how far they replayed. Replayed
+        positions only grow, so the replicas already past `lsn` are not asked again.
+        """
+
+        async def refresh(replica: int):
+            async with self._replica_sessionmakers[replica]() as session:
+                replayed = await session.scalar(REPLAYED_LSN)
+            self._replayed_lsns[replica] = max(
+                self._replayed_lsns[replica], int(replayed or 0)
+            )
+
+        await asyncio.gather(
+            *(
+                refresh(replica)
+                for replica, replayed in enumerate(self._replayed_lsns)
+                if replayed < lsn
+            )
+        )
+
+    async def dispose(self):
+        for engine in [self.engine, *self.replica_engines]:
+            await engine.dispose()
+
+
+class DatabaseSessionManager:
+    """
+    Owns the engines and their connection pools for the lifetime of the application.
+
+    The application opens it in its lifespan with `init` and `warm_up` and disposes it
+    with `close`. Anything running outside of the application, like a CLI, gets the
+    engines created lazily on the first session.
+
+    Rows of a user live on the shard picked by `ShardRouter` from `DB_SHARD_URLS`, a single
+    shard when it is unset. Writes always go to the primary of the shard. Read-only sessions
+    go round-robin to its replicas. A client which wrote gets the `WritePosition` of its
+    write and passes it to its next reads, which then go to a replica that replayed the
+    write, or to the primary while none has, so it sees its own writes despite replication
+    lag, whichever process serves it.
+    """
+
+    def __init__(self):
+        self._shards: list[DatabaseShard] = []
+        self._router: Optional[ShardRouter] = None
+
+    @property
+    def shards(self) -> range:
+        if not self._shards:
+            self.init()
+        return range(len(self._shards))
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """
+        Primary engine of the first shard, the only one without sharding.
+        """
+        if not self._shards:
+            self.init()
+        return self._shards[0].engine
+
+    def init(
+        self,
+        shard_urls: Optional[list[str]] = None,
+        shard_replica_urls: Optional[list[list[str]]] = None,
+        **engine_kwargs,
+    ):
+        """
+        Creates the engines with the pool settings of `GlobalConfig`, `engine_kwargs` override them.
+        """
+        if self._shards:
+            return
+
+        engine_kwargs = {**self.engine_kwargs(), **engine_kwargs}
+        shard_urls = shard_urls or global_config.DATABASE_SHARD_URLS_async
+        shard_replica_urls = (
+            global_config.DATABASE_SHARD_REPLICA_URLS_async
+            if shard_replica_urls is None
+            else shard_replica_urls
+        )
+
+        self._shards = [
+            DatabaseShard(
+                engine=create_async_engine(url, **engine_kwargs),
+                replica_engines=[
+                    create_async_engine(replica_url, **engine_kwargs)
+                    for replica_url in (
+                        shard_replica_urls[shard] if shard < len(shard_replica_urls) else []
+                    )
+                ],
+            )
+            for shard, url in enumerate(shard_urls)
+        ]
+        self._router = ShardRouter(num_shards=len(self._shards))
+
+    @staticmethod
+    def engine_kwargs() -> dict:
+        return {
+            "echo": global_config.DB_ECHO,
+            "pool_size": global_config.DB_POOL_SIZE,
+            "max_overflow": global_config.DB_MAX_OVERFLOW,
+            "pool_recycle": global_config.DB_POOL_RECYCLE,
+            "pool_pre_ping": global_config.DB_POOL_PRE_PING,
+            "connect_args": {
+                "prepared_statement_cache_size": global_config.DB_STATEMENT_CACHE_SIZE,
+            },
+        }
+
+    def shard_for(self, user_id: str) -> int:
+        if self._router is None:
+            self.init()
+        return self._router.shard_for(user_id)
+
+    async def warm_up(self, statements: Sequence[Executable] = ()):
+        """
+        Opens every connection of every pool at once and prepares `statements` on each,
+        so the first requests neither connect nor prepare. Every statement runs in a
+        transaction which is rolled back, so it must be harmless, e.g. match no rows.
+        Replicas are read-only and only prepare the `SELECT` statements.
+        """
+
+        async def warm_up_connection(
+            engine: AsyncEngine, statements: Sequence[Executable]
+        ):
+            async with engine.connect() as connection:
+                for statement in statements:
+                    await connection.execute(statement)
+                await connection.rollback()
+
+        read_statements = [
+            statement
+            for statement in statements
+            if getattr(statement, "is_select", False)
+        ]
+        engines = [
+            (engine, engine_statements)
+            for shard in self.shards
+            for engine, engine_statements in [
+                (self._shards[shard].engine, statements),
+                *(
+                    (engine, read_statements)
+                    for engine in self._shards[shard].replica_engines
+                ),
+            ]
+        ]
+        await asyncio.gather(
+            *(
+                warm_up_connection(engine, engine_statements)
+                for engine, engine_statements in engines
+                for _ in range(engine.pool.size())
+            )
+        )
+
+    async def close(self):
+        for shard in self._shards:
+            await shard.dispose()
+        self._shards = []
+        self._router = None
+
+    @staticmethod
+    async def write_position(session: AsyncSession) -> WritePosition:
+        """
+        Position of the WAL of the primary `session` is on, past everything it committed.
+        """
+        lsn = await session.scalar(WRITTEN_LSN)
+        return WritePosition(shard=session.info[SHARD], lsn=int(lsn))
+
+    async def refresh_replicas(self, read_after: WritePosition):
+        """
+        Brings the replayed positions of the replicas `read_after` is ahead of up to date,
+        for `open_session` to pick among them.
+        """
+        if read_after.shard in self.shards:
+            await self._shards[read_after.shard].refresh_replayed_lsns(read_after.lsn)
+
+    def open_session(
+        self,
+        read_only: bool = False,
+        user_id: Optional[str] = None,
+        shard: Optional[int] = None,
+        read_after: Optional[WritePosition] = None,
+    ) -> AsyncSession:
+        """
+        Creates a session on the shard of `user_id`, or on `shard` when passed, the first
+        shard otherwise. A `read_only` session goes to a replica which replayed `read_after`
+        as of the last `refresh_replicas`. No connection is checked out until the session
+        first executes.
+        """
+        if not self._shards:
+            self.init()
+
+        if shard is None:
+            shard = self.shard_for(user_id) if user_id else 0
+        database_shard = self._shards[shard]
+
+        sessionmaker = (
+            database_shard.next_replica_sessionmaker(
+                read_after.lsn if read_after is not None and read_after.shard == shard else 0
+            )
+            if read_only
+            else database_shard.sessionmaker
+        )
+        session = sessionmaker()
+        session.info[SHARD] = shard
+        return session
+
+    @asynccontextmanager
+    async def session(
+        self,
+        read_only: bool = False,
+        user_id: Optional[str] = None,
+        shard: Optional[int] = None,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        async with self.open_session(
+            read_only=read_only, user_id=user_id, shard=shard
+        ) as session:
+            try:
+                yield session
+            except:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+
 
-async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+session_manager = DatabaseSessionManager()
 
 
 @asynccontextmanager
-async def get_session() -> AsyncGenerator:
-    async with async_session() as session:
-        try:
-            yield session
-        except:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+async def get_session(
+    read_only: bool = False,
+    user_id: Optional[str] = None,
+    shard: Optional[int] = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    async with session_manager.session(
+        read_only=read_only, user_id=user_id, shard=shard
+    ) as session:
+        yield session
@@ -0,0 +1,42 @@
+import hashlib
+
+
+def user_shard_key(user_id: str) -> int:
+    """
+    Stable 64-bit key of `user_id`. Python's `hash` is salted per process, so it can't be used.
+    """
+    return int.from_bytes(hashlib.blake2b(user_id.encode(), digest_size=8).digest(), "big")
+
+
+def jump_consistent_hash(key: int, num_buckets: int) -> int:
+    """
+    Jump consistent hash (Lamping & Veach): maps `key` to one of `num_buckets` buckets
+    so that growing from `n` to `n + 1` buckets moves only `1 / (n + 1)` of the keys,
+    all of them into the new bucket.
+    """
+    if num_buckets < 1:
+        raise ValueError("Attr num_buckets must be a positive integer!")
+
+    bucket, jump = -1, 0
+    while jump < num_buckets:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        jump = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+class ShardRouter:
+    """
+    Maps every user to the shard holding all of its rows.
+
+    Shards are only ever appended, so after adding one the resharding tool has to move
+    just the users whose shard changed, see `app.cli.reshard`.
+    """
+
+    def __init__(self, num_shards: int):
+        if num_shards < 1:
+            raise ValueError("Attr num_shards must be a positive integer!")
+        self.num_shards = num_shards
+
+    def shard_for(self, user_id: str) -> int:
+        return jump_consistent_hash(user_shard_key(user_id), self.num_shards)
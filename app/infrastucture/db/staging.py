@@ -0,0 +1,34 @@
+from sqlalchemy import ARRAY, Column, Integer, MetaData, String, Table
+
+# Session-local tables bulk loaded with COPY. They live in their own metadata,
+# so Alembic never sees them, and are dropped when the transaction commits.
+staging_metadata = MetaData()
+
+import_words_staging = Table(
+    "import_words",
+    staging_metadata,
+    Column("line", Integer, nullable=False),
+    Column("id", String(36), nullable=False),
+    Column("title", String, nullable=False),
+    Column("word", String, nullable=False),
+    Column("translate", ARRAY(String)),
+    Column("synonyms", ARRAY(String)),
+    Column("part_of_speech", String),
+    Column("examples", ARRAY(String)),
+    Column("language", String),
+    Column("context", String),
+    Column("possible_options", ARRAY(String)),
+    Column("image_url", String),
+    Column("slugs", ARRAY(String), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+import_slugs_staging = Table(
+    "import_slugs",
+    staging_metadata,
+    Column("id", String(36), nullable=False),
+    Column("name", String, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
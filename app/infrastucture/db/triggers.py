@@ -0,0 +1,60 @@
+from sqlalchemy import DDL
+
+# `repetitions` is partitioned and `id` alone is not unique there, so no foreign key
+# references it. The rows which belong to a repetition, its subtype row, the tags of a
+# Markdown document, its slug associations and its title, are deleted by this trigger.
+#
+# A row moved to another partition by an update of `date_repetition` is deleted and
+# inserted again, which fires the trigger too. AFTER triggers run once the statement
+# is done, so a repetition whose `id` is still there has only moved and is kept whole.
+DELETE_REPETITION_DEPENDENTS_FUNCTION = DDL(
+    """
+CREATE OR REPLACE FUNCTION delete_repetition_dependents() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM repetitions WHERE id = OLD.id) THEN
+        RETURN NULL;
+    END IF;
+
+    DELETE FROM repetition_slug_association WHERE repetition_id = OLD.id;
+    DELETE FROM word_repetitions WHERE id = OLD.id;
+    DELETE FROM "text" WHERE id IN (SELECT id FROM tags WHERE md_id = OLD.id);
+    DELETE FROM "quote" WHERE id IN (SELECT id FROM tags WHERE md_id = OLD.id);
+    DELETE FROM "heading" WHERE id IN (SELECT id FROM tags WHERE md_id = OLD.id);
+    DELETE FROM "list" WHERE id IN (SELECT id FROM tags WHERE md_id = OLD.id);
+    DELETE FROM "code" WHERE id IN (SELECT id FROM tags WHERE md_id = OLD.id);
+    DELETE FROM tags WHERE md_id = OLD.id;
+    DELETE FROM mds WHERE id = OLD.id;
+    DELETE FROM repetition_titles WHERE title = OLD.title;
+    RETURN NULL;
+END
+$$
+"""
+)
+
+DELETE_REPETITION_DEPENDENTS_TRIGGER = DDL(
+    "CREATE TRIGGER delete_repetition_dependents AFTER DELETE ON repetitions "
+    "FOR EACH ROW EXECUTE FUNCTION delete_repetition_dependents()"
+)
+
+# Leaves a tombstone for every repetition which is really deleted, not just moved to
+# another partition, for `app.cli.reshard` to reconcile deletes made during a move.
+RECORD_DELETED_REPETITION_FUNCTION = DDL(
+    """
+CREATE OR REPLACE FUNCTION record_deleted_repetition() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM repetitions WHERE id = OLD.id) THEN
+        INSERT INTO deleted_repetitions (id, user_id) VALUES (OLD.id, OLD.user_id)
+        ON CONFLICT (id) DO NOTHING;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+)
+
+RECORD_DELETED_REPETITION_TRIGGER = DDL(
+    "CREATE TRIGGER record_deleted_repetition AFTER DELETE ON repetitions "
+    "FOR EACH ROW EXECUTE FUNCTION record_deleted_repetition()"
+)
@@ -0,0 +1,165 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, Awaitable, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastucture.db.session import (
+    SHARD,
+    WRITTEN_USER_IDS,
+    WritePosition,
+    session_manager,
+)
+from app.infrastucture.repositories.sqlalchemy import (
+    SQLAlchemyMDRepository,
+    SQLAlchemyRepetitionRepository,
+    SQLAlchemyRepository,
+    SQLAlchemyReviewRepository,
+    SQLAlchemyWordImportRepository,
+)
+
+T = TypeVar("T")
+R = TypeVar("R", bound=SQLAlchemyRepository)
+
+
+@dataclass(eq=False, kw_only=True)
+class SQLAlchemyUnitOfWork:
+    """
+    Groups the repository operations of one request into a single transaction on a
+    single pooled connection.
+
+    The session is opened on first use, on the shard of the user passed to `route`, so
+    commands and queries route the unit before touching a repository. Repositories only
+    flush; nothing is written until `commit` is called, and work which was never committed
+    is rolled back when the unit closes. A committed unit which wrote rows records the
+    position of its write, for the client to read after it.
+
+    Attributes:
+        read_only (bool): Serve the unit from a replica of the shard.
+        user_id (Optional[str]): The user whose shard the unit is bound to.
+        shard (Optional[int]): Explicit shard, for work which is not about one user.
+        read_after (Optional[WritePosition]): Write of the client a read-only unit has to
+            see, it is served by the primary while no replica replayed it.
+        written (Optional[WritePosition]): Position of the last write committed by the unit.
+    """
+
+    read_only: bool = False
+    user_id: Optional[str] = None
+    shard: Optional[int] = None
+    read_after: Optional[WritePosition] = None
+    written: Optional[WritePosition] = field(default=None, init=False)
+    _session: Optional[AsyncSession] = field(default=None, init=False, repr=False)
+    _repositories: dict[type, SQLAlchemyRepository] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def route(self, user_id: Optional[str]) -> "SQLAlchemyUnitOfWork":
+        """
+        Binds the unit to the shard of `user_id`.
+
+        Raises:
+            ValueError: If the session is already open on another shard.
+        """
+        if (
+            self._session is not None
+            and user_id is not None
+            and session_manager.shard_for(user_id) != self._session.info[SHARD]
+        ):
+            raise ValueError("Unit of work is already bound to another shard!")
+
+        if self._session is None:
+            self.user_id = user_id
+        return self
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = session_manager.open_session(
+                read_only=self.read_only,
+                user_id=self.user_id,
+                shard=self.shard,
+                read_after=self.read_after,
+            )
+        return self._session
+
+    @property
+    def repetitions(self) -> SQLAlchemyRepetitionRepository:
+        return self._repository(SQLAlchemyRepetitionRepository)
+
+    @property
+    def mds(self) -> SQLAlchemyMDRepository:
+        return self._repository(SQLAlchemyMDRepository)
+
+    @property
+    def reviews(self) -> SQLAlchemyReviewRepository:
+        return self._repository(SQLAlchemyReviewRepository)
+
+    @property
+    def word_imports(self) -> SQLAlchemyWordImportRepository:
+        return self._repository(SQLAlchemyWordImportRepository)
+
+    def _repository(self, repository_class: type[R]) -> R:
+        """
+        The repository of `repository_class` on the session of the unit, created once.
+        """
+        if repository_class not in self._repositories:
+            self._repositories[repository_class] = repository_class(session=self.session)
+        return self._repositories[repository_class]
+
+    async def commit(self):
+        if self._session is None:
+            return
+
+        await self._session.commit()
+        if self._session.info.pop(WRITTEN_USER_IDS, None):
+            self.written = await session_manager.write_position(self._session)
+
+    async def rollback(self):
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+
+
+@asynccontextmanager
+async def get_unit_of_work(
+    read_only: bool = False,
+    user_id: Optional[str] = None,
+    shard: Optional[int] = None,
+    read_after: Optional[WritePosition] = None,
+) -> AsyncGenerator[SQLAlchemyUnitOfWork, None]:
+    """
+    Opens a unit of work, on a replica for a `read_only` one, which has to have replayed
+    `read_after` when it is passed.
+    """
+    if read_only and read_after is not None:
+        await session_manager.refresh_replicas(read_after)
+    uow = SQLAlchemyUnitOfWork(
+        read_only=read_only, user_id=user_id, shard=shard, read_after=read_after
+    )
+    try:
+        yield uow
+    except:
+        await uow.rollback()
+        raise
+    finally:
+        await uow.close()
+
+
+async def fan_out(
+    work: Callable[[SQLAlchemyUnitOfWork], Awaitable[T]],
+    read_only: bool = True,
+) -> list[T]:
+    """
+    Runs `work` concurrently with one unit of work per shard and returns the results
+    in shard order, for queries which span users.
+    """
+
+    async def run(shard: int) -> T:
+        async with get_unit_of_work(read_only=read_only, shard=shard) as uow:
+            return await work(uow)
+
+    return await asyncio.gather(*(run(shard) for shard in session_manager.shards))
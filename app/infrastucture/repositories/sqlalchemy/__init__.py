@@ -0,0 +1,13 @@
+from .base import SQLAlchemyRepository
+from .md import SQLAlchemyMDRepository
+from .repetition import SQLAlchemyRepetitionRepository
+from .review import SQLAlchemyReviewRepository
+from .word_import import SQLAlchemyWordImportRepository
+
+__all__ = [
+    "SQLAlchemyMDRepository",
+    "SQLAlchemyRepetitionRepository",
+    "SQLAlchemyRepository",
+    "SQLAlchemyReviewRepository",
+    "SQLAlchemyWordImportRepository",
+]
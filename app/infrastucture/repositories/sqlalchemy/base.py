@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastucture.db.session import WRITTEN_USER_IDS
+
+
+@dataclass(
+    eq=False,
+    frozen=True,
+    kw_only=True,
+)
+class SQLAlchemyRepository:
+    """
+    Shared part of the SQLAlchemy repositories, which all work on the session of one
+    unit of work.
+    """
+
+    session: AsyncSession
+
+    def _mark_written(self, user_id: str):
+        """
+        Records that the session wrote rows of `user_id`, so the unit of work records
+        the position of the write once it commits.
+        """
+        self.session.info.setdefault(WRITTEN_USER_IDS, set()).add(user_id)
@@ -0,0 +1,327 @@
+from dataclasses import dataclass
+from uuid import uuid4
+from typing import Optional
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    Subquery,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import with_polymorphic
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.domain.models import MD, MarkdownBlock, Tag
+from app.domain.repositories.md import MDRepository
+from app.domain.services.md_diff import StoredTag, TagPosition
+from app.infrastucture.db.expressions import position_range_expression
+
+from .base import SQLAlchemyRepository
+
+
+@dataclass(
+    eq=False,
+    frozen=True,
+    kw_only=True,
+)
+class SQLAlchemyMDRepository(SQLAlchemyRepository, MDRepository):
+    async def get_md(
+        self, user_id: str, md_id: str, for_update: bool = False
+    ) -> Optional[MD]:
+        """
+        Returns the document `md_id` of `user_id` without its tags. With `for_update` its
+        `mds` row stays locked until the unit of work ends, which serializes re-ingests.
+        """
+        stmp = select(MD).where(MD.id == md_id, MD.user_id == user_id)
+        if for_update:
+            stmp = stmp.with_for_update(of=MD.__table__)
+        return await self.session.scalar(stmp)
+
+    async def get_md_tags(self, user_id: str, md_id: str) -> list[Tag]:
+        """
+        Returns every tag of the document `md_id` of `user_id` ordered by position.
+        """
+        found = await self._get_positions_stale_from(user_id, md_id)
+        if found is None:
+            return []
+
+        tags = with_polymorphic(Tag, "*")
+        (stale_from,) = found
+        if stale_from is not None:
+            return await self._get_tags_with_summed_positions(tags, md_id)
+
+        result = await self.session.scalars(
+            select(tags).where(tags.md_id == md_id).order_by(tags.ordinal)
+        )
+        return result.all()
+
+    async def get_md_tags_in_range(
+        self,
+        user_id: str,
+        md_id: str,
+        start_pos: int,
+        end_pos: Optional[int] = None,
+    ) -> list[Tag]:
+        """
+        Returns the tags of the document `md_id` of `user_id` overlapping the character
+        range `[start_pos, end_pos)` ordered by position, `end_pos=None` reads to the end.
+
+        The `&&` overlap on `int4range(start_pos, end_pos)` is answered by the
+        `ix_tags_md_id_position` GiST index, so only the matching tags are read however
+        large the document is. Until the stored ranges of a re-ingested document are
+        refreshed, its positions are summed up from `ix_tags_md_id_ordinal` instead.
+        """
+        found = await self._get_positions_stale_from(user_id, md_id)
+        if found is None:
+            return []
+
+        tags = with_polymorphic(Tag, "*")
+        (stale_from,) = found
+        if stale_from is not None:
+            positions = self._md_tag_positions(md_id)
+            return await self._get_tags_with_summed_positions(
+                tags,
+                md_id,
+                position_range_expression(
+                    positions.c.start_pos, positions.c.end_pos
+                ).overlaps(position_range_expression(start_pos, end_pos)),
+                positions=positions,
+            )
+
+        result = await self.session.scalars(
+            self._range_statement(md_id=md_id, start_pos=start_pos, end_pos=end_pos)
+        )
+        return result.all()
+
+    async def insert_md_tags(
+        self, md_id: str, blocks: list[MarkdownBlock], positions: list[TagPosition]
+    ) -> int:
+        """
+        Inserts one batch of parsed blocks as the tags of the document `md_id` at their
+        `positions` and returns their number.
+
+        The ORM would flush every tag with its own pair of statements; instead the ids
+        are generated here and every table gets one executemany `INSERT`, `tags` first
+        and then the table of each subtype present in the batch.
+        """
+        if not blocks:
+            return 0
+
+        tag_rows = []
+        subtype_rows = {}
+        for block, position in zip(blocks, positions, strict=True):
+            tag_id = str(uuid4())
+            tag_rows.append(
+                {
+                    "id": tag_id,
+                    "md_id": md_id,
+                    "type": block.type,
+                    "ordinal": position.ordinal,
+                    "gap": position.gap,
+                    "length": position.length,
+                    "start_pos": block.start_pos,
+                    "end_pos": block.end_pos,
+                    "space_count": block.space_count,
+                    "content": block.content,
+                    "content_hash": block.content_hash,
+                }
+            )
+            subtype_rows.setdefault(block.type, []).append(
+                {"id": tag_id, **block.attributes}
+            )
+
+        await self.session.execute(insert(Tag.__table__), tag_rows)
+        for type, rows in subtype_rows.items():
+            table = Tag.__mapper__.polymorphic_map[type].local_table
+            await self.session.execute(insert(table), rows)
+        return len(tag_rows)
+
+    async def get_md_tag_hashes(self, md_id: str) -> list[StoredTag]:
+        """
+        Returns the id, hash, position and stored offset of every tag of `md_id` ordered
+        by position, without their content.
+        """
+        tags = Tag.__table__
+        result = await self.session.execute(
+            select(
+                tags.c.id,
+                tags.c.content_hash,
+                tags.c.ordinal,
+                tags.c.gap,
+                tags.c.length,
+                tags.c.start_pos,
+            )
+            .where(tags.c.md_id == md_id)
+            .order_by(tags.c.ordinal)
+        )
+        return [
+            StoredTag(
+                id=id,
+                content_hash=content_hash,
+                position=TagPosition(ordinal=ordinal, gap=gap, length=length),
+                start_pos=start_pos,
+            )
+            for id, content_hash, ordinal, gap, length, start_pos in result
+        ]
+
+    async def delete_md_tags(self, md_id: str, ids: list[str]) -> int:
+        """
+        Deletes the tags `ids` of `md_id` with their subtype rows, returns their number.
+        """
+        if not ids:
+            return 0
+
+        tags = Tag.__table__
+        for mapper in Tag.__mapper__.self_and_descendants:
+            if mapper.local_table is not tags:
+                table = mapper.local_table
+                await self.session.execute(delete(table).where(table.c.id == any_(ids)))
+        result = await self.session.execute(
+            delete(tags).where(tags.c.md_id == md_id, tags.c.id == any_(ids))
+        )
+        return result.rowcount
+
+    async def move_md_tags(self, md_id: str, positions: dict[str, TagPosition]) -> int:
+        """
+        Stores the new `positions` of tags of `md_id`, keyed by id, with one executemany
+        `UPDATE`, returns the number of moved tags.
+        """
+        if not positions:
+            return 0
+
+        tags = Tag.__table__
+        await self.session.execute(
+            update(tags)
+            .where(tags.c.md_id == md_id, tags.c.id == bindparam("tag_id"))
+            .values(
+                ordinal=bindparam("new_ordinal"),
+                gap=bindparam("new_gap"),
+                length=bindparam("new_length"),
+            ),
+            [
+                {
+                    "tag_id": tag_id,
+                    "new_ordinal": position.ordinal,
+                    "new_gap": position.gap,
+                    "new_length": position.length,
+                }
+                for tag_id, position in positions.items()
+            ],
+        )
+        return len(positions)
+
+    async def refresh_md_tag_positions(self, md_id: str, stale_from: int) -> int:
+        """
+        Rewrites the stored ranges of the tags of `md_id` from the ordinal `stale_from` on
+        with their running sums, returns the number of tags whose range changed.
+        """
+        tags = Tag.__table__
+        positions = self._md_tag_positions(md_id, stale_from)
+        result = await self.session.execute(
+            update(tags)
+            .where(
+                tags.c.md_id == md_id,
+                tags.c.id == positions.c.id,
+                or_(
+                    tags.c.start_pos != positions.c.start_pos,
+                    tags.c.end_pos != positions.c.end_pos,
+                ),
+            )
+            .values(start_pos=positions.c.start_pos, end_pos=positions.c.end_pos)
+        )
+        return result.rowcount
+
+    async def _get_positions_stale_from(self, user_id: str, md_id: str) -> Optional[Row]:
+        """
+        The `positions_stale_from` of the document `md_id` of `user_id` in a row, `None`
+        without such a document.
+        """
+        result = await self.session.execute(
+            select(MD.positions_stale_from).where(MD.id == md_id, MD.user_id == user_id)
+        )
+        return result.first()
+
+    async def _get_tags_with_summed_positions(
+        self,
+        tags,
+        md_id: str,
+        *criteria: ColumnElement[bool],
+        positions: Optional[Subquery] = None,
+    ) -> list[Tag]:
+        """
+        Tags of `md_id` matching `criteria` ordered by position, with the ranges summed up
+        from `positions` set in place of the stored ones without marking them changed.
+        """
+        if positions is None:
+            positions = self._md_tag_positions(md_id)
+        result = await self.session.execute(
+            select(tags, positions.c.start_pos, positions.c.end_pos)
+            .join(positions, positions.c.id == tags.id)
+            .where(*criteria)
+            .order_by(tags.ordinal)
+        )
+        found = []
+        for tag, start_pos, end_pos in result:
+            set_committed_value(tag, "start_pos", start_pos)
+            set_committed_value(tag, "end_pos", end_pos)
+            found.append(tag)
+        return found
+
+    @staticmethod
+    def _range_statement(md_id: str, start_pos: int, end_pos: Optional[int]) -> Select:
+        """
+        Tags of `md_id` whose stored range overlaps `[start_pos, end_pos)`, the `&&` the
+        `ix_tags_md_id_position` index answers.
+        """
+        tags = with_polymorphic(Tag, "*")
+        return (
+            select(tags)
+            .where(
+                tags.md_id == md_id,
+                position_range_expression(tags.start_pos, tags.end_pos).overlaps(
+                    position_range_expression(start_pos, end_pos)
+                ),
+            )
+            .order_by(tags.ordinal)
+        )
+
+    @staticmethod
+    def _md_tag_positions(md_id: str, from_ordinal: Optional[int] = None) -> Subquery:
+        """
+        `id`, `start_pos` and `end_pos` of the tags of `md_id`, the running sums of
+        `gap + length` in `ordinal` order. With `from_ordinal` only the tags from it on
+        are summed up, continuing from the stored `end_pos` of the tag before them.
+        """
+        tags = Tag.__table__
+        running_sum = func.sum(tags.c.gap + tags.c.length).over(order_by=tags.c.ordinal)
+        criteria = [tags.c.md_id == md_id]
+        if from_ordinal is not None:
+            criteria.append(tags.c.ordinal >= from_ordinal)
+            running_sum = running_sum + func.coalesce(
+                select(tags.c.end_pos)
+                .where(tags.c.md_id == md_id, tags.c.ordinal < from_ordinal)
+                .order_by(tags.c.ordinal.desc())
+                .limit(1)
+                .scalar_subquery(),
+                0,
+            )
+        end_pos = cast(running_sum, Integer)
+        return (
+            select(
+                tags.c.id,
+                (end_pos - tags.c.length).label("start_pos"),
+                end_pos.label("end_pos"),
+            )
+            .where(*criteria)
+            .subquery("positions")
+        )
@@ -0,0 +1,660 @@
+from dataclasses import dataclass
+from uuid import uuid4
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import (
+    JSON,
+    ChunkedIteratorResult,
+    Column,
+    ColumnElement,
+    Executable,
+    Select,
+    String,
+    and_,
+    any_,
+    column,
+    exists,
+    func,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    true,
+    tuple_,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from app.infrastucture.exceptions.sqlalchemy import DuplicateAddedEntity
+from app.domain.exceptions.external import RepetitionAlreadyExistsError
+from app.config import global_config
+from app.domain.utils import LRUCache, SieveValueErrorExceptionExternal
+from sqlalchemy.orm import (
+    Load,
+    defer,
+    make_transient_to_detached,
+    selectin_polymorphic,
+    selectinload,
+    with_expression,
+)
+
+from app.domain.models import (
+    ArrayMatchEnum,
+    LanguageEnum,
+    Repetition,
+    RepetitionContentTypeEnum,
+    SlugFacet,
+    SlugLoadStrategyEnum,
+    SlugRepetition,
+    WordArrayFieldEnum,
+    WordRepetition,
+    repetition_slug_association,
+    repetition_titles,
+)
+from app.domain.models.type import DateType
+from app.domain.repositories.repetition import RepetitionRepository
+from app.domain.services.repetition import RepetitionServices
+from app.infrastucture.db.session import SHARD
+from app.infrastucture.db.expressions import (
+    word_search_config_expression,
+    word_search_document_expression,
+    word_search_text_expression,
+)
+
+from .base import SQLAlchemyRepository
+from .review import SQLAlchemyReviewRepository
+
+ALWAYS_LOADED_FIELDS = ("id", "content_type", "date_repetition")
+
+# `ts_rank_cd` normalization `rank / (rank + 1)`, which keeps the rank within `[0, 1]`.
+RANK_NORMALIZATION = 32
+
+# (shard, slug name) -> id. Slugs are never renamed or deleted, so a cached id never goes stale.
+slug_id_cache: LRUCache[tuple[int, str], str] = LRUCache(
+    maxsize=global_config.SLUG_CACHE_SIZE
+)
+
+AGGREGATED_SLUGS = (
+    select(
+        func.coalesce(
+            func.json_agg(
+                func.json_build_object(
+                    "id", SlugRepetition.id, "name", SlugRepetition.name
+                )
+            ),
+            literal_column("'[]'::json"),
+            type_=JSON,
+        )
+    )
+    .select_from(repetition_slug_association)
+    .join(SlugRepetition, SlugRepetition.id == repetition_slug_association.c.slug_id)
+    .where(repetition_slug_association.c.repetition_id == Repetition.id)
+    .correlate(Repetition)
+    .scalar_subquery()
+)
+
+
+@dataclass(
+    eq=False,
+    frozen=True,
+    kw_only=True,
+)
+class SQLAlchemyRepetitionRepository(SQLAlchemyRepository, RepetitionRepository):
+    services = RepetitionServices()
+    slug_cache = slug_id_cache
+
+    async def get_all_repetitions(
+        self,
+        user_id: str,
+        start_date: DateType,
+        end_date: DateType,
+        limit: int,
+        offset: int,
+        after: Optional[tuple[int, str]] = None,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+        slugs: Optional[list[str]] = None,
+    ) -> List[WordRepetition]:
+        """
+        Returns repetitions of `user_id` scheduled between `start_date` and `end_date`
+        ordered by `(date_repetition, id)`, which is a single range scan over
+        `ix_repetitions_user_id_date_repetition_id`.
+
+        When `after` is passed the page is taken by seeking past that `(date_repetition, id)` key
+        instead of skipping `offset` rows, so the cost of a page does not grow with its depth.
+        Rows added or removed before the key no longer shift the later pages, but the key is
+        not immutable: a repetition reviewed between two pages changes its `date_repetition`
+        and may be returned again or not at all.
+
+        When `fields` is passed every other column is deferred and `slugs` are loaded only if requested.
+        `slug_strategy` chooses between a follow-up `selectinload` query for `slugs` and
+        aggregating them into `aggregated_slugs` inside the page query itself.
+        When `slugs` is passed only repetitions tagged with at least one of them are returned.
+        """
+        stmp = self._due_statement(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            fields=fields,
+            slug_strategy=slug_strategy,
+            slugs=slugs,
+        ).limit(limit)
+
+        if after is not None:
+            stmp = stmp.where(
+                tuple_(Repetition.date_repetition, Repetition.id) > tuple_(*after)
+            )
+        else:
+            stmp = stmp.offset(offset)
+
+        result: ChunkedIteratorResult = await self.session.execute(stmp)
+        return result.scalars().all()
+
+    async def stream_repetitions(
+        self,
+        user_id: str,
+        start_date: DateType,
+        end_date: DateType,
+        chunk_size: int = 1000,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+        slugs: Optional[list[str]] = None,
+    ) -> AsyncIterator[Repetition]:
+        """
+        Yields the same rows as `get_all_repetitions` through a server-side cursor,
+        fetching `chunk_size` rows per round trip. Every row is expunged once the
+        consumer is done with it, so the identity map does not grow with the result.
+        """
+        stmp = self._due_statement(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            fields=fields,
+            slug_strategy=slug_strategy,
+            slugs=slugs,
+        )
+        result = await self.session.stream_scalars(
+            stmp.execution_options(yield_per=chunk_size)
+        )
+
+        async for repetition in result:
+            yield repetition
+            self.session.expunge(repetition)
+
+    async def count_due_by_slug(
+        self,
+        user_id: str,
+        start_date: DateType,
+        end_date: DateType,
+    ) -> list[SlugFacet]:
+        """
+        Counts the repetitions of `user_id` due between `start_date` and `end_date` per slug
+        with one grouped query, most frequent slugs first. Slugs without due repetitions are
+        left out, repetitions without slugs are not counted.
+        """
+        stmp = (
+            select(SlugRepetition.name, func.count().label("due"))
+            .select_from(Repetition)
+            .join(
+                repetition_slug_association,
+                repetition_slug_association.c.repetition_id == Repetition.id,
+            )
+            .join(SlugRepetition, SlugRepetition.id == repetition_slug_association.c.slug_id)
+            .where(
+                Repetition.user_id == user_id,
+                Repetition.date_repetition.between(
+                    start_date.timestamp, end_date.timestamp
+                ),
+            )
+            .group_by(SlugRepetition.name)
+            .order_by(func.count().desc(), SlugRepetition.name)
+        )
+
+        result = await self.session.execute(stmp)
+        return [SlugFacet(name=name, due=due) for name, due in result]
+
+    async def search_word_repetitions(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+        offset: int,
+        language: Optional[LanguageEnum] = None,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    ) -> List[WordRepetition]:
+        """
+        Returns word repetitions of `user_id` matching `query`, best matches first.
+
+        A word matches when its full-text document, stemmed in the language of the word,
+        matches `query` parsed with `websearch_to_tsquery` in that language, or when
+        `query` is trigram-similar to a part of its text, which catches typos and prefixes.
+        The full-text condition is spelled out once per language, so every branch is
+        answered by `ix_word_repetitions_search_document` and the trigram branch by
+        `ix_word_repetitions_search_trigram`. Matches are ranked by the sum of the
+        normalized `ts_rank_cd` and `word_similarity`, both within `[0, 1]`.
+        """
+        stmp = self._search_statement(
+            user_id=user_id,
+            query=query,
+            language=language,
+            fields=fields,
+            slug_strategy=slug_strategy,
+        ).limit(limit).offset(offset)
+
+        result: ChunkedIteratorResult = await self.session.execute(stmp)
+        return result.scalars().all()
+
+    async def find_word_repetitions_by_array(
+        self,
+        user_id: str,
+        field: WordArrayFieldEnum,
+        values: list[str],
+        match: ArrayMatchEnum,
+        limit: int,
+        offset: int,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    ) -> List[WordRepetition]:
+        """
+        Returns word repetitions of `user_id` whose array `field` contains all of `values`
+        (`@>`) or shares at least one of them (`&&`), depending on `match`.
+        Both operators are answered by the GIN index of `field`.
+        """
+        array = getattr(WordRepetition, field.value)
+        condition = (
+            array.contains(values)
+            if match == ArrayMatchEnum.CONTAINS
+            else array.overlap(values)
+        )
+        stmp = (
+            select(WordRepetition)
+            .options(*self._load_options(fields, slug_strategy))
+            .where(WordRepetition.user_id == user_id, condition)
+            .order_by(WordRepetition.id)
+            .limit(limit)
+            .offset(offset)
+        )
+
+        result: ChunkedIteratorResult = await self.session.execute(stmp)
+        return result.scalars().all()
+
+    async def get_related_word_repetitions(
+        self,
+        user_id: str,
+        repetition_ids: list[str],
+        field: WordArrayFieldEnum,
+        limit: int,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    ) -> dict[str, list[WordRepetition]]:
+        """
+        For each of `repetition_ids`, returns up to `limit` other word repetitions of `user_id`
+        sharing at least one value of the array `field` with it, e.g. a synonym.
+
+        The whole batch is resolved by one query: a `LATERAL` subquery probes the GIN index
+        of `field` once per requested repetition and the related rows are loaded in the same
+        statement. Ids which are unknown or belong to another user map to an empty list.
+        """
+        words = WordRepetition.__table__
+        repetitions = Repetition.__table__
+        source = words.alias("source")
+        source_repetition = repetitions.alias("source_repetition")
+
+        related = (
+            select(words.c.id)
+            .join(repetitions, repetitions.c.id == words.c.id)
+            .where(
+                words.c[field.value].overlap(source.c[field.value]),
+                words.c.id != source.c.id,
+                repetitions.c.user_id == user_id,
+            )
+            .order_by(words.c.id)
+            .limit(limit)
+            .lateral("related")
+        )
+        pairs = (
+            select(source.c.id.label("source_id"), related.c.id.label("related_id"))
+            .select_from(
+                source.join(
+                    source_repetition, source_repetition.c.id == source.c.id
+                ).join(related, true())
+            )
+            .where(
+                source.c.id == any_(repetition_ids),
+                source_repetition.c.user_id == user_id,
+            )
+            .subquery("pairs")
+        )
+        stmp = (
+            select(pairs.c.source_id, WordRepetition)
+            .join(WordRepetition, WordRepetition.id == pairs.c.related_id)
+            .options(*self._load_options(fields, slug_strategy))
+            .order_by(pairs.c.source_id, WordRepetition.id)
+        )
+
+        groups: dict[str, list[WordRepetition]] = {
+            repetition_id: [] for repetition_id in repetition_ids
+        }
+        for source_id, repetition in await self.session.execute(stmp):
+            groups[source_id].append(repetition)
+        return groups
+
+    @classmethod
+    def warm_up_statements(cls) -> list[Executable]:
+        """
+        The hot statements of the request path with parameters matching no rows, for
+        `DatabaseSessionManager.warm_up` to prepare on every pooled connection. Their SQL
+        must stay identical to what the repository methods send, or the prepared ones are
+        missed.
+        """
+        epoch = DateType(0)
+        due_page = cls._due_statement(user_id="", start_date=epoch, end_date=epoch)
+
+        return [
+            due_page.limit(1).offset(0),
+            due_page.limit(1).where(
+                tuple_(Repetition.date_repetition, Repetition.id) > tuple_(0, "")
+            ),
+            SQLAlchemyReviewRepository._schedule_update(step=1, reviewed_at=0).where(
+                Repetition.id == "",
+                Repetition.user_id == "",
+            ),
+        ]
+
+    @classmethod
+    def _search_statement(
+        cls,
+        user_id: str,
+        query: str,
+        language: Optional[LanguageEnum] = None,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    ) -> Select:
+        """
+        Selects every match of `search_word_repetitions` in rank order, without a page.
+        """
+        search_fields = (
+            WordRepetition.word,
+            WordRepetition.translate,
+            WordRepetition.synonyms,
+            WordRepetition.examples,
+            WordRepetition.context,
+        )
+        document = word_search_document_expression(
+            WordRepetition.language, *search_fields
+        )
+        text = word_search_text_expression(*search_fields)
+        languages = [language] if language else list(LanguageEnum)
+
+        def tsquery(word_language: ColumnElement) -> ColumnElement:
+            return func.websearch_to_tsquery(
+                word_search_config_expression(word_language), query
+            )
+
+        rank = func.ts_rank_cd(
+            document, tsquery(WordRepetition.language), RANK_NORMALIZATION
+        ) + func.word_similarity(query, text)
+
+        stmp = (
+            select(WordRepetition)
+            .options(*cls._load_options(fields, slug_strategy))
+            .where(
+                WordRepetition.user_id == user_id,
+                or_(
+                    *(
+                        and_(
+                            WordRepetition.language == word_language,
+                            document.bool_op("@@")(
+                                tsquery(
+                                    literal(word_language, WordRepetition.language.type)
+                                )
+                            ),
+                        )
+                        for word_language in languages
+                    ),
+                    literal(query).bool_op("<%")(text),
+                ),
+            )
+            .order_by(rank.desc(), WordRepetition.id)
+        )
+        if language:
+            stmp = stmp.where(WordRepetition.language == language)
+        return stmp
+
+    @classmethod
+    def _due_statement(
+        cls,
+        user_id: str,
+        start_date: DateType,
+        end_date: DateType,
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+        slugs: Optional[list[str]] = None,
+    ) -> Select:
+        """
+        Selects only the `repetitions` base rows. Subtype columns are not joined in:
+        `selectin_polymorphic` makes the ORM follow up with one `SELECT ... WHERE id IN
+        (...)` per content type present in the page.
+        """
+        subtypes = [
+            mapper.class_
+            for mapper in Repetition.__mapper__.self_and_descendants
+            if mapper is not Repetition.__mapper__
+        ]
+        stmp = (
+            select(Repetition)
+            .options(
+                selectin_polymorphic(Repetition, subtypes),
+                *cls._load_options(fields, slug_strategy),
+            )
+            .where(
+                Repetition.user_id == user_id,
+                Repetition.date_repetition.between(
+                    start_date.timestamp, end_date.timestamp
+                ),
+            )
+            .order_by(Repetition.date_repetition, Repetition.id)
+        )
+        if slugs:
+            stmp = stmp.where(cls._tagged_with(slugs))
+        return stmp
+
+    @staticmethod
+    def _tagged_with(slugs: list[str]) -> ColumnElement[bool]:
+        """
+        `EXISTS` semi-join matching repetitions tagged with at least one of `slugs`.
+        The slug names resolve to ids through the unique index on `name` and every
+        candidate repetition costs one probe of the `(repetition_id, slug_id)` index.
+        """
+        return exists().where(
+            repetition_slug_association.c.repetition_id == Repetition.id,
+            repetition_slug_association.c.slug_id.in_(
+                select(SlugRepetition.id).where(SlugRepetition.name == any_(slugs))
+            ),
+        )
+
+    @staticmethod
+    def _load_options(
+        fields: Optional[list[str]] = None,
+        slug_strategy: SlugLoadStrategyEnum = SlugLoadStrategyEnum.SELECTIN,
+    ) -> list[Load]:
+        """
+        Translates the requested `fields` into loader options: every column outside of
+        `fields` and `ALWAYS_LOADED_FIELDS` is deferred on the base mapper and on each
+        subtype mapper, so the selectin subtype queries shrink as well.
+        """
+        slugs_options = (
+            [with_expression(Repetition.aggregated_slugs, AGGREGATED_SLUGS)]
+            if slug_strategy == SlugLoadStrategyEnum.AGGREGATE
+            # `aggregated_slugs` is still marked loaded, as `None`. Reading an unloaded
+            # expression on a subtype row makes the ORM look for it in the subtype table.
+            else [
+                selectinload(Repetition.slugs),
+                with_expression(Repetition.aggregated_slugs, null()),
+            ]
+        )
+        if not fields:
+            return slugs_options
+
+        loaded = {*fields, *ALWAYS_LOADED_FIELDS}
+        options = list(slugs_options) if "slugs" in loaded else []
+        base_mapper = Repetition.__mapper__
+
+        for mapper in base_mapper.self_and_descendants:
+            for column_attr in mapper.column_attrs:
+                if column_attr.key in loaded:
+                    continue
+                if not isinstance(column_attr.expression, Column):
+                    continue
+                if mapper is not base_mapper and column_attr.key in base_mapper.attrs:
+                    continue
+                options.append(defer(getattr(mapper.class_, column_attr.key)))
+
+        return options
+
+    async def update_repetition(
+        repetition_id,
+        title=None,
+        description=None,
+        document_link=None,
+        slug=None,
+    ) -> Repetition:
+        pass
+
+    async def create_repetition(
+        self,
+        content_type: RepetitionContentTypeEnum,
+        **kwargs,
+    ):
+        """
+        Creates the repetition inside a savepoint which is flushed on exit, so a duplicate
+        is reported right away without discarding the rest of the unit of work.
+        The enclosing unit of work commits it.
+
+        The title is claimed in `repetition_titles` inside the same savepoint. A concurrent
+        claim of the same title waits on its primary key, so only one of them succeeds.
+        """
+        try:
+            async with self.session.begin_nested():
+                if "slugs" in kwargs:
+                    kwargs["slugs"] = await self.resolve_slugs(kwargs["slugs"])
+                repetition_model = self.services.create_repetition_model(
+                    content_type=content_type,
+                    **kwargs,
+                )
+                if not await self._claim_title(repetition_model.title):
+                    raise RepetitionAlreadyExistsError(
+                        repetition_title=repetition_model.title
+                    )
+                self.session.add(repetition_model)
+
+            self._mark_written(kwargs["user_id"])
+            return repetition_model
+
+        except IntegrityError:
+            raise DuplicateAddedEntity(
+                fields=[
+                    *kwargs.keys(),
+                    "title",
+                    "user_id",
+                    "slugs",
+                    "content_type",
+                ]
+            )
+        except SieveValueErrorExceptionExternal:
+            raise
+
+    async def _claim_title(self, title: str) -> bool:
+        """
+        Inserts `title` into `repetition_titles`, returns `False` if it was taken.
+        """
+        claimed = await self.session.scalar(
+            pg_insert(repetition_titles)
+            .values(title=title)
+            .on_conflict_do_nothing()
+            .returning(repetition_titles.c.title)
+        )
+        return claimed is not None
+
+    async def resolve_slugs(self, names: Optional[list[str]]) -> list[SlugRepetition]:
+        """
+        Gets or creates the slugs named `names` and attaches them to the session as
+        persistent objects, so assigning them to a repetition inserts only association rows.
+        """
+        names = list(dict.fromkeys(names or []))
+        slug_ids = await self.get_or_create_slug_ids(names)
+
+        slugs = []
+        for name in names:
+            slug = SlugRepetition(id=slug_ids[name], name=name)
+            make_transient_to_detached(slug)
+            slugs.append(await self.session.merge(slug, load=False))
+        return slugs
+
+    async def get_or_create_slug_ids(self, names: list[str]) -> dict[str, str]:
+        """
+        Returns the id of every slug in `names`, creating the missing ones.
+
+        Names found in `slug_cache` cost nothing. All others are resolved together by one
+        `INSERT ... ON CONFLICT DO NOTHING RETURNING` combined with a lookup of the names
+        which already existed. Only those existing ids are cached: a slug created here is
+        still uncommitted and would leave a stale id behind if the transaction rolled back.
+        A name created concurrently by another transaction is picked up by a second lookup.
+        Every shard has its own slug ids, so the cache is keyed by the shard of the session.
+        """
+        shard = self.session.info.get(SHARD, 0)
+        names = list(dict.fromkeys(names))
+        slug_ids = {
+            name: id
+            for (_, name), id in self.slug_cache.get_many(
+                (shard, name) for name in names
+            ).items()
+        }
+        missing = [name for name in names if name not in slug_ids]
+
+        if missing:
+            result = await self.session.execute(self._get_or_create_slugs(missing))
+            for id, name, created in result:
+                slug_ids[name] = id
+                if not created:
+                    self.slug_cache.put((shard, name), id)
+
+        if len(slug_ids) < len(names):
+            result = await self.session.execute(
+                select(SlugRepetition.id, SlugRepetition.name).where(
+                    SlugRepetition.name.in_(
+                        [name for name in names if name not in slug_ids]
+                    )
+                )
+            )
+            for id, name in result:
+                slug_ids[name] = id
+                self.slug_cache.put((shard, name), id)
+
+        return slug_ids
+
+    @staticmethod
+    def _get_or_create_slugs(names: list[str]) -> Select:
+        slugs = SlugRepetition.__table__
+        new_slugs = values(
+            column("id", String),
+            column("name", String),
+            name="new_slugs",
+        ).data([(str(uuid4()), name) for name in names])
+        created = (
+            pg_insert(slugs)
+            .from_select(["id", "name"], select(new_slugs.c.id, new_slugs.c.name))
+            .on_conflict_do_nothing(index_elements=[slugs.c.name])
+            .returning(slugs.c.id, slugs.c.name)
+            .cte("created")
+        )
+
+        # Both branches read the snapshot taken before the insert, so a name is never
+        # returned twice.
+        return select(created.c.id, created.c.name, literal(True)).union_all(
+            select(slugs.c.id, slugs.c.name, literal(False)).where(
+                slugs.c.name.in_(names)
+            )
+        )
@@ -0,0 +1,212 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pendulum
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    String,
+    Update,
+    column,
+    func,
+    select,
+    update,
+    values,
+)
+from app.domain.exceptions.external import RepetitionNotFoundError
+
+from app.domain.models import (
+    Repetition,
+    RepetitionStatusEnum,
+    Review,
+    ReviewResult,
+)
+from app.domain.repositories.review import ReviewRepository
+from app.infrastucture.db.expressions import (
+    calc_date_repetition_expression,
+    next_count_repetition_expression,
+)
+
+from .base import SQLAlchemyRepository
+
+
+@dataclass(
+    eq=False,
+    frozen=True,
+    kw_only=True,
+)
+class SQLAlchemyReviewRepository(SQLAlchemyRepository, ReviewRepository):
+    async def review_repetition(
+        self,
+        user_id: str,
+        review: Review,
+    ) -> ReviewResult:
+        """
+        Applies one review as a single atomic `UPDATE ... RETURNING`.
+
+        The new counter and date are computed by Postgres from the row it locks, so there is
+        no read-modify-write window and concurrent reviews of the same card from several
+        devices are applied one after another instead of overwriting each other.
+
+        Raises:
+            RepetitionNotFoundError: If `user_id` has no repetition with this id.
+        """
+        stmp = self._schedule_update(
+            step=review.step,
+            reviewed_at=review.reviewed_at,
+        ).where(
+            Repetition.id == review.repetition_id,
+            Repetition.user_id == user_id,
+        )
+
+        row = (await self.session.execute(stmp)).one_or_none()
+        if row is None:
+            raise RepetitionNotFoundError(repetition_id=review.repetition_id)
+
+        self._mark_written(user_id)
+        return ReviewResult(*row)
+
+    async def apply_reviews(
+        self,
+        user_id: str,
+        reviews: list[Review],
+    ) -> list[ReviewResult]:
+        """
+        Applies a batch of review outcomes of `user_id` with one set-based
+        `UPDATE repetitions ... FROM (VALUES ...) RETURNING` per round.
+
+        A repetition reviewed several times in one batch is updated once per round
+        in `reviewed_at` order, so the result equals applying the reviews one by one.
+        Ids which do not exist or belong to another user are skipped and missing from the result.
+        """
+        results: dict[str, ReviewResult] = {}
+
+        for review_round in self._review_rounds(reviews):
+            reviews_values = values(
+                column("id", String),
+                column("step", Integer),
+                column("reviewed_at", Integer),
+                name="reviews",
+            ).data(
+                [
+                    (review.repetition_id, review.step, review.reviewed_at)
+                    for review in review_round
+                ]
+            )
+            stmp = self._schedule_update(
+                step=reviews_values.c.step,
+                reviewed_at=reviews_values.c.reviewed_at,
+            ).where(
+                Repetition.id == reviews_values.c.id,
+                Repetition.user_id == user_id,
+            )
+
+            result = await self.session.execute(stmp)
+            for row in result:
+                results[row.id] = ReviewResult(*row)
+
+        self._mark_written(user_id)
+        return list(results.values())
+
+    async def successful_repetition(
+        self,
+        user_id: str,
+        repetition_id: str,
+    ) -> ReviewResult:
+        return await self.review_repetition(
+            user_id=user_id,
+            review=Review(
+                repetition_id=repetition_id,
+                repetition_status=RepetitionStatusEnum.SUCCESSFUL,
+                reviewed_at=pendulum.now().int_timestamp,
+            ),
+        )
+
+    async def unsuccessful_repetition(
+        self,
+        user_id: str,
+        repetition_id: str,
+    ) -> ReviewResult:
+        return await self.review_repetition(
+            user_id=user_id,
+            review=Review(
+                repetition_id=repetition_id,
+                repetition_status=RepetitionStatusEnum.UNSUCCESSFUL,
+                reviewed_at=pendulum.now().int_timestamp,
+            ),
+        )
+
+    async def get_schedule_state(
+        self,
+        due_before: int,
+        user_id: Optional[str] = None,
+        chunk_size: int = 100_000,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Loads `count_repetition` and `date_repetition` of every repetition due before
+        `due_before`, for `user_id` or for the whole table when it is `None`.
+
+        Only the two integer columns are selected and they are streamed `chunk_size`
+        rows at a time straight into int64 arrays, without building ORM objects.
+        """
+        stmp = select(
+            func.coalesce(Repetition.count_repetition, 0),
+            Repetition.date_repetition,
+        ).where(Repetition.date_repetition < due_before)
+        if user_id is not None:
+            stmp = stmp.where(Repetition.user_id == user_id)
+
+        result = await self.session.stream(stmp.execution_options(yield_per=chunk_size))
+        chunks = [
+            np.array(partition, dtype=np.int64).reshape(-1, 2)
+            async for partition in result.partitions()
+        ]
+
+        state = np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=np.int64)
+        return state[:, 0], state[:, 1]
+
+    @staticmethod
+    def _schedule_update(
+        step: ColumnElement[int] | int,
+        reviewed_at: ColumnElement[int] | int,
+    ) -> Update:
+        """
+        Builds the `UPDATE` which moves the schedule the way `Repetition.update_repetition_schedule`
+        does, returning `(id, count_repetition, date_repetition)`.
+        """
+        count_repetition = next_count_repetition_expression(
+            Repetition.count_repetition, step
+        )
+        return (
+            update(Repetition)
+            .values(
+                count_repetition=count_repetition,
+                date_repetition=calc_date_repetition_expression(
+                    count_repetition=count_repetition,
+                    step=step,
+                    date_repetition=Repetition.date_repetition,
+                ),
+                date_last_repetition=reviewed_at,
+            )
+            .returning(
+                Repetition.id,
+                Repetition.count_repetition,
+                Repetition.date_repetition,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _review_rounds(reviews: list[Review]) -> list[list[Review]]:
+        rounds: list[list[Review]] = []
+        seen: dict[str, int] = {}
+
+        for review in sorted(reviews, key=lambda review: review.reviewed_at):
+            round_index = seen.get(review.repetition_id, 0)
+            seen[review.repetition_id] = round_index + 1
+            if round_index == len(rounds):
+                rounds.append([])
+            rounds[round_index].append(review)
+
+        return rounds
@@ -0,0 +1,243 @@
+from dataclasses import dataclass
+from uuid import uuid4
+
+import pendulum
+from sqlalchemy import (
+    Delete,
+    Enum as SQLEnum,
+    Insert,
+    any_,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.exc import IntegrityError
+from app.infrastucture.exceptions.sqlalchemy import DuplicateAddedEntity
+from app.domain.exceptions.base import BaseExceptionExternal
+from app.domain.exceptions.external import RepetitionAlreadyExistsError
+
+from app.domain.models import (
+    ImportReport,
+    ImportRowError,
+    Repetition,
+    RepetitionContentTypeEnum,
+    SlugRepetition,
+    WordRepetition,
+    repetition_slug_association,
+    repetition_titles,
+)
+from app.domain.models.repetition import calc_date_repetition
+from app.domain.repositories.word_import import WordImportRepository
+from app.domain.services.repetition import RepetitionServices
+from app.infrastucture.db.staging import import_slugs_staging, import_words_staging
+
+from .base import SQLAlchemyRepository
+
+
+@dataclass(
+    eq=False,
+    frozen=True,
+    kw_only=True,
+)
+class SQLAlchemyWordImportRepository(SQLAlchemyRepository, WordImportRepository):
+    services = RepetitionServices()
+
+    async def import_word_repetitions(
+        self,
+        user_id: str,
+        rows: list[tuple[int, dict | Exception]],
+    ) -> ImportReport:
+        """
+        Imports one batch of parsed `(line, row)` pairs as word repetitions of `user_id`
+        inside one savepoint. The staging tables are dropped on commit, so the unit of
+        work must be committed before the next batch is imported.
+
+        Valid rows and their slug names are loaded with asyncpg `COPY` into temporary
+        staging tables. Rows whose word or title already exists, in the table or on an
+        earlier line, are removed from staging and reported; the rest is written with one
+        `INSERT ... SELECT` per target table. Rows which could not be parsed or validated
+        are reported with their line and nothing is written for them.
+        """
+        report = ImportReport()
+        records = []
+        for line, row in rows:
+            try:
+                if isinstance(row, Exception):
+                    raise row
+                record = self.services.create_word_import_record(user_id, row)
+                records.append((line, record))
+            except (BaseExceptionExternal, ValueError) as e:
+                message = (
+                    e.get_message() if isinstance(e, BaseExceptionExternal) else str(e)
+                )
+                report.errors.append(ImportRowError(line=line, message=message))
+
+        if not records:
+            return report
+
+        try:
+            async with self.session.begin_nested():
+                await self._copy_to_staging(records)
+                duplicates = await self.session.execute(
+                    self._delete_duplicated_staging_rows()
+                )
+                report.errors.extend(
+                    ImportRowError(
+                        line=line,
+                        message=RepetitionAlreadyExistsError(
+                            repetition_title=title
+                        ).get_message(),
+                    )
+                    for line, title in duplicates
+                )
+
+                for stmp in self._import_staging_statements(user_id):
+                    result = await self.session.execute(stmp)
+                    if stmp.table is Repetition.__table__:
+                        report.imported = result.rowcount
+            self._mark_written(user_id)
+        except IntegrityError:
+            message = DuplicateAddedEntity(fields=["title", "word"]).get_message()
+            report.imported = 0
+            report.errors.extend(
+                ImportRowError(line=line, message=message) for line, _ in records
+            )
+
+        return report
+
+    async def _copy_to_staging(self, records: list[tuple[int, dict]]):
+        """
+        Creates the staging tables through the session, which opens its transaction,
+        and fills them with `COPY` on the underlying asyncpg connection of that transaction.
+        """
+        await self.session.execute(CreateTable(import_words_staging))
+        await self.session.execute(CreateTable(import_slugs_staging))
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        record_columns = [
+            column.name
+            for column in import_words_staging.c
+            if column.name not in ("line", "id")
+        ]
+        await driver_connection.copy_records_to_table(
+            import_words_staging.name,
+            columns=["line", "id", *record_columns],
+            records=[
+                (line, str(uuid4()), *(record.get(column) for column in record_columns))
+                for line, record in records
+            ],
+        )
+
+        slug_names = dict.fromkeys(
+            name for _, record in records for name in record["slugs"]
+        )
+        await driver_connection.copy_records_to_table(
+            import_slugs_staging.name,
+            columns=["id", "name"],
+            records=[(str(uuid4()), name) for name in slug_names],
+        )
+
+    @staticmethod
+    def _delete_duplicated_staging_rows() -> Delete:
+        staging = import_words_staging
+        earlier = staging.alias("earlier")
+        words = WordRepetition.__table__
+
+        return (
+            delete(staging)
+            .where(
+                or_(
+                    exists().where(words.c.word == staging.c.word),
+                    exists().where(repetition_titles.c.title == staging.c.title),
+                    exists().where(
+                        or_(
+                            earlier.c.word == staging.c.word,
+                            earlier.c.title == staging.c.title,
+                        ),
+                        earlier.c.line < staging.c.line,
+                    ),
+                )
+            )
+            .returning(staging.c.line, staging.c.title)
+        )
+
+    @staticmethod
+    def _import_staging_statements(user_id: str) -> list[Insert]:
+        staging = import_words_staging
+        repetitions = Repetition.__table__
+        words = WordRepetition.__table__
+        slugs = SlugRepetition.__table__
+        word_columns = [
+            column.name
+            for column in staging.c
+            if column.name in words.c and column.name != "id"
+        ]
+
+        return [
+            pg_insert(slugs)
+            .from_select(
+                ["id", "name"],
+                select(import_slugs_staging.c.id, import_slugs_staging.c.name).where(
+                    import_slugs_staging.c.name.in_(
+                        select(func.unnest(staging.c.slugs))
+                    )
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=[slugs.c.name]),
+            # Fails the batch on a title claimed since the duplicates were removed.
+            insert(repetition_titles).from_select(["title"], select(staging.c.title)),
+            insert(repetitions).from_select(
+                [
+                    "id",
+                    "content_type",
+                    "count_repetition",
+                    "date_repetition",
+                    "title",
+                    "user_id",
+                ],
+                select(
+                    staging.c.id,
+                    literal(
+                        RepetitionContentTypeEnum.WORD,
+                        repetitions.c.content_type.type,
+                    ),
+                    literal(0),
+                    literal(
+                        calc_date_repetition(
+                            date_repetition=pendulum.now().int_timestamp
+                        )
+                    ),
+                    staging.c.title,
+                    literal(user_id),
+                ),
+            ),
+            insert(words).from_select(
+                ["id", *word_columns],
+                select(
+                    staging.c.id,
+                    *(
+                        # Enum values are staged as text.
+                        cast(staging.c[column], words.c[column].type)
+                        if isinstance(words.c[column].type, SQLEnum)
+                        else staging.c[column]
+                        for column in word_columns
+                    ),
+                ),
+            ),
+            insert(repetition_slug_association).from_select(
+                ["repetition_id", "slug_id"],
+                select(staging.c.id, slugs.c.id).join(
+                    slugs, slugs.c.name == any_(staging.c.slugs)
+                ),
+            ),
+        ]
@@ -1,9 +1,24 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.api.dependencies import write_position_header
 from app.api.routes import repetition_route, with_auth_repetition_route
 from app.config import global_config
+from app.infrastucture.db.session import session_manager
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    session_manager.init()
+    await session_manager.warm_up(SQLAlchemyRepetitionRepository.warm_up_statements())
+    yield
+    await session_manager.close()
+
 
-app = FastAPI(debug=global_config.MODE)
+app = FastAPI(debug=global_config.MODE, lifespan=lifespan)
+app.middleware("http")(write_position_header)
 app.include_router(with_auth_repetition_route)
 app.include_router(repetition_route)
 
@@ -1,14 +1,14 @@
-from fastapi import File, Form, UploadFile
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
-from app.domain.models import LanguageEnum, PartOfSpeachEnum
+from app.api.date_type import DateType
+from app.domain.models import (
+    LanguageEnum,
+    PartOfSpeachEnum,
+    RepetitionStatusEnum,
+    Review,
+)
 
-
-class CreateFileRepetitionRequest(BaseModel):
-    user_id: str
-    title: str
-    document: UploadFile = File(...)
-    document_variant: str
+MAX_REVIEWS_PER_BATCH = 5000
 
 
 class CreateWordRepetitionRequest(BaseModel):
@@ -23,3 +23,32 @@ class CreateWordRepetitionRequest(BaseModel):
     language: LanguageEnum
     translate: list[str]
     slugs: list[str]
+
+
+class ReviewRequest(BaseModel):
+    id: str
+    status: RepetitionStatusEnum
+    reviewed_at: DateType
+
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, status: RepetitionStatusEnum) -> RepetitionStatusEnum:
+        if status == RepetitionStatusEnum.STARTING:
+            raise ValueError("Review status must be SUCCESSFUL or UNSUCCESSFUL.")
+        return status
+
+    def to_review(self) -> Review:
+        return Review(
+            repetition_id=self.id,
+            repetition_status=self.status,
+            reviewed_at=self.reviewed_at.timestamp,
+        )
+
+
+class SubmitReviewRequest(ReviewRequest):
+    user_id: str
+
+
+class SubmitReviewsRequest(BaseModel):
+    user_id: str
+    reviews: list[ReviewRequest] = Field(min_length=1, max_length=MAX_REVIEWS_PER_BATCH)
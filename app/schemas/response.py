@@ -1,5 +1,5 @@
-from typing import TypeVar, Generic, Union, Annotated, List
-from app.domain.models import WordRepetitionSchema
+from typing import TypeVar, Generic, Union, Annotated, List, Optional
+from app.domain.models import MDSchema, TagSchema, WordRepetitionSchema
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -9,6 +9,7 @@ class TotalResponse(BaseModel, Generic[T]):
     status: int
     details: str
     model: T | List
+    next_cursor: Optional[str] = None
 
 
 RepetitionSchemaResponse = Annotated[
@@ -18,3 +19,63 @@ RepetitionSchemaResponse = Annotated[
     ],
     "RepetitionSchema",
 ]
+
+
+MDSchemaResponse = TotalResponse[MDSchema]
+
+
+TagSchemaResponse = TotalResponse[TagSchema]
+
+
+RelatedRepetitionSchemaResponse = TotalResponse[dict[str, list[WordRepetitionSchema]]]
+
+
+class ReviewResultSchema(BaseModel):
+    id: str
+    count_repetition: int
+    date_repetition: int
+
+
+ReviewResultSchemaResponse = TotalResponse[ReviewResultSchema]
+
+
+class ForecastDaySchema(BaseModel):
+    date: int
+    due: int
+    successful: int
+    unsuccessful: int
+
+
+ForecastDaySchemaResponse = TotalResponse[ForecastDaySchema]
+
+
+class ImportRowErrorSchema(BaseModel):
+    line: int
+    message: str
+
+
+class ImportReportSchema(BaseModel):
+    imported: int
+    failed: int
+    errors: list[ImportRowErrorSchema]
+
+
+ImportReportSchemaResponse = TotalResponse[ImportReportSchema]
+
+
+class MDTagDiffSchema(BaseModel):
+    inserted: int
+    deleted: int
+    moved: int
+    unchanged: int
+
+
+MDTagDiffSchemaResponse = TotalResponse[MDTagDiffSchema]
+
+
+class SlugFacetSchema(BaseModel):
+    name: str
+    due: int
+
+
+SlugFacetSchemaResponse = TotalResponse[SlugFacetSchema]
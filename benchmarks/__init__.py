@@ -0,0 +1,9 @@
+"""
+Benchmarks of the storage and scheduling paths, one runnable module per question:
+
+    BENCHMARK_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.polymorphic_loading
+
+The database benchmarks recreate the schema of a disposable database on every run.
+"""
+
+import tests  # noqa: F401, sets the settings the app reads on import
@@ -0,0 +1,53 @@
+import os
+import sys
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.infrastucture.db.session import SHARD
+from tests.database import create_schema
+
+
+@asynccontextmanager
+async def open_database() -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Engine of `BENCHMARK_DATABASE_URL` with a freshly created schema, exits when the
+    variable is unset.
+    """
+    url = os.environ.get("BENCHMARK_DATABASE_URL")
+    if not url:
+        sys.exit("BENCHMARK_DATABASE_URL is not set")
+
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await create_schema(connection)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+def open_session(engine: AsyncEngine) -> AsyncSession:
+    return AsyncSession(engine, expire_on_commit=False, info={SHARD: 0})
+
+
+class RoundTrips:
+    """
+    Counts the statements sent through `engine` while it is entered.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.count = 0
+
+    def _count(self, *_):
+        self.count += 1
+
+    def __enter__(self) -> "RoundTrips":
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *_):
+        event.remove(self.engine.sync_engine, "before_cursor_execute", self._count)
@@ -0,0 +1,77 @@
+"""
+Due pages of a mixed BASE/WORD/MD dataset loaded with the subtypes fetched by one
+selectin query per content type present in the page, which `get_all_repetitions` does,
+against LEFT OUTER JOINing every subtype table through `with_polymorphic("*")`.
+"""
+
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload, with_polymorphic
+
+from app.domain.models import DateType, Repetition
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
+
+from tests.database import seed_repetitions
+
+from .database import RoundTrips, open_database, open_session
+from .timing import measure, report
+
+USERS = 100
+REPETITIONS_PER_USER = 2_000
+PAGE_SIZES = (20, 100, 500)
+REPEAT = 50
+
+START_DATE = DateType(1_700_000_000)
+END_DATE = DateType(1_800_000_000)
+
+
+def joined_statement(user_id: str, limit: int):
+    polymorphic = with_polymorphic(Repetition, "*")
+    return (
+        select(polymorphic)
+        .options(selectinload(polymorphic.slugs))
+        .where(
+            polymorphic.user_id == user_id,
+            polymorphic.date_repetition.between(START_DATE.timestamp, END_DATE.timestamp),
+        )
+        .order_by(polymorphic.date_repetition, polymorphic.id)
+        .limit(limit)
+    )
+
+
+async def main():
+    async with open_database() as engine:
+        async with engine.begin() as connection:
+            await seed_repetitions(connection, USERS, REPETITIONS_PER_USER)
+
+        for page_size in PAGE_SIZES:
+            async with open_session(engine) as session:
+                repository = SQLAlchemyRepetitionRepository(session=session)
+
+                async def selectin():
+                    await repository.get_all_repetitions(
+                        user_id="user-1",
+                        start_date=START_DATE,
+                        end_date=END_DATE,
+                        limit=page_size,
+                        offset=0,
+                    )
+                    session.expunge_all()
+
+                async def joined():
+                    await session.scalars(joined_statement("user-1", page_size))
+                    session.expunge_all()
+
+                for name, run in (("selectin", selectin), ("joined", joined)):
+                    with RoundTrips(engine) as round_trips:
+                        await run()
+                    report(
+                        f"{name}, page of {page_size}",
+                        await measure(run, REPEAT),
+                        round_trips=round_trips.count,
+                    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+Rescheduling a million cards with `update_repetition_schedule_batch` against a loop of
+the scalar `calc_date_repetition`, the way `Repetition.update_repetition_schedule`
+moves one card. Both results are compared element by element before timing.
+"""
+
+import numpy as np
+
+from app.domain.models import RepetitionStatusEnum
+from app.domain.models.repetition import calc_date_repetition
+from app.domain.utils import update_repetition_schedule_batch
+
+from .timing import measure_calls, report
+
+CARDS = 1_000_000
+REPEAT = 5
+SEED = 0
+
+
+def synthetic_cards(cards: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(SEED)
+    counts = rng.integers(0, 30, cards)
+    statuses = rng.choice([1, 0], cards, p=[0.8, 0.2])
+    dates = rng.integers(1_700_000_000, 1_800_000_000, cards)
+    return counts, statuses, dates
+
+
+def scalar_loop(counts, statuses, dates) -> tuple[list[int], list[int]]:
+    new_counts, new_dates = [], []
+    for count, status, date in zip(counts, statuses, dates):
+        status = RepetitionStatusEnum(str(status))
+        count = max(0, count + 1 if status == RepetitionStatusEnum.SUCCESSFUL else count - 1)
+        new_counts.append(count)
+        new_dates.append(calc_date_repetition(count, status, date))
+    return new_counts, new_dates
+
+
+def main():
+    counts, statuses, dates = synthetic_cards(CARDS)
+    scalar_args = (counts.tolist(), statuses.tolist(), dates.tolist())
+
+    batch_counts, batch_dates = update_repetition_schedule_batch(counts, statuses, dates)
+    scalar_counts, scalar_dates = scalar_loop(*scalar_args)
+    assert batch_counts.tolist() == scalar_counts
+    assert batch_dates.tolist() == scalar_dates
+
+    scalar = measure_calls(lambda: scalar_loop(*scalar_args), REPEAT)
+    batch = measure_calls(
+        lambda: update_repetition_schedule_batch(counts, statuses, dates), REPEAT
+    )
+    report(f"scalar loop, {CARDS:,} cards", scalar)
+    report(
+        f"batch, {CARDS:,} cards",
+        batch,
+        speedup=f"{np.median(scalar) / np.median(batch):.0f}x",
+    )
+
+
+if __name__ == "__main__":
+    main()
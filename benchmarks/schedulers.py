@@ -0,0 +1,66 @@
+"""
+Cost of every scheduler on a million synthetic cards: throughput of the batch and the
+scalar path and the size of the SQL interval expression, plus the number of reviews a
+card answered correctly every time needs in its first year, which drives the review
+write load.
+"""
+
+import numpy as np
+from sqlalchemy import column
+from sqlalchemy.dialects import postgresql
+
+from app.domain.schedulers import SchedulerAlgorithmEnum, build_scheduler
+from app.domain.utils.repetition_math import ONE_DAY_IN_SECONDS
+
+from .repetition_math import synthetic_cards
+from .timing import measure_calls, report
+
+CARDS = 1_000_000
+SCALAR_CARDS = 100_000
+REPEAT = 5
+YEAR_IN_SECONDS = 365 * ONE_DAY_IN_SECONDS
+
+
+def reviews_in_first_year(scheduler) -> int:
+    elapsed, count = 0, 0
+    while elapsed < YEAR_IN_SECONDS:
+        elapsed += scheduler.interval(count)
+        count += 1
+    return count
+
+
+def main():
+    counts, statuses, dates = synthetic_cards(CARDS)
+    scalar_counts = counts[:SCALAR_CARDS].tolist()
+
+    for algorithm in SchedulerAlgorithmEnum:
+        scheduler = build_scheduler(algorithm)
+        name = algorithm.value.lower()
+
+        batch = measure_calls(
+            lambda: scheduler.update_schedule_batch(counts, statuses, dates), REPEAT
+        )
+        scalar = measure_calls(
+            lambda: [scheduler.interval(count) for count in scalar_counts], REPEAT
+        )
+        expression = scheduler.interval_expression(column("count_repetition"))
+        sql = str(expression.compile(dialect=postgresql.dialect()))
+
+        report(
+            f"{name}, batch of {CARDS:,}",
+            batch,
+            cards_per_second=f"{CARDS / np.median(batch) * 1000:,.0f}",
+        )
+        report(
+            f"{name}, scalar of {SCALAR_CARDS:,}",
+            scalar,
+            cards_per_second=f"{SCALAR_CARDS / np.median(scalar) * 1000:,.0f}",
+        )
+        print(
+            f"{name:<32} first year reviews {reviews_in_first_year(scheduler)}, "
+            f"SQL interval {len(sql):,} characters"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Word search of one user among a million words against the 20 ms target, with the plan
+of the search query to show that both GIN indexes of the search migration answer it.
+
+The search functions and indexes are not part of the models, they are created from the
+migration itself. Needs the `pg_trgm` extension.
+"""
+
+import asyncio
+import importlib.util
+import statistics
+import sys
+from pathlib import Path
+
+from sqlalchemy import text
+
+from app.domain.models import RepetitionContentTypeEnum
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
+
+from tests.database import seed_repetitions
+
+from .database import open_database, open_session
+from .timing import measure, report
+
+MIGRATION = (
+    Path(__file__).parent.parent
+    / "alembic"
+    / "versions"
+    / "2026-10-18_add_word_search_indexes.py"
+)
+SEARCH_INDEXES = {
+    "ix_word_repetitions_search_document": "word_search_document(language, {fields})",
+    "ix_word_repetitions_search_trigram": "word_search_text({fields}) gin_trgm_ops",
+}
+
+USERS = 1_000
+WORDS_PER_USER = 1_000
+PAGE_SIZE = 20
+REPEAT = 50
+TARGET_MS = 20
+
+VOCABULARY = [
+    "apple", "bridge", "candle", "desert", "engine", "forest", "garden", "harbor",
+    "island", "jacket", "kettle", "ladder", "meadow", "needle", "orange", "pillow",
+    "quarry", "river", "saddle", "tunnel", "umbrella", "valley", "window", "yellow",
+]  # fmt: skip
+QUERIES = {
+    "full text": "garden",
+    "full text, two words": "river valley",
+    "typo": "umbrela",
+    "prefix": "kett",
+}
+
+
+def load_migration():
+    spec = importlib.util.spec_from_file_location("word_search_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    return migration
+
+
+def index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", ()):
+        names |= index_names(child)
+    return names
+
+
+async def main():
+    migration = load_migration()
+
+    async with open_database() as engine:
+        async with engine.begin() as connection:
+            if not await connection.scalar(
+                text("SELECT count(*) FROM pg_extension WHERE extname = 'pg_trgm'")
+            ):
+                sys.exit("the pg_trgm extension is not available")
+
+            await seed_repetitions(
+                connection,
+                USERS,
+                WORDS_PER_USER,
+                content_types=(RepetitionContentTypeEnum.WORD,),
+            )
+            # Words drawn from a small vocabulary, so every query matches some of them.
+            await connection.execute(
+                text(
+                    "UPDATE word_repetitions SET "
+                    "word = (CAST(:vocabulary AS text[]))[(hashtext(id) & 65535) % :size + 1], "
+                    "translate = ARRAY[(CAST(:vocabulary AS text[]))"
+                    "[(hashtext(id || 't') & 65535) % :size + 1]]"
+                ),
+                {"vocabulary": VOCABULARY, "size": len(VOCABULARY)},
+            )
+            for function in migration.FUNCTIONS:
+                await connection.execute(text(function))
+            for name, expression in SEARCH_INDEXES.items():
+                await connection.execute(
+                    text(
+                        f"CREATE INDEX {name} ON word_repetitions USING gin "
+                        f"({expression.format(fields=migration.SEARCH_FIELDS)})"
+                    )
+                )
+            await connection.execute(text("ANALYZE word_repetitions"))
+
+        for name, query in QUERIES.items():
+            async with open_session(engine) as session:
+                statement = SQLAlchemyRepetitionRepository._search_statement(
+                    user_id="user-1", query=query
+                ).limit(PAGE_SIZE)
+                sql = statement.compile(
+                    dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+                )
+                explained = await session.scalar(
+                    text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}")
+                )
+
+                repository = SQLAlchemyRepetitionRepository(session=session)
+
+                async def run():
+                    await repository.search_word_repetitions(
+                        user_id="user-1", query=query, limit=PAGE_SIZE, offset=0
+                    )
+                    session.expunge_all()
+
+                timings = await measure(run, REPEAT)
+                report(
+                    name,
+                    timings,
+                    execution=f"{explained[0]['Execution Time']:.2f} ms",
+                    indexes=sorted(index_names(explained[0]["Plan"]) & SEARCH_INDEXES.keys()),
+                    target="met" if statistics.median(timings) <= TARGET_MS else "missed",
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
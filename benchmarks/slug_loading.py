@@ -0,0 +1,59 @@
+"""
+Due pages encoded the way the due route does, with their slugs loaded by a follow-up
+`selectinload` query against aggregated into the page query with `json_agg`,
+`SlugLoadStrategyEnum.AGGREGATE`.
+"""
+
+import asyncio
+
+from app.application.serializers import repetition_serializer
+from app.domain.models import DateType, SlugLoadStrategyEnum
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
+
+from tests.database import seed_repetitions
+
+from .database import RoundTrips, open_database, open_session
+from .timing import measure, report
+
+USERS = 100
+REPETITIONS_PER_USER = 2_000
+PAGE_SIZES = (20, 100, 500)
+REPEAT = 50
+
+START_DATE = DateType(1_700_000_000)
+END_DATE = DateType(1_800_000_000)
+
+
+async def main():
+    async with open_database() as engine:
+        async with engine.begin() as connection:
+            await seed_repetitions(connection, USERS, REPETITIONS_PER_USER)
+
+        for page_size in PAGE_SIZES:
+            for slug_strategy in SlugLoadStrategyEnum:
+                async with open_session(engine) as session:
+                    repository = SQLAlchemyRepetitionRepository(session=session)
+
+                    async def run():
+                        repetitions = await repository.get_all_repetitions(
+                            user_id="user-1",
+                            start_date=START_DATE,
+                            end_date=END_DATE,
+                            limit=page_size,
+                            offset=0,
+                            slug_strategy=slug_strategy,
+                        )
+                        repetition_serializer.dumps_page(repetitions, status=200, details="")
+                        session.expunge_all()
+
+                    with RoundTrips(engine) as round_trips:
+                        await run()
+                    report(
+                        f"{slug_strategy.name.lower()}, page of {page_size}",
+                        await measure(run, REPEAT),
+                        round_trips=round_trips.count,
+                    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,42 @@
+import statistics
+import time
+from typing import Awaitable, Callable
+
+
+async def measure(run: Callable[[], Awaitable], repeat: int, warm_up: int = 3) -> list[float]:
+    """
+    Milliseconds of `repeat` awaited calls of `run`, after `warm_up` untimed ones.
+    """
+    for _ in range(warm_up):
+        await run()
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def measure_calls(run: Callable[[], object], repeat: int, warm_up: int = 1) -> list[float]:
+    """
+    Milliseconds of `repeat` calls of `run`, after `warm_up` untimed ones.
+    """
+    for _ in range(warm_up):
+        run()
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float], **extra):
+    """
+    Prints the median and 95th percentile of `timings` with any `extra` figures.
+    """
+    p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+    figures = "".join(f", {key} {value}" for key, value in extra.items())
+    print(f"{name:<32} median {statistics.median(timings):8.2f} ms, p95 {p95:8.2f} ms{figures}")
@@ -0,0 +1,13 @@
+import os
+
+# `global_config` is read on import of the app, the database tests and the benchmarks
+# connect to their own database instead.
+for name, value in {
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_DB": "test",
+    "POSTGRES_PASSWORD": "postgres",
+    "DB_PORT": "5432",
+    "DB_HOST": "localhost",
+    "AUTH_MARKER": "test",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.infrastucture.db.session import SHARD
+from tests.database import create_schema
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def engine(anyio_backend):
+    """
+    Engine of the test database with the schema created, the database tests are skipped
+    unless `TEST_DATABASE_URL` points at a disposable PostgreSQL database.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as connection:
+        await create_schema(connection)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+async def extensions(engine) -> set[str]:
+    async with engine.connect() as connection:
+        return set(await connection.scalars(text("SELECT extname FROM pg_extension")))
+
+
+@pytest.fixture
+async def session(engine):
+    """
+    Session inside a transaction which is rolled back after the test, commits of the
+    code under test only release savepoints.
+    """
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+            info={SHARD: 0},
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
@@ -0,0 +1,141 @@
+"""
+Schema of the test database.
+
+It is built from the models rather than from the migrations, so the suite also runs on a
+server without the `btree_gist` and `pg_trgm` extensions: the indexes which need a
+missing extension are skipped, and tests depending on them skip as well.
+"""
+
+from sqlalchemy import Connection, Enum, text
+from sqlalchemy.dialects.postgresql import ENUM
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.domain.models import RepetitionContentTypeEnum
+from app.infrastucture.db.base import Base
+from app.infrastucture.db.partitions import DEFAULT_PARTITION, PARENT_TABLE
+from app.infrastucture.db.triggers import (
+    DELETE_REPETITION_DEPENDENTS_FUNCTION,
+    DELETE_REPETITION_DEPENDENTS_TRIGGER,
+    RECORD_DELETED_REPETITION_FUNCTION,
+    RECORD_DELETED_REPETITION_TRIGGER,
+)
+
+EXTENSIONS = ("btree_gist", "pg_trgm")
+
+# Indexes of the models which cannot be built without an extension.
+EXTENSION_INDEXES = {"ix_tags_md_id_position": "btree_gist"}
+
+SLUG_COUNT = 50
+SLUGS_PER_REPETITION = 2
+
+# Content types of the seeded repetitions, cycled over the rows.
+MIXED_CONTENT_TYPES = (
+    RepetitionContentTypeEnum.BASE,
+    RepetitionContentTypeEnum.WORD,
+    RepetitionContentTypeEnum.MD,
+)
+
+
+async def create_schema(connection: AsyncConnection) -> set[str]:
+    """
+    Drops and recreates every table of the models with the default partition of
+    `repetitions` and its cleanup and tombstone triggers, returns the extensions which are installed.
+    """
+    available = set(
+        await connection.scalars(
+            text("SELECT name FROM pg_available_extensions WHERE name = ANY(:names)"),
+            {"names": list(EXTENSIONS)},
+        )
+    )
+    for name in available:
+        await connection.execute(text(f"CREATE EXTENSION IF NOT EXISTS {name}"))
+
+    for table in Base.metadata.tables.values():
+        for index in table.indexes:
+            if extension := EXTENSION_INDEXES.get(index.name):
+                index.ddl_if(callable_=lambda *_, extension=extension, **__: extension in available)
+
+    await connection.run_sync(Base.metadata.drop_all)
+    await connection.run_sync(_create_enum_types)
+    await connection.run_sync(Base.metadata.create_all)
+    await connection.execute(
+        text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT")
+    )
+    await connection.execute(DELETE_REPETITION_DEPENDENTS_FUNCTION)
+    await connection.execute(DELETE_REPETITION_DEPENDENTS_TRIGGER)
+    await connection.execute(RECORD_DELETED_REPETITION_FUNCTION)
+    await connection.execute(RECORD_DELETED_REPETITION_TRIGGER)
+    return available
+
+
+def _create_enum_types(connection: Connection):
+    """
+    The models declare their enum types with `create_type=False`, the migrations own them.
+    """
+    for table in Base.metadata.tables.values():
+        for column in table.columns:
+            if isinstance(column.type, Enum) and column.type.name:
+                ENUM(*column.type.enums, name=column.type.name).create(
+                    connection, checkfirst=True
+                )
+
+
+async def seed_repetitions(
+    connection: AsyncConnection,
+    users: int,
+    repetitions_per_user: int,
+    content_types: tuple[RepetitionContentTypeEnum, ...] = MIXED_CONTENT_TYPES,
+):
+    """
+    Inserts `users * repetitions_per_user` repetitions cycling over `content_types`,
+    with their subtype rows, titles and `SLUGS_PER_REPETITION` slugs each, then analyzes
+    the tables.
+    Dates are spread over roughly three years from 2023-11.
+    """
+    await connection.execute(
+        text(
+            "INSERT INTO repetitions "
+            "(id, content_type, count_repetition, date_repetition, title, user_id) "
+            "SELECT 'r-' || n, "
+            "CAST((CAST(:types AS text[]))[n % :type_count + 1] AS repetitioncontenttypeenum), "
+            "n % 10, 1700000000 + (n * 7919) % 100000000, "
+            "'title ' || n, 'user-' || (n % :users) "
+            "FROM generate_series(0, :total - 1) AS n"
+        ),
+        {
+            "types": [content_type.name for content_type in content_types],
+            "type_count": len(content_types),
+            "users": users,
+            "total": users * repetitions_per_user,
+        },
+    )
+    await connection.execute(
+        text(
+            "INSERT INTO word_repetitions (id, word, translate, language, context) "
+            "SELECT id, 'word ' || id, ARRAY['translation ' || id], 'EN_GB', "
+            "'context of ' || id "
+            "FROM repetitions WHERE content_type = 'WORD'"
+        )
+    )
+    await connection.execute(
+        text("INSERT INTO mds (id) SELECT id FROM repetitions WHERE content_type = 'MD'")
+    )
+    await connection.execute(
+        text("INSERT INTO repetition_titles (title) SELECT title FROM repetitions")
+    )
+    await connection.execute(
+        text(
+            "INSERT INTO slug_repetitions (id, name) "
+            "SELECT 's-' || n, 'slug ' || n FROM generate_series(0, :count - 1) AS n"
+        ),
+        {"count": SLUG_COUNT},
+    )
+    await connection.execute(
+        text(
+            "INSERT INTO repetition_slug_association (repetition_id, slug_id) "
+            "SELECT id, 's-' || ((hashtext(id) & 2147483647) + k) % :count "
+            "FROM repetitions, generate_series(0, :per_repetition - 1) AS k"
+        ),
+        {"count": SLUG_COUNT, "per_repetition": SLUGS_PER_REPETITION},
+    )
+    await connection.execute(text("ANALYZE"))
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.domain.models import DateType, Repetition, RepetitionContentTypeEnum
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
+
+pytestmark = pytest.mark.anyio
+
+DUE_INDEX = "ix_repetitions_user_id_date_repetition_id"
+USERS = 200
+REPETITIONS_PER_USER = 100
+
+
+def index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", ()):
+        names |= index_names(child)
+    return names
+
+
+async def test_due_statement_scans_the_due_queue_index(session):
+    rng = random.Random(0)
+    await session.execute(
+        insert(Repetition.__table__),
+        [
+            {
+                "id": f"{user}-{number}",
+                "user_id": f"user-{user}",
+                "title": f"title-{user}-{number}",
+                "content_type": RepetitionContentTypeEnum.BASE,
+                "count_repetition": 0,
+                "date_repetition": rng.randrange(1_700_000_000, 1_800_000_000),
+            }
+            for user in range(USERS)
+            for number in range(REPETITIONS_PER_USER)
+        ],
+    )
+    await session.execute(text(f"ANALYZE {Repetition.__tablename__}"))
+
+    statement = SQLAlchemyRepetitionRepository._due_statement(
+        user_id="user-7",
+        start_date=DateType(1_700_000_000),
+        end_date=DateType(1_750_000_000),
+    ).limit(50)
+    sql = statement.compile(
+        dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = (await session.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}")))[0]["Plan"]
+
+    # Every partition has its own copy of the index, named after the partition.
+    partition_indexes = set(
+        await session.scalars(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = CAST(:index AS regclass)"
+            ),
+            {"index": DUE_INDEX},
+        )
+    )
+    assert partition_indexes
+    assert index_names(plan) & partition_indexes
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from app.domain.exceptions.external import InvalidSchedulerParameter
+from app.domain.schedulers import SchedulerAlgorithmEnum, build_scheduler
+from app.domain.services.forecast import WorkloadSimulation
+from app.domain.utils.repetition_math import (
+    ONE_DAY_IN_SECONDS,
+    STATUS_SUCCESSFUL,
+    STATUS_UNSUCCESSFUL,
+)
+
+START = 1_700_000_000
+DAYS = 60
+
+
+def synthetic_cards(cards: int = 5_000):
+    rng = np.random.default_rng(0)
+    counts = rng.integers(0, 12, cards)
+    dates = START + rng.integers(-5 * ONE_DAY_IN_SECONDS, 90 * ONE_DAY_IN_SECONDS, cards)
+    return counts, dates
+
+
+def scalar_due_per_day(scheduler, counts, dates, status) -> list[int]:
+    """
+    Card by card reference of `WorkloadSimulation.run` when every review has `status`.
+    """
+    due = [0] * DAYS
+    step = 1 if status == STATUS_SUCCESSFUL else -1
+    for count, date in zip(counts.tolist(), dates.tolist()):
+        day = 0
+        while day < DAYS:
+            if date >= START + (day + 1) * ONE_DAY_IN_SECONDS:
+                day = (date - START) // ONE_DAY_IN_SECONDS
+                continue
+            due[day] += 1
+            count = max(0, count + step)
+            date += step * scheduler.interval(count)
+            day += 1
+    return due
+
+
+@pytest.mark.parametrize("algorithm", list(SchedulerAlgorithmEnum))
+@pytest.mark.parametrize(
+    "success_probability, status", [(1, STATUS_SUCCESSFUL), (0, STATUS_UNSUCCESSFUL)]
+)
+def test_due_counts_match_the_scalar_schedule(algorithm, success_probability, status):
+    scheduler = build_scheduler(algorithm)
+    counts, dates = synthetic_cards()
+
+    forecast = WorkloadSimulation(
+        scheduler=scheduler, success_probability=success_probability, seed=0
+    ).run(counts, dates, start=START, days=DAYS)
+
+    assert [day.due for day in forecast] == scalar_due_per_day(
+        scheduler, counts, dates, status
+    )
+    assert [day.date for day in forecast] == [
+        START + day * ONE_DAY_IN_SECONDS for day in range(DAYS)
+    ]
+
+
+def test_seeded_run_is_deterministic():
+    counts, dates = synthetic_cards()
+
+    def run(seed):
+        return WorkloadSimulation(success_probability=0.8, seed=seed).run(
+            counts, dates, start=START, days=DAYS
+        )
+
+    assert run(7) == run(7)
+    assert run(7) != run(8)
+
+
+def test_every_due_review_is_counted_once():
+    counts, dates = synthetic_cards()
+    forecast = WorkloadSimulation(success_probability=0.8, seed=7).run(
+        counts, dates, start=START, days=DAYS
+    )
+
+    assert all(day.successful + day.unsuccessful == day.due for day in forecast)
+    # Only cards scheduled before the first day ends are due on it, overdue ones included.
+    assert forecast[0].due == np.count_nonzero(dates < START + ONE_DAY_IN_SECONDS)
+
+
+def test_run_does_not_modify_the_loaded_arrays():
+    counts, dates = synthetic_cards()
+    counts_before, dates_before = counts.copy(), dates.copy()
+
+    WorkloadSimulation(seed=0).run(counts, dates, start=START, days=DAYS)
+
+    assert np.array_equal(counts, counts_before)
+    assert np.array_equal(dates, dates_before)
+
+
+@pytest.mark.parametrize("success_probability", [-0.1, 1.1])
+def test_success_probability_is_validated(success_probability):
+    with pytest.raises(ValueError):
+        WorkloadSimulation(success_probability=success_probability)
+
+
+@pytest.mark.parametrize(
+    "algorithm, parameters",
+    [
+        ("LINEAR", {"rate": -1}),
+        ("LINEAR", {"post_rate": 0}),
+        ("SM2", {"ease_factor": 1e308}),
+        ("FSRS", {"desired_retention": 0}),
+        ("FSRS", {"desired_retention": float("nan")}),
+    ],
+)
+def test_scheduler_parameters_are_bounded(algorithm, parameters):
+    with pytest.raises(InvalidSchedulerParameter):
+        build_scheduler(algorithm, **parameters)
@@ -0,0 +1,92 @@
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from app.application.parsers import markdown
+from app.application.parsers.markdown import iter_markdown_blocks
+
+pytestmark = pytest.mark.anyio
+
+DOCUMENT = (
+    "# Заголовок 👋\n"
+    "\n"
+    "Plain text\n"
+    "over two lines\n"
+    "\n"
+    "**bold**\n"
+    "\n"
+    "> quoted\n"
+    "> > nested\n"
+    "\n"
+    "- first\n"
+    "  continued\n"
+    "2. second\n"
+    "\n"
+    "```\n"
+    "日本語 = 1\n"
+    "```\n"
+    "~~gone~~\n"
+)
+
+
+async def parse(data: bytes, batch_size: int = 1000) -> list[tuple]:
+    document = UploadFile(io.BytesIO(data), filename="document.md")
+    return [
+        (block.type, block.start_pos, block.end_pos, block.content, block.attributes)
+        async for batch in iter_markdown_blocks(document, batch_size)
+        for block in batch
+    ]
+
+
+def span(line: str, count: int = 1) -> tuple[int, int]:
+    """Returns the offsets of `count` lines starting at the first line equal to `line`."""
+    lines = DOCUMENT.split("\n")
+    index = lines.index(line)
+    start = sum(len(previous) + 1 for previous in lines[:index])
+    return start, start + len("\n".join(lines[index : index + count]))
+
+
+async def test_blocks_keep_their_positions_and_attributes():
+    assert await parse(DOCUMENT.encode()) == [
+        ("heading", *span("# Заголовок 👋"), "Заголовок 👋", {"level": 1}),
+        ("text", *span("Plain text", 2), "Plain text\nover two lines", {"style": "simple"}),
+        ("text", *span("**bold**"), "bold", {"style": "bold"}),
+        ("quote", *span("> quoted", 2), "quoted\nnested", {"sup_quote": True}),
+        ("list", *span("- first", 2), "first\ncontinued", {"ordered": False}),
+        ("list", *span("2. second"), "second", {"ordered": True}),
+        ("code", *span("```", 3), "日本語 = 1", {"is_multiply": True}),
+        ("text", *span("~~gone~~"), "gone", {"style": "strikethrough"}),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64])
+async def test_chunks_split_inside_characters_and_lines(monkeypatch, chunk_size):
+    expected = await parse(DOCUMENT.encode())
+    # Every size below four splits one of the multi-byte characters between two chunks.
+    monkeypatch.setattr(markdown, "READ_CHUNK_SIZE", chunk_size)
+
+    assert await parse(DOCUMENT.encode()) == expected
+
+
+async def test_byte_order_mark_and_crlf_keep_positions():
+    expected = await parse(DOCUMENT.encode())
+    crlf = await parse("﻿".encode() + DOCUMENT.replace("\n", "\r\n").encode())
+
+    assert [block[3] for block in crlf] == [block[3] for block in expected]
+    # Every line break before a block counts as one more character.
+    assert crlf[1][1] == expected[1][1] + 2
+
+
+async def test_unclosed_fence_runs_to_the_end():
+    assert await parse(b"```\ncode\nmore") == [
+        ("code", 0, 13, "code\nmore", {"is_multiply": True}),
+    ]
+
+
+async def test_batches_are_split_by_size():
+    document = UploadFile(io.BytesIO(DOCUMENT.encode()), filename="document.md")
+    sizes = [len(batch) async for batch in iter_markdown_blocks(document, batch_size=3)]
+
+    assert sum(sizes) == 8
+    assert max(sizes) <= 4
@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import text
+
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyMDRepository
+
+pytestmark = pytest.mark.anyio
+
+POSITION_INDEX = "ix_tags_md_id_position"
+DOCUMENTS = 10
+TAGS_PER_DOCUMENT = 20_000
+
+
+def index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", ()):
+        names |= index_names(child)
+    return names
+
+
+async def test_range_reads_use_the_position_index(session, extensions):
+    if "btree_gist" not in extensions:
+        pytest.skip(f"{POSITION_INDEX} needs the btree_gist extension")
+
+    await session.execute(
+        text(
+            "INSERT INTO mds (id) SELECT 'md-' || n FROM generate_series(0, :count - 1) AS n"
+        ),
+        {"count": DOCUMENTS},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO tags "
+            "(id, md_id, ordinal, gap, length, start_pos, end_pos, content, type) "
+            "SELECT 'md-' || document || '-' || n, 'md-' || document, "
+            "CAST(n AS bigint) << 32, 2, 10, 12 * n + 2, 12 * n + 12, 'tag', 'tag' "
+            "FROM generate_series(0, :documents - 1) AS document, "
+            "generate_series(0, :tags - 1) AS n"
+        ),
+        {"documents": DOCUMENTS, "tags": TAGS_PER_DOCUMENT},
+    )
+    await session.execute(text("ANALYZE tags"))
+
+    statement = SQLAlchemyMDRepository._range_statement(
+        md_id="md-3", start_pos=120_000, end_pos=120_040
+    )
+    sql = statement.compile(
+        dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = (await session.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}")))[0]["Plan"]
+
+    assert POSITION_INDEX in index_names(plan)
@@ -0,0 +1,199 @@
+import io
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import text
+
+from app.application.commands import (
+    create_md_repetition,
+    refresh_md_tag_positions,
+    update_md_repetition,
+)
+from app.application.parsers import iter_markdown_blocks
+from app.domain.services.md_diff import (
+    ORDINAL_STEP,
+    ParsedTag,
+    StoredTag,
+    TagPosition,
+    diff_md_tags,
+)
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+
+pytestmark = pytest.mark.anyio
+
+USER_ID = "user"
+
+
+def document(paragraphs: int, edited: int | None = None) -> str:
+    return "".join(
+        f"# Section {number}\n\nParagraph {number}{' edited' if number == edited else ''}\n\n"
+        for number in range(paragraphs)
+    )
+
+
+def upload(content: str) -> UploadFile:
+    return UploadFile(io.BytesIO(content.encode()), filename="document.md")
+
+
+def stored(*hashes: str, step: int = ORDINAL_STEP) -> list[StoredTag]:
+    return [
+        StoredTag(
+            id=hash,
+            content_hash=hash,
+            position=TagPosition(index * step, 1, 1),
+            start_pos=2 * index + 1,
+        )
+        for index, hash in enumerate(hashes)
+    ]
+
+
+def parsed(*hashes: str) -> list[ParsedTag]:
+    return [
+        ParsedTag(
+            content_hash=hash,
+            position=TagPosition(index * ORDINAL_STEP, 1, 1),
+            start_pos=2 * index + 1,
+        )
+        for index, hash in enumerate(hashes)
+    ]
+
+
+def test_inserted_blocks_fit_between_their_neighbours():
+    diff = diff_md_tags(stored("a", "b", "c"), parsed("a", "x", "y", "c"))
+
+    assert diff.deleted_ids == ["b"]
+    assert sorted(diff.inserted) == [1, 2]
+    assert 0 < diff.inserted[1].ordinal < diff.inserted[2].ordinal < 2 * ORDINAL_STEP
+    assert diff.moved == {}
+    assert diff.unchanged == 2
+    assert diff.stale_from == 2 * ORDINAL_STEP
+
+
+def test_an_edit_of_the_same_length_leaves_the_offsets_up_to_date():
+    diff = diff_md_tags(stored("a", "b", "c"), parsed("a", "x", "c"))
+
+    assert diff.deleted_ids == ["b"]
+    assert diff.stale_from is None
+
+
+def test_blocks_are_renumbered_when_there_is_no_room():
+    diff = diff_md_tags(stored("a", "b", step=1), parsed("a", "x", "b"))
+
+    assert diff.inserted == {1: TagPosition(ORDINAL_STEP, 1, 1)}
+    assert diff.moved == {"b": TagPosition(2 * ORDINAL_STEP, 1, 1)}
+
+
+def test_only_the_gap_after_an_edit_moves():
+    old = stored("a", "b", "c")
+    new = [
+        ParsedTag("a", TagPosition(0, 1, 1), start_pos=1),
+        ParsedTag("b", TagPosition(ORDINAL_STEP, 3, 1), start_pos=5),
+        ParsedTag("c", TagPosition(2 * ORDINAL_STEP, 1, 1), start_pos=7),
+    ]
+    diff = diff_md_tags(old, new)
+
+    assert diff.moved == {"b": TagPosition(ORDINAL_STEP, 3, 1)}
+    assert diff.stale_from == ORDINAL_STEP
+
+
+async def rows_written(session) -> int:
+    return await session.scalar(
+        text(
+            "SELECT coalesce(sum(n_tup_ins + n_tup_upd + n_tup_del), 0) "
+            "FROM pg_stat_xact_user_tables "
+            "WHERE relname IN ('tags', 'text', 'quote', 'heading', 'list', 'code')"
+        )
+    )
+
+
+async def test_one_line_edit_writes_the_same_rows_however_long_the_document(session):
+    uow = SQLAlchemyUnitOfWork()
+    uow._session = session
+
+    written = []
+    for paragraphs in (10, 100, 1000):
+        md = await create_md_repetition(
+            uow,
+            user_id=USER_ID,
+            title=f"document of {paragraphs}",
+            slugs=["notes"],
+            document=upload(document(paragraphs)),
+        )
+        edited = document(paragraphs, edited=paragraphs // 2)
+
+        before = await rows_written(session)
+        diff = await update_md_repetition(
+            uow, user_id=USER_ID, md_id=md.id, document=upload(edited)
+        )
+        written.append(await rows_written(session) - before)
+
+        assert diff.to_json == {
+            "inserted": 1,
+            "deleted": 1,
+            "moved": 0,
+            "unchanged": 2 * paragraphs - 1,
+        }
+        tags = await uow.mds.get_md_tags(user_id=USER_ID, md_id=md.id)
+        expected = [
+            block
+            async for batch in iter_markdown_blocks(upload(edited), batch_size=1000)
+            for block in batch
+        ]
+        assert [(tag.start_pos, tag.end_pos, tag.content) for tag in tags] == [
+            (block.start_pos, block.end_pos, block.content) for block in expected
+        ]
+
+    # The edited paragraph is deleted and inserted, with its `text` row.
+    assert written == [4, 4, 4]
+
+
+async def test_refresh_rewrites_the_offsets_after_an_edit(session):
+    uow = SQLAlchemyUnitOfWork()
+    uow._session = session
+    md = await create_md_repetition(
+        uow, user_id=USER_ID, title="refresh", slugs=["refresh"], document=upload(document(10))
+    )
+    edited = document(10, edited=4)
+    diff = await update_md_repetition(
+        uow, user_id=USER_ID, md_id=md.id, document=upload(edited)
+    )
+    stale = await uow.mds.get_md_tags(user_id=USER_ID, md_id=md.id)
+
+    # Every tag after the edited paragraph shifted.
+    assert await refresh_md_tag_positions(uow, user_id=USER_ID, md_id=md.id) == 10
+    assert md.positions_stale_from is None
+    assert diff.stale_from == stale[10].ordinal
+
+    stored = await session.execute(
+        text("SELECT start_pos, end_pos FROM tags WHERE md_id = :md_id ORDER BY ordinal"),
+        {"md_id": md.id},
+    )
+    assert stored.all() == [(tag.start_pos, tag.end_pos) for tag in stale]
+    assert await refresh_md_tag_positions(uow, user_id=USER_ID, md_id=md.id) == 0
+
+
+@pytest.mark.parametrize("refreshed", [False, True])
+async def test_range_reads_of_an_edited_document(session, refreshed):
+    uow = SQLAlchemyUnitOfWork()
+    uow._session = session
+    title = f"ranges {'refreshed' if refreshed else 'stale'}"
+    md = await create_md_repetition(
+        uow, user_id=USER_ID, title=title, slugs=[title], document=upload(document(20))
+    )
+    content = document(20, edited=2)
+    await update_md_repetition(uow, user_id=USER_ID, md_id=md.id, document=upload(content))
+    if refreshed:
+        await refresh_md_tag_positions(uow, user_id=USER_ID, md_id=md.id)
+    start_pos = content.index("Paragraph 7")
+    end_pos = content.index("# Section 9")
+
+    tags = await uow.mds.get_md_tags_in_range(
+        user_id=USER_ID, md_id=md.id, start_pos=start_pos, end_pos=end_pos
+    )
+
+    assert [tag.content for tag in tags] == [
+        "Paragraph 7",
+        "Section 8",
+        "Paragraph 8",
+    ]
+    assert tags[0].start_pos == start_pos
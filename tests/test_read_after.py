@@ -0,0 +1,67 @@
+import io
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.application.commands import create_md_repetition
+from app.infrastucture.db.session import DatabaseShard, WritePosition
+from app.infrastucture.db.unit_of_work import SQLAlchemyUnitOfWork
+from tests.conftest import TEST_DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+
+def test_write_positions_round_trip():
+    position = WritePosition(shard=2, lsn=123456789)
+
+    assert WritePosition.parse(str(position)) == position
+
+
+@pytest.mark.parametrize("value", ["", "1", "1:", ":2", "a:2", "1:0/16B3740", "-1:2"])
+def test_malformed_write_positions_are_rejected(value):
+    with pytest.raises(ValueError):
+        WritePosition.parse(value)
+
+
+async def test_committed_writes_record_their_position(session):
+    uow = SQLAlchemyUnitOfWork()
+    uow._session = session
+
+    await uow.commit()
+    assert uow.written is None
+
+    await create_md_repetition(
+        uow,
+        user_id="user",
+        title="read after",
+        slugs=["read after"],
+        document=UploadFile(io.BytesIO(b"# Title\n"), filename="document.md"),
+    )
+    await uow.commit()
+    first = uow.written
+
+    assert first.shard == 0 and first.lsn > 0
+
+    await create_md_repetition(
+        uow,
+        user_id="user",
+        title="read after again",
+        slugs=["read after"],
+        document=UploadFile(io.BytesIO(b"# Title\n"), filename="document.md"),
+    )
+    await uow.commit()
+    assert uow.written.lsn > first.lsn
+
+
+async def test_reads_after_a_write_skip_replicas_which_did_not_replay_it(engine):
+    # The test database is a primary, which reports no replayed position.
+    replica = create_async_engine(TEST_DATABASE_URL)
+    shard = DatabaseShard(engine, [replica])
+    try:
+        await shard.refresh_replayed_lsns(1)
+
+        assert shard.next_replica_sessionmaker(read_after=1) is shard.sessionmaker
+        assert shard.next_replica_sessionmaker().kw["bind"] is replica
+    finally:
+        await replica.dispose()
@@ -0,0 +1,122 @@
+import asyncio
+
+import pendulum
+import pytest
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.exceptions.external import RepetitionAlreadyExistsError
+from app.domain.models import (
+    Repetition,
+    RepetitionContentTypeEnum,
+    SlugRepetition,
+    deleted_repetitions,
+)
+from app.infrastucture.db.partitions import create_month_partition
+from app.infrastucture.db.session import SHARD
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
+from tests.database import seed_repetitions
+
+pytestmark = pytest.mark.anyio
+
+TITLE = "claimed concurrently"
+
+
+async def create_md(session: AsyncSession, slug: str):
+    await SQLAlchemyRepetitionRepository(session=session).create_repetition(
+        content_type=RepetitionContentTypeEnum.MD,
+        title=TITLE,
+        user_id="user",
+        slugs=[slug],
+    )
+
+
+async def test_concurrent_creates_claim_a_title_once(engine):
+    first = AsyncSession(engine, expire_on_commit=False, info={SHARD: 0})
+    second = AsyncSession(engine, expire_on_commit=False, info={SHARD: 0})
+    try:
+        await create_md(first, "first slug")
+        # Blocks on the primary key of `repetition_titles` until the first one commits.
+        racing = asyncio.create_task(create_md(second, "second slug"))
+        await asyncio.sleep(0.2)
+        assert not racing.done()
+
+        await first.commit()
+        with pytest.raises(RepetitionAlreadyExistsError):
+            await racing
+    finally:
+        await first.close()
+        await second.close()
+        async with engine.begin() as connection:
+            deleted = await connection.scalars(
+                delete(Repetition).where(Repetition.title == TITLE).returning(Repetition.id)
+            )
+            await connection.execute(
+                delete(deleted_repetitions).where(deleted_repetitions.c.id.in_(deleted.all()))
+            )
+            await connection.execute(
+                delete(SlugRepetition).where(
+                    SlugRepetition.name.in_(["first slug", "second slug"])
+                )
+            )
+
+    async with engine.connect() as connection:
+        assert not await connection.scalar(text("SELECT count(*) FROM repetition_titles"))
+
+
+async def count_rows(session: AsyncSession, ids: list[str]) -> dict[str, int]:
+    counts = {}
+    for table, column in (
+        ("repetition_slug_association", "repetition_id"),
+        ("word_repetitions", "id"),
+        ("mds", "id"),
+        ("tags", "md_id"),
+    ):
+        counts[table] = await session.scalar(
+            text(f"SELECT count(*) FROM {table} WHERE {column} = ANY(:ids)"), {"ids": ids}
+        )
+    counts["repetition_titles"] = await session.scalar(
+        text(
+            "SELECT count(*) FROM repetition_titles WHERE title IN "
+            "(SELECT 'title ' || substr(id, 3) FROM unnest(CAST(:ids AS text[])) AS id)"
+        ),
+        {"ids": ids},
+    )
+    return counts
+
+
+async def count_tombstones(session: AsyncSession, ids: list[str]) -> int:
+    return await session.scalar(
+        text("SELECT count(*) FROM deleted_repetitions WHERE id = ANY(:ids)"), {"ids": ids}
+    )
+
+
+async def test_deleting_a_repetition_deletes_its_rows(session):
+    await seed_repetitions(await session.connection(), users=1, repetitions_per_user=6)
+    await session.execute(
+        text(
+            "INSERT INTO tags "
+            "(id, ordinal, gap, length, start_pos, end_pos, md_id, content, type) "
+            "VALUES ('tag', 0, 0, 5, 0, 5, 'r-2', 'hello', 'text')"
+        )
+    )
+    await session.execute(text("INSERT INTO text (id, style) VALUES ('tag', 'SIMPLE')"))
+    ids = ["r-1", "r-2"]
+    before = await count_rows(session, ids)
+    assert all(before.values())
+
+    # A review moving the rows to another partition deletes and re-inserts them.
+    next_month = pendulum.datetime(2030, 1, 1, tz="UTC")
+    await create_month_partition(session, next_month)
+    await session.execute(
+        text("UPDATE repetitions SET date_repetition = :date WHERE id = ANY(:ids)"),
+        {"date": next_month.int_timestamp, "ids": ids},
+    )
+    assert await count_rows(session, ids) == before
+    assert not await count_tombstones(session, ids)
+
+    await session.execute(delete(Repetition).where(Repetition.id.in_(ids)))
+    assert not any((await count_rows(session, ids)).values())
+    assert await count_tombstones(session, ids) == len(ids)
+    assert not await session.scalar(text("SELECT count(*) FROM text"))
+    assert await session.scalar(text("SELECT count(*) FROM repetitions")) == 4
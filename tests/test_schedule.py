@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from sqlalchemy import func, select, text
+
+from app.domain.models import Repetition, RepetitionStatusEnum
+from app.domain.schedulers import SchedulerAlgorithmEnum, get_scheduler
+from app.domain.utils.repetition_math import MAXIMUM_INTERVAL_DAYS, ONE_DAY_IN_SECONDS
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyReviewRepository
+
+pytestmark = pytest.mark.anyio
+
+# Well past 9,942, where the uncapped linear interval stopped fitting int4.
+MAX_COUNT = 20_000
+DATE_REPETITION = 1_700_000_000
+
+
+@pytest.mark.parametrize("algorithm", list(SchedulerAlgorithmEnum))
+async def test_interval_paths_agree(session, algorithm):
+    scheduler = get_scheduler(algorithm)
+    count_repetition = func.generate_series(0, MAX_COUNT).column_valued("count_repetition")
+
+    sql_intervals = (
+        await session.scalars(select(scheduler.interval_expression(count_repetition)))
+    ).all()
+
+    counts = np.arange(MAX_COUNT + 1)
+    assert sql_intervals == scheduler.interval_batch(counts).tolist()
+    assert sql_intervals == [scheduler.interval(int(count)) for count in counts]
+    assert max(sql_intervals) == MAXIMUM_INTERVAL_DAYS * ONE_DAY_IN_SECONDS
+
+
+@pytest.mark.parametrize(
+    "status, step",
+    [(RepetitionStatusEnum.SUCCESSFUL, 1), (RepetitionStatusEnum.UNSUCCESSFUL, -1)],
+)
+async def test_schedule_update_matches_update_repetition_schedule(session, status, step):
+    await session.execute(
+        text(
+            "INSERT INTO repetitions "
+            "(id, content_type, count_repetition, date_repetition, title, user_id) "
+            "SELECT 'r-' || n, 'BASE', n, :date_repetition, 'title ' || n, 'user' "
+            "FROM generate_series(0, :max_count) AS n"
+        ),
+        {"date_repetition": DATE_REPETITION, "max_count": MAX_COUNT},
+    )
+
+    rows = await session.execute(
+        SQLAlchemyReviewRepository._schedule_update(
+            step=step, reviewed_at=DATE_REPETITION
+        ).where(Repetition.user_id == "user")
+    )
+    updated = {id: (count, date) for id, count, date in rows}
+
+    expected = {}
+    for count in range(MAX_COUNT + 1):
+        repetition = Repetition(count_repetition=count, date_repetition=DATE_REPETITION)
+        repetition.update_repetition_schedule(status)
+        expected[f"r-{count}"] = (repetition.count_repetition, repetition.date_repetition)
+
+    assert updated == expected
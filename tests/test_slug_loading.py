@@ -0,0 +1,45 @@
+import orjson
+import pytest
+
+from app.application.serializers import repetition_serializer
+from app.domain.models import DateType, SlugLoadStrategyEnum
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyRepetitionRepository
+from tests.database import seed_repetitions
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("fields", [None, ["id", "content_type", "slugs"]])
+async def test_slug_strategies_encode_the_same_page(session, fields):
+    await seed_repetitions(await session.connection(), users=2, repetitions_per_user=30)
+    repository = SQLAlchemyRepetitionRepository(session=session)
+
+    pages = []
+    for slug_strategy in SlugLoadStrategyEnum:
+        repetitions = await repository.get_all_repetitions(
+            user_id="user-1",
+            start_date=DateType(1_700_000_000),
+            end_date=DateType(1_800_000_000),
+            limit=30,
+            offset=0,
+            fields=fields,
+            slug_strategy=slug_strategy,
+        )
+        pages.append(
+            orjson.loads(
+                repetition_serializer.dumps_page(
+                    repetitions, status=200, details="", fields=fields
+                )
+            )["model"]
+        )
+        session.expunge_all()
+
+    for page in pages:
+        for row in page:
+            row["slugs"].sort(key=lambda slug: slug["id"])
+
+    selectin_page, aggregate_page = pages
+    # Subtype rows are the ones which used to fail under the selectin strategy.
+    assert {row["content_type"] for row in selectin_page} == {"REPETITION", "WORD", "MD"}
+    assert all(len(row["slugs"]) == 2 for row in selectin_page)
+    assert selectin_page == aggregate_page
@@ -0,0 +1,174 @@
+import io
+
+import orjson
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import text
+
+from app.application.parsers import ImportFileFormatEnum, iter_import_rows
+from app.application.parsers import word_import
+from app.infrastucture.repositories.sqlalchemy import SQLAlchemyWordImportRepository
+
+pytestmark = pytest.mark.anyio
+
+BOM = "﻿".encode()
+
+CSV_DOCUMENT = (
+    "word,title,synonyms,slugs\n"
+    "привет,Привет 👋,здравствуй|салют,русский\n"
+    '"naïve","quoted, ""with"" comma",ingenuous,français\n'
+    "\n"
+    '"line\nbreak",multi-line title,break,misc\n'
+    "日本語,にほんご,和語,日本\n"
+)
+
+
+async def parse(
+    data: bytes,
+    file_format: ImportFileFormatEnum,
+    batch_size: int = 1000,
+) -> list[tuple[int, dict | str]]:
+    document = UploadFile(io.BytesIO(data), filename=f"words.{file_format.value}")
+    return [
+        (line, type(row).__name__ if isinstance(row, Exception) else row)
+        async for batch in iter_import_rows(document, file_format, batch_size)
+        for line, row in batch
+    ]
+
+
+async def test_csv_rows_keep_their_lines():
+    rows = await parse(CSV_DOCUMENT.encode(), ImportFileFormatEnum.CSV)
+
+    assert [line for line, _ in rows] == [2, 3, 5, 7]
+    assert rows[0][1] == {
+        "word": "привет",
+        "title": "Привет 👋",
+        "synonyms": "здравствуй|салют",
+        "slugs": "русский",
+    }
+    assert rows[1][1]["title"] == 'quoted, "with" comma'
+    assert rows[2][1]["word"] == "line\nbreak"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64])
+async def test_chunks_split_inside_characters_and_records(monkeypatch, chunk_size):
+    expected = await parse(CSV_DOCUMENT.encode(), ImportFileFormatEnum.CSV)
+    # Every size below four splits one of the multi-byte characters between two chunks.
+    monkeypatch.setattr(word_import, "READ_CHUNK_SIZE", chunk_size)
+
+    assert await parse(CSV_DOCUMENT.encode(), ImportFileFormatEnum.CSV) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 64 * 1024])
+async def test_bom_is_not_part_of_the_header(monkeypatch, chunk_size):
+    monkeypatch.setattr(word_import, "READ_CHUNK_SIZE", chunk_size)
+
+    rows = await parse(BOM + CSV_DOCUMENT.encode(), ImportFileFormatEnum.CSV)
+
+    assert rows == await parse(CSV_DOCUMENT.encode(), ImportFileFormatEnum.CSV)
+    assert "word" in rows[0][1]
+
+
+async def test_crlf_line_endings():
+    crlf = CSV_DOCUMENT.replace("\n", "\r\n").encode()
+
+    rows = await parse(crlf, ImportFileFormatEnum.CSV)
+
+    assert [line for line, _ in rows] == [2, 3, 5, 7]
+    assert rows[0][1]["slugs"] == "русский"
+    assert rows[3][1]["slugs"] == "日本"
+    # The line break inside a quoted field is kept as written.
+    assert rows[2][1]["word"] == "line\r\nbreak"
+
+
+async def test_document_without_final_line_break():
+    rows = await parse(CSV_DOCUMENT.rstrip("\n").encode(), ImportFileFormatEnum.CSV)
+
+    assert rows == await parse(CSV_DOCUMENT.encode(), ImportFileFormatEnum.CSV)
+
+
+async def test_unparsable_rows_are_reported_by_line():
+    jsonl = b"\n".join(
+        [
+            orjson.dumps({"word": "one"}),
+            b"{not json",
+            b"",
+            b"[1, 2]",
+            orjson.dumps({"word": "два"}),
+        ]
+    )
+    csv = "word,title\nok,fine\ntoo,many,columns\n".encode()
+
+    assert await parse(jsonl, ImportFileFormatEnum.JSONL) == [
+        (1, {"word": "one"}),
+        (2, "JSONDecodeError"),
+        (4, "ValueError"),
+        (5, {"word": "два"}),
+    ]
+    assert await parse(csv, ImportFileFormatEnum.CSV) == [
+        (2, {"word": "ok", "title": "fine"}),
+        (3, "ValueError"),
+    ]
+
+
+async def test_rows_are_batched():
+    jsonl = b"\n".join(orjson.dumps({"word": str(number)}) for number in range(7))
+    document = UploadFile(io.BytesIO(jsonl), filename="words.jsonl")
+
+    batches = [
+        [line for line, _ in batch]
+        async for batch in iter_import_rows(document, ImportFileFormatEnum.JSONL, 3)
+    ]
+
+    assert batches == [[1, 2, 3], [4, 5, 6], [7]]
+
+
+def word_row(word: str, **fields) -> dict:
+    return {
+        "word": word,
+        "title": f"title of {word}",
+        "translate": f"translation of {word}",
+        "synonyms": f"synonym of {word}",
+        "slugs": "imported",
+        **fields,
+    }
+
+
+async def test_import_reports_every_failed_row(session):
+    # The staging tables live until commit, so the existing word is inserted directly.
+    await session.execute(
+        text(
+            "INSERT INTO repetitions (id, content_type, date_repetition, title, user_id) "
+            "VALUES ('existing', 'WORD', 0, 'title of existing', 'user')"
+        )
+    )
+    await session.execute(
+        text("INSERT INTO word_repetitions (id, word) VALUES ('existing', 'existing')")
+    )
+    await session.execute(
+        text("INSERT INTO repetition_titles (title) VALUES ('title of existing')")
+    )
+    repository = SQLAlchemyWordImportRepository(session=session)
+
+    report = await repository.import_word_repetitions(
+        user_id="user",
+        rows=[
+            (1, word_row("first")),
+            (2, ValueError("Expected 5 columns, got 3.")),
+            (3, word_row("missing slugs", slugs="")),
+            (4, word_row("unknown language", language="XX")),
+            (5, word_row("first", title="another title")),
+            (6, word_row("second", title="title of existing")),
+            (7, word_row("third")),
+        ],
+    )
+
+    assert report.imported == 2
+    assert sorted(error.line for error in report.errors) == [2, 3, 4, 5, 6]
+    assert next(error for error in report.errors if error.line == 2).message == (
+        "Expected 5 columns, got 3."
+    )
+    words = await session.scalars(
+        text("SELECT word FROM word_repetitions ORDER BY word")
+    )
+    assert words.all() == ["existing", "first", "third"]